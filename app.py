@@ -1,8 +1,6 @@
 import os
 import streamlit as st
 from dotenv import load_dotenv
-import requests
-import re
 import emoji
 import csv
 import io
@@ -10,18 +8,43 @@ from datetime import datetime
 
 # Import the combined translation enhancements
 from translation_enhancements import (
-    enhanced_preprocess_input_for_completeness,
-    enhanced_postprocess_translation_output, 
-    get_enhanced_chatgpt_prompt_with_training,
     analyze_enhanced_translation_quality,
-    clean_instruction_leaks_from_result,
+    build_message_context,
+    start_rule_pack_watcher,
     get_enhancement_info
 )
+from translation_pipeline import (
+    translate_text_with_hints,
+    submit_chatgpt_review,
+    get_streaming_stats,
+    CHATGPT_STREAMING,
+    iter_translate_targets,
+    should_run_chatgpt_qa,
+    get_qa_gate_stats,
+    QA_SKIPPED_STATUS,
+    QA_PENDING_STATUS,
+    configure_api_keys,
+    get_language_specific_settings
+)
+from vendor_clients import PREWARM_ON_START, get_circuit_breaker_states, get_vendor_metrics, prewarm_vendor_clients
+from translation_cache import CHATGPT_STAGE, SARVAM_STAGE, translation_cache
+from translation_memory import translation_memory
+
+# Pick up edits to rules/ and preserve_words.txt without a restart
+start_rule_pack_watcher()
+
+# Open the Sarvam/OpenAI connections once per process, before the first translation
+if PREWARM_ON_START:
+    prewarm_vendor_clients()
 
 # Load environment variables
 load_dotenv()
 API_KEY = os.getenv("SARVAM_API_KEY", st.secrets.get("SARVAM_API_KEY", ""))
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", st.secrets.get("OPENAI_API_KEY", ""))
+configure_api_keys(API_KEY, OPENAI_API_KEY)
+
+# How long each run waits on a background ChatGPT review before redrawing the page
+QA_POLL_SECONDS = 0.5
 
 st.set_page_config(page_title="FRND Quality Translator", layout="wide")
 
@@ -31,20 +54,42 @@ def get_csv_filename():
     """Get the CSV filename for logging translations"""
     return "translation_logs.csv"
 
+CSV_HEADERS = ["Input Language", "Output Language", "Input Text", "Output Text", "Timestamp", "Mode", "ChatGPT Status"]
+
 def initialize_csv_file():
     """Initialize CSV file with headers if it doesn't exist"""
     filename = get_csv_filename()
     
     if not os.path.exists(filename):
-        headers = ["Input Language", "Output Language", "Input Text", "Output Text", "Timestamp"]
         with open(filename, 'w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
-            writer.writerow(headers)
+            writer.writerow(CSV_HEADERS)
         return True
+    upgrade_csv_file(filename)
     return False
 
-def log_translation_to_csv(input_lang, output_lang, input_text, output_text):
-    """Log translation to CSV file with timestamp"""
+def upgrade_csv_file(filename):
+    """Give a log written before the Mode/ChatGPT Status columns the current header, padding its old rows with blanks"""
+    # Only the header is read unless the file needs the upgrade
+    with open(filename, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        headers = next(reader, None)
+        if headers is None or len(headers) >= len(CSV_HEADERS):
+            return False
+        rows = list(reader)
+    
+    # Written next to the log and swapped in, so a failed write never leaves half a file
+    upgraded = filename + ".upgrade"
+    with open(upgraded, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADERS)
+        for row in rows:
+            writer.writerow(row + [""] * (len(CSV_HEADERS) - len(row)))
+    os.replace(upgraded, filename)
+    return True
+
+def log_translation_to_csv(input_lang, output_lang, input_text, output_text, mode="", status=""):
+    """Log translation to CSV file with timestamp, mode and ChatGPT status"""
     try:
         filename = get_csv_filename()
         initialize_csv_file()
@@ -57,7 +102,7 @@ def log_translation_to_csv(input_lang, output_lang, input_text, output_text):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Prepare new row with timestamp
-        new_row = [input_lang, output_lang, input_text_safe, output_text_safe, timestamp]
+        new_row = [input_lang, output_lang, input_text_safe, output_text_safe, timestamp, mode, status]
         
         # Append to CSV
         with open(filename, 'a', newline='', encoding='utf-8') as file:
@@ -69,6 +114,18 @@ def log_translation_to_csv(input_lang, output_lang, input_text, output_text):
     except Exception as e:
         return False, str(e)
 
+def build_multi_target_csv(multi_results):
+    """One CSV with every language's translation from a multi-language run"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["Language", "Sarvam Translation", "Final Translation", "ChatGPT Status", "Confidence"])
+    for row in multi_results:
+        writer.writerow([
+            row["language"], row["sarvam_translation"], row["final_translation"],
+            row["gpt_status"], f"{row['confidence']:.0%}"
+        ])
+    return output.getvalue()
+
 def get_monthly_csv_data():
     """Get translations from current month only"""
     try:
@@ -86,9 +143,13 @@ def get_monthly_csv_data():
             reader = csv.reader(file)
             headers = next(reader)  # Get header row
             
-            # Ensure headers include timestamp
+            # Ensure headers include timestamp and mode
             if len(headers) < 5:
                 headers.append("Timestamp")
+            if len(headers) < 6:
+                headers.append("Mode")
+            if len(headers) < 7:
+                headers.append("ChatGPT Status")
             
             monthly_data.append(headers)
             
@@ -120,6 +181,31 @@ def get_monthly_csv_data():
     except Exception as e:
         return None, f"Error reading CSV: {str(e)}"
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def read_log_downloads(filename, modified_ns, size, month):
+    """The whole log's bytes and this month's rows as CSV text (or None and why), read once per version of the file
+    
+    The page reruns every QA_POLL_SECONDS while a background review is pending; the log only
+    changes when a translation is logged, so those reruns reuse this instead of re-reading it.
+    """
+    with open(filename, "rb") as file:
+        all_logs = file.read()
+    monthly_data, error = get_monthly_csv_data()
+    if not monthly_data:
+        return all_logs, None, error
+    output = io.StringIO()
+    csv.writer(output).writerows(monthly_data)
+    return all_logs, output.getvalue(), None
+
+def get_log_downloads():
+    """(all logs bytes or None, this month's CSV text or None, error) for the download buttons"""
+    filename = get_csv_filename()
+    try:
+        stat = os.stat(filename)
+        return read_log_downloads(filename, stat.st_mtime_ns, stat.st_size, datetime.now().strftime("%Y-%m"))
+    except OSError as e:
+        return None, None, f"Error reading CSV: {str(e)}"
+
 # -------------------- CONFIG -------------------- #
 
 LANG_MAP = {
@@ -128,16 +214,6 @@ LANG_MAP = {
     "English": "en-IN"
 }
 
-# Language-specific script and code-mixing preferences
-LANGUAGE_PATTERNS = {
-    "hi-IN": {"script": "roman", "mode": "code-mixed"},
-    "te-IN": {"script": "roman", "mode": "code-mixed"},
-    "ta-IN": {"script": "mixed", "mode": "modern-colloquial"},
-    "ml-IN": {"script": "fully-native", "mode": "formal"},
-    "kn-IN": {"script": "fully-native", "mode": "formal"},
-    "or-IN": {"script": "mixed", "mode": "modern-colloquial"}
-}
-
 # Enhanced mode options
 MODE_OPTIONS = {
     "Modern & Casual (Default)": "modern-colloquial",
@@ -163,281 +239,29 @@ AUDIENCE_TYPES = {
     "Business Professionals": "formal, professional terminology"
 }
 
-# Load preserved words
-try:
-    with open("preserve_words.txt", "r") as f:
-        PRESERVE_WORDS = [line.strip() for line in f if line.strip()]
-except FileNotFoundError:
-    PRESERVE_WORDS = []
+# Default languages for multi-language campaign translation
+CAMPAIGN_LANGUAGES = ["Hindi", "Tamil", "Telugu", "Malayalam", "Kannada", "Odia"]
 
-# -------------------- HELPER FUNCTIONS -------------------- #
-
-def get_language_specific_settings(target_lang):
-    """Get optimized settings for each language"""
-    if target_lang in LANGUAGE_PATTERNS:
-        return LANGUAGE_PATTERNS[target_lang]
-    else:
-        return {"script": "roman", "mode": "modern-colloquial"}
-
-def tag_preserved_words(text):
-    """Tag preserved words for API"""
-    for word in PRESERVE_WORDS:
-        text = re.sub(f"\\b{re.escape(word)}\\b", f"[[[{word}]]]", text, flags=re.IGNORECASE)
-    return text
-
-def untag_preserved_words(text):
-    """Remove tags from preserved words"""
-    return re.sub(r"\[\[\[(.*?)\]\]\]", r"\1", text)
-
-def prepare_multiline_input(text):
-    """Prepare multiline text for API"""
-    lines = text.strip().split("\n")
-    line_separator = " <LINEBREAK> "
-    processed_lines = []
-    for line in lines:
-        if line.strip():
-            processed_lines.append(line.strip())
-    return line_separator.join(processed_lines)
-
-def restore_multiline_output(translated_text, original_text):
-    """Restore line breaks in output"""
-    original_lines = [line.strip() for line in original_text.strip().split("\n") if line.strip()]
-    line_separator = " <LINEBREAK> "
-    
-    # First try our separator
-    if line_separator in translated_text:
-        translated_lines = translated_text.split(line_separator)
-        return "\n".join(translated_lines)
-    
-    # If that fails, try to detect natural breaking points
-    elif len(original_lines) > 1:
-        sentence_patterns = [
-            r'(?<=[.।!?❌])\s+(?=[🚫🚨🔗📱📲✅💙—•])',
-            r'(?<=[🚫])\s+(?=[A-Z])', r'(?<=[💙])\s+(?=[—])',
-            r'(?<=hai\.)\s+(?=[🚨])', r'(?<=hain\.)\s+(?=[A-Z🚨])',
-            r'(?<=[📱📲])\s+(?=[✅])', r'(?<=hai\.)\s+(?=[A-Z])',
-        ]
-        
-        for pattern in sentence_patterns:
-            potential_lines = re.split(pattern, translated_text.strip())
-            if len(potential_lines) >= 2:
-                return "\n".join(potential_lines)
-        
-        # Fallback: Split by emojis
-        emoji_break_pattern = r'(?<=[.।!?])\s+(?=[🚫🚨✅💙—])'
-        lines = re.split(emoji_break_pattern, translated_text.strip())
-        if len(lines) > 1:
-            return "\n".join(lines)
-    
-    return translated_text
-
-def fix_brand_name_issues(text, target_lang):
-    """Fix brand name formatting issues"""
-    fixes = {
-        r"\[\[\[+([^\[\]]*)\]\]\]+": r"\1", r"\[\[+([^\[\]]*)\]\]+": r"\1", r"\[+([^\[\]]*)\]+": r"\1",
-        r"\{\{\{+([^\{\}]*)\}\}\}+": r"\1", r"\{\{+([^\{\}]*)\}\}+": r"\1", r"\{+([^\{\}]*)\}+": r"\1",
-        r"FRND\}+\]+": "FRND", r"Team\s*FRND\}+\]+": "Team FRND", r"\}+\]+": "",
-        r"^\]+,?\s*": "", r"\]+,\s*": "", r"\]+\s*": "", r"^\s*,\s*": "",
-    }
-    
-    for pattern, replacement in fixes.items():
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE | re.MULTILINE)
-    
-    return text
-
-def fix_formatting_issues(text, target_lang):
-    """Fix unnecessary spacing and cleanup"""
-    instruction_patterns = [
-        r'\[translate from:.*?\]\s*', r'\[.*?translate.*?from.*?\]\s*', r'^\[.*?\]\s*',
-        r'\[INST.*?\]\s*', r'\[INSTRUCTION.*?\]\s*',
-    ]
-    
-    for pattern in instruction_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
-    
-    # Clean remaining bracket artifacts
-    bracket_artifacts = [r'^\]+,?\s*', r'\]+,\s*', r'\]+\s*', r'^\s*,\s*', r',\s*,\s*']
-    
-    for pattern in bracket_artifacts:
-        text = re.sub(pattern, '', text, flags=re.MULTILINE)
-    
-    # General formatting cleanup
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
-
-def enhance_catchy_phrases(text, target_lang):
-    """Improve translation of catchy/marketing phrases"""
-    catchy_phrases = {
-        "What is the scene": {
-            "hi-IN": "Scene kya hai", "ta-IN": "Scene என்னங்க", "te-IN": "Scene entante",
-            "ml-IN": "എന്താണ് scene", "kn-IN": "Scene ಏನು"
-        },
-        "Take the first step": {
-            "hi-IN": "Pehla step lo", "ta-IN": "First step எடுங்க", "te-IN": "Modati step teeskondi",
-            "ml-IN": "ആദ്യ step എടുക്കൂ", "kn-IN": "ಮೊದಲ step ತೆಗೆದುಕೊಳ್ಳಿ"
-        },
-        "lighthearted call": {
-            "hi-IN": "casual call", "ta-IN": "lighthearted-ஆ call", "te-IN": "casual ga call",
-            "ml-IN": "സുഖമായി call", "kn-IN": "ಸುಲಭವಾಗಿ call"
-        }
-    }
-    
-    for phrase, translations in catchy_phrases.items():
-        if phrase.lower() in text.lower() and target_lang in translations:
-            text = re.sub(re.escape(phrase), translations[target_lang], text, flags=re.IGNORECASE)
-    
-    return text
-
-# -------------------- MAIN TRANSLATION FUNCTION -------------------- #
-
-def translate_text(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3):
-    """Enhanced translate function using the combined training patterns"""
-    
-    # Get language-specific settings
-    lang_pattern = get_language_specific_settings(target_lang)
-    
-    # Override mode based on language pattern
-    if mode == "modern-colloquial":
-        mode = lang_pattern["mode"]
-    
-    # ENHANCED INPUT PREPROCESSING WITH ALL 3 TRAINING LAYERS
-    enhanced_text = enhanced_preprocess_input_for_completeness(text, target_lang)
-    
-    # Apply basic catchy phrase enhancements
-    enhanced_text = enhance_catchy_phrases(enhanced_text, target_lang)
-    
-    # Prepare for API
-    prepared_input = prepare_multiline_input(enhanced_text)
-    tagged_input = tag_preserved_words(prepared_input)
-
-    payload = {
-        "input": tagged_input,
-        "source_language_code": source_lang,
-        "target_language_code": target_lang,
-        "mode": mode,
-        "speaker_gender": gender,
-        "enable_preprocessing": True,
-        "numerals_format": "international"
-    }
-
-    # Set script based on language pattern
-    if lang_pattern["script"] == "roman":
-        payload["output_script"] = "roman"
-    elif lang_pattern["script"] == "fully-native":
-        payload["output_script"] = "fully-native"
-
-    headers = {
-        "Content-Type": "application/json",
-        "API-Subscription-key": API_KEY
-    }
-
-    response = requests.post("https://api.sarvam.ai/translate", json=payload, headers=headers)
-
-    if response.status_code == 200:
-        result_raw = response.json().get("translated_text", "")
-        result = untag_preserved_words(result_raw)
-        result = restore_multiline_output(result, text)
-        
-        # Clean leaked instructions using enhanced function
-        result = clean_instruction_leaks_from_result(result)
-        
-        # Apply basic fixes
-        result = fix_brand_name_issues(result, target_lang)
-        result = fix_formatting_issues(result, target_lang)
-        
-        # ENHANCED OUTPUT POST-PROCESSING WITH ALL 3 TRAINING LAYERS
-        result = enhanced_postprocess_translation_output(result, target_lang)
-        
-        return result
-    else:
-        return f"❌ Error: {response.status_code} - {response.text}"
+@st.cache_resource(show_spinner=False)
+def prepare_csv_log(filename):
+    """Once per process: upgrade an old log's header, then seed the translation memory from it
 
-# -------------------- ENHANCED CHATGPT QUALITY CHECKER -------------------- #
+    Logged translations ChatGPT reviewed are the approved ones. Returns the upgrade error, if any.
+    """
+    error = None
+    try:
+        if os.path.exists(filename):
+            upgrade_csv_file(filename)
+    except (OSError, csv.Error) as e:
+        error = str(e)
+    translation_memory.load_logs(filename, LANG_MAP)
+    return error
 
-def chatgpt_quality_check_and_improve(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level):
-    """Enhanced ChatGPT quality checker using combined training patterns"""
-    
-    if not OPENAI_API_KEY or not sarvam_translation or sarvam_translation.startswith("❌"):
-        return sarvam_translation, "No ChatGPT API key or invalid Sarvam translation"
-    
-    # Pre-clean obvious issues
-    cleaned_sarvam = fix_brand_name_issues(sarvam_translation, target_lang)
-    cleaned_sarvam = fix_formatting_issues(cleaned_sarvam, target_lang)
-    
-    # Get enhanced prompt with all training examples
-    prompt = get_enhanced_chatgpt_prompt_with_training(
-        original_text, cleaned_sarvam, target_lang, mode, context_type, audience, formality_level
-    )
+csv_upgrade_error = prepare_csv_log(get_csv_filename())
+if csv_upgrade_error:
+    st.warning(f"Could not upgrade the CSV log header: {csv_upgrade_error}")
 
-    try:
-        headers = {
-            "Authorization": f"Bearer {OPENAI_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "gpt-3.5-turbo",
-            "messages": [
-                {"role": "system", "content": "You are a translation editor with access to comprehensive training examples. Follow ALL training patterns exactly. Return ONLY the corrected translation text with no explanations or comments."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 1000,
-            "temperature": 0.1
-        }
-        
-        response = requests.post("https://api.openai.com/v1/chat/completions", 
-                               headers=headers, 
-                               json=payload, 
-                               timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if "choices" in result and len(result["choices"]) > 0:
-                improved_translation = result["choices"][0]["message"]["content"].strip()
-                
-                # Aggressive cleaning of ChatGPT meta-responses
-                meta_patterns = [
-                    r'^(CORRECTED TRANSLATION|IMPROVED TRANSLATION|FIXED TRANSLATION|Translation|Final Translation|Here is the corrected translation|The corrected translation is):\s*',
-                    r'The.*?translation.*?is.*?already.*?good.*?\.',
-                    r'No improvements.*?needed.*?\.',
-                    r'The Sarvam translation.*?is.*?already.*?\.',
-                    r'This translation.*?meets.*?requirements.*?\.',
-                ]
-                
-                for pattern in meta_patterns:
-                    improved_translation = re.sub(pattern, '', improved_translation, flags=re.IGNORECASE | re.DOTALL)
-                
-                improved_translation = improved_translation.strip()
-                
-                # If ChatGPT returned explanatory text instead of translation, use cleaned Sarvam
-                explanatory_phrases = [
-                    "already in line with", "no improvements needed", "meets the requirements",
-                    "is already good", "no changes required", "translation provided is"
-                ]
-                
-                if any(phrase.lower() in improved_translation.lower() for phrase in explanatory_phrases):
-                    improved_translation = cleaned_sarvam
-                
-                # Final cleanup using enhanced functions
-                improved_translation = clean_instruction_leaks_from_result(improved_translation)
-                improved_translation = fix_brand_name_issues(improved_translation, target_lang)
-                improved_translation = fix_formatting_issues(improved_translation, target_lang)
-                improved_translation = enhanced_postprocess_translation_output(improved_translation, target_lang)
-                
-                return improved_translation, None
-            else:
-                return cleaned_sarvam, "No response from ChatGPT"
-        else:
-            return cleaned_sarvam, f"ChatGPT API Error: {response.status_code}"
-            
-    except requests.exceptions.Timeout:
-        return cleaned_sarvam, "ChatGPT timeout - using cleaned Sarvam translation"
-    except requests.exceptions.ConnectionError:
-        return cleaned_sarvam, "Connection error - using cleaned Sarvam translation"
-    except Exception as e:
-        return cleaned_sarvam, f"ChatGPT error: {str(e)}"
+# -------------------- HELPER FUNCTIONS -------------------- #
 
 def check_cultural_sensitivity(text, target_lang):
     """Check for potentially sensitive content"""
@@ -455,6 +279,110 @@ def check_cultural_sensitivity(text, target_lang):
     
     return warnings
 
+def show_pipeline_stats():
+    """Cache and vendor retry counters since the app process started"""
+    cache_stats = translation_cache.stats()
+    cache_summary = []
+    for stage, label in [(SARVAM_STAGE, "Sarvam"), (CHATGPT_STAGE, "ChatGPT")]:
+        counts = cache_stats.get(stage, {})
+        hits = counts.get("memory_hits", 0) + counts.get("disk_hits", 0)
+        cache_summary.append(f"{label}: {hits} hits / {counts.get('misses', 0)} misses / {counts.get('bypassed', 0)} bypassed")
+    st.caption("🗄️ Cache — " + " • ".join(cache_summary))
+    
+    # Retries and rate limiting per vendor
+    vendor_summary = []
+    for vendor, metrics in get_vendor_metrics().items():
+        summary = (
+            f"{vendor}: {metrics['requests']} requests / {metrics['retries']} retries "
+            f"({metrics['retry_wait_seconds']:.1f}s backoff, {metrics['rate_limit_wait_seconds']:.1f}s rate-limited)"
+        )
+        # Hedged requests (SARVAM_HEDGING): duplicates sent for slow responses, and how many of them won
+        if metrics.get("hedging", {}).get("hedged"):
+            summary += f" / {metrics['hedging']['hedged']} hedged ({metrics['hedging']['hedge_wins']} won)"
+        vendor_summary.append(summary)
+    st.caption("🔁 Vendors — " + " • ".join(vendor_summary))
+    
+    # Lines answered from approved translations instead of the vendors
+    memory_stats = translation_memory.stats()
+    calls_saved = memory_stats["calls_saved"]
+    st.caption(
+        f"🧠 Translation memory — {memory_stats['segments']} segments • {memory_stats['hit_rate']:.0%} hit rate "
+        f"({memory_stats['exact_hits']} exact / {memory_stats['misses']} misses, {memory_stats['suggestions']} review suggestions) • "
+        f"calls saved: Sarvam {calls_saved.get(SARVAM_STAGE, 0)}, ChatGPT {calls_saved.get(CHATGPT_STAGE, 0)}"
+    )
+    if memory_stats["unknown_status_rows"]:
+        st.caption(
+            f"🧠 {memory_stats['unknown_status_rows']} older log rows were not added to the memory: they were logged "
+            "before the ChatGPT Status column, so a reviewed translation cannot be told from a Sarvam fallback"
+        )
+    
+    # How often the confidence gate let a translation through without a ChatGPT review
+    gate_stats = get_qa_gate_stats()
+    gate_reasons = gate_stats["by_reason"]
+    st.caption(
+        f"🚦 QA gate — {gate_stats['skipped']} skipped / {gate_stats['executed']} reviewed "
+        f"({gate_reasons.get('executed_flags', 0)} flagged, {gate_reasons.get('executed_low_confidence', 0)} low confidence, "
+        f"{gate_reasons.get('executed_always', 0)} always-review Message Type)"
+    )
+    
+    # Streamed ChatGPT reviews: how soon the first words showed up vs the whole reply
+    streaming_stats = get_streaming_stats()
+    if streaming_stats["streams"]:
+        st.caption(
+            f"⚡ Streaming — {streaming_stats['streams']} reviews • first output after "
+            f"{streaming_stats['avg_first_output_seconds']:.2f}s, complete after {streaming_stats['avg_total_seconds']:.2f}s (avg)"
+        )
+
+def request_translation(bypass_cache=False):
+    """Translate/Retranslate button callback"""
+    if bypass_cache:
+        st.session_state.retranslate_requested = True
+    else:
+        st.session_state.translate_requested = True
+
+def complete_single_translation(final_translation, gpt_error, gpt_status):
+    """Store the single-language result, and log it once no review is pending"""
+    state = st.session_state
+    state.final_translation = final_translation
+    state.gpt_status = gpt_status
+    state.gpt_error = gpt_error
+    
+    # Calculate final confidence using enhanced analysis (reuse the first one if nothing changed)
+    if final_translation == state.sarvam_translation:
+        state.final_quality_flags, state.final_confidence = state.initial_quality_flags, state.initial_confidence
+    else:
+        state.final_quality_flags, state.final_confidence = analyze_enhanced_translation_quality(
+            state.original_text.strip(), final_translation, LANG_MAP[state.source_lang],
+            LANG_MAP[state.target_lang_ui], state.message_context
+        )
+    
+    # Log translation to CSV
+    if gpt_status != QA_PENDING_STATUS and not final_translation.startswith("❌"):
+        log_success, log_error = log_translation_to_csv(
+            state.source_lang, state.target_lang_ui, state.original_text.strip(), final_translation, state.selected_mode, gpt_status
+        )
+        # Only reviewed output is approved; fallbacks, skipped and disabled reviews stay out of the memory
+        if gpt_status == "Enhanced":
+            translation_memory.add_translation(state.original_text.strip(), final_translation, LANG_MAP[state.target_lang_ui], state.selected_mode)
+        # Shown with the result: a background review completes right before st.rerun(), which would drop a warning drawn here
+        if not log_success:
+            state.csv_log_error = log_error
+
+def show_multi_target_result(row):
+    """One language's result in the multi-language view"""
+    with st.expander(f"{row['language']} — {row['confidence']:.0%} confidence", expanded=True):
+        st.text_area(f"{row['language']} Output:", value=row["final_translation"], height=100, key=f"multi_output_{row['target_lang']}")
+        if row["gpt_status"] == "Enhanced":
+            st.caption("🤖 ChatGPT Enhanced ✅")
+        elif row["gpt_status"] == "Disabled":
+            st.caption("🤖 ChatGPT Disabled")
+        elif row["gpt_status"] == QA_SKIPPED_STATUS:
+            st.caption("🤖 ChatGPT Skipped ⏭️ (Sarvam passed all checks)")
+        else:
+            st.caption(f"🤖 {row['gpt_status']}")
+        for flag in row["quality_flags"]:
+            st.info(flag)
+
 # -------------------- STREAMLIT UI -------------------- #
 
 st.title("🎯 FRND Enhanced Translator with AI Quality Check")
@@ -530,72 +458,147 @@ with col2:
     enable_chatgpt_qa = st.checkbox("🤖 Enable ChatGPT Quality Enhancement", 
                                    value=True,
                                    help="Use ChatGPT to review and improve Sarvam translation with training examples")
+    stream_chatgpt = st.checkbox("⚡ Show ChatGPT output as it is written",
+                                 value=CHATGPT_STREAMING,
+                                 disabled=not enable_chatgpt_qa,
+                                 help="Streams the review into the page; the final cleanup runs once it completes")
     
     col_gender, col_mode = st.columns(2)
     with col_gender:
         gender = st.selectbox("Gender:", ["Male", "Female"])
     with col_mode:
         mode_ui = st.selectbox("Style:", list(MODE_OPTIONS.keys()), index=3)
-
-# Translate button
-if st.button("🔄 Translate with Enhanced AI Quality", type="primary", use_container_width=True):
+    
+    # Multi-language mode: every selected language at once instead of the "To:" language
+    multi_target = st.checkbox("🌐 Translate into multiple languages at once",
+                               value=False,
+                               help="All selected languages run in parallel; each language's ChatGPT review starts as soon as its Sarvam translation arrives")
+    multi_target_uis = []
+    if multi_target:
+        multi_target_uis = st.multiselect("Target Languages:", [name for name in LANG_MAP if name != "English"],
+                                          default=CAMPAIGN_LANGUAGES)
+
+# Translate button ("Retranslate" below re-runs this with the cache bypassed).
+# Clicks are taken from on_click callbacks, which fire once per click: st.rerun()
+# (used while a background review finishes) keeps a clicked button's value True.
+st.button("🔄 Translate with Enhanced AI Quality", type="primary", use_container_width=True,
+          on_click=request_translation)
+translate_clicked = st.session_state.pop("translate_requested", False)
+bypass_cache = st.session_state.pop("retranslate_requested", False)
+if translate_clicked or bypass_cache:
+    # A new translation replaces a review still running for the previous one
+    previous_review = st.session_state.pop("qa_review", None)
+    if previous_review is not None:
+        previous_review.cancel()
+    st.session_state.pop("csv_log_error", None)
     if not text.strip():
         st.warning("Please enter text to translate.")
+    elif multi_target and not multi_target_uis:
+        st.warning("Please pick at least one target language.")
+    elif multi_target:
+        src = LANG_MAP[source_ui]
+        selected_mode = MODE_OPTIONS[mode_ui]
+        targets = {LANG_MAP[name]: name for name in multi_target_uis}
+        message_context = build_message_context(text.strip(), context_type)
+        
+        # Results appear here as each language completes, fastest first
+        progress = st.empty()
+        multi_results = []
+        progress.info(f"Translating into {len(targets)} languages in parallel...")
+        for result in iter_translate_targets(
+            text.strip(), src, list(targets), gender, selected_mode,
+            context_type, audience, formality_level, enable_chatgpt_qa, bypass_cache
+        ):
+            quality_flags, confidence = analyze_enhanced_translation_quality(
+                text.strip(), result.final_translation, src, result.target_lang, message_context
+            )
+            multi_results.append({
+                "language": targets[result.target_lang], "target_lang": result.target_lang,
+                "sarvam_translation": result.sarvam_translation, "final_translation": result.final_translation,
+                "gpt_status": result.gpt_status, "confidence": confidence, "quality_flags": quality_flags
+            })
+            progress.success("\n\n".join(
+                f"✅ {row['language']} ({row['confidence']:.0%}): {row['final_translation'][:120]}" for row in multi_results
+            ))
+            
+            if not result.final_translation.startswith("❌"):
+                log_success, log_error = log_translation_to_csv(
+                    source_ui, targets[result.target_lang], text.strip(), result.final_translation, selected_mode, result.gpt_status
+                )
+                if result.gpt_status == "Enhanced":
+                    translation_memory.add_translation(text.strip(), result.final_translation, result.target_lang, selected_mode)
+                if not log_success:
+                    st.warning(f"Failed to log to CSV: {log_error}")
+        progress.empty()
+        
+        # Store results in the order the languages were picked
+        order = list(targets)
+        multi_results.sort(key=lambda row: order.index(row["target_lang"]))
+        st.session_state.multi_results = multi_results
+        st.session_state.original_text = text
+        st.session_state.source_lang = source_ui
+        st.session_state.pop("final_translation", None)
     else:
         with st.spinner("Step 1/2: Getting enhanced Sarvam translation..."):
             src = LANG_MAP[source_ui]
             tgt = LANG_MAP[target_ui]
             selected_mode = MODE_OPTIONS[mode_ui]
             
+            # Detect message context once (or take the Message Type picked above)
+            message_context = build_message_context(text.strip(), context_type)
+            
             # Get Sarvam translation with enhanced training
-            sarvam_result = translate_text(
+            sarvam_result, context_hints = translate_text_with_hints(
                 text.strip(), src, tgt, gender, selected_mode,
-                context_type, audience, formality_level
+                context_type, audience, formality_level, message_context, bypass_cache
             )
             
             # Calculate initial confidence using enhanced analysis
             initial_quality_flags, initial_confidence = analyze_enhanced_translation_quality(
-                text.strip(), sarvam_result, src, tgt
-            )
-        
-        # ChatGPT Quality Enhancement
-        final_translation = sarvam_result
-        gpt_error = None
-        gpt_status = "Disabled"
-        
-        if enable_chatgpt_qa and not sarvam_result.startswith("❌"):
-            with st.spinner("Step 2/2: ChatGPT quality enhancement with training examples..."):
-                final_translation, gpt_error = chatgpt_quality_check_and_improve(
-                    text.strip(), sarvam_result, tgt, selected_mode, 
-                    context_type, audience, formality_level
-                )
-                gpt_status = "Enhanced" if not gpt_error else f"Error: {gpt_error}"
-        
-        # Calculate final confidence using enhanced analysis
-        final_quality_flags, final_confidence = analyze_enhanced_translation_quality(
-            text.strip(), final_translation, src, tgt
-        )
-        
-        # Log translation to CSV
-        if not final_translation.startswith("❌"):
-            log_success, log_error = log_translation_to_csv(
-                source_ui, target_ui, text.strip(), final_translation
+                text.strip(), sarvam_result, src, tgt, message_context
             )
-            if not log_success:
-                st.warning(f"Failed to log to CSV: {log_error}")
         
-        # Store results
+        # Store results (the final ones are filled in by complete_single_translation)
         st.session_state.sarvam_translation = sarvam_result
-        st.session_state.final_translation = final_translation
-        st.session_state.gpt_status = gpt_status
-        st.session_state.gpt_error = gpt_error
         st.session_state.original_text = text
         st.session_state.source_lang = source_ui
         st.session_state.target_lang_ui = target_ui
+        st.session_state.selected_mode = selected_mode
+        st.session_state.message_context = message_context
         st.session_state.initial_confidence = initial_confidence
-        st.session_state.final_confidence = final_confidence
         st.session_state.initial_quality_flags = initial_quality_flags
-        st.session_state.final_quality_flags = final_quality_flags
+        st.session_state.pop("multi_results", None)
+        
+        # ChatGPT Quality Enhancement runs in the background; the Sarvam result shows meanwhile
+        gpt_status = "Disabled"
+        if enable_chatgpt_qa and not sarvam_result.startswith("❌"):
+            # Skip the review when the Sarvam output already passed every check
+            if not should_run_chatgpt_qa(initial_confidence, initial_quality_flags, context_type, message_context):
+                gpt_status = QA_SKIPPED_STATUS
+            else:
+                st.session_state.qa_review = submit_chatgpt_review(
+                    text.strip(), sarvam_result, tgt, selected_mode,
+                    context_type, audience, formality_level, context_hints, bypass_cache, message_context,
+                    stream=stream_chatgpt
+                )
+                gpt_status = QA_PENDING_STATUS
+        complete_single_translation(sarvam_result, None, gpt_status)
+
+# Display multi-language results
+if 'multi_results' in st.session_state:
+    st.divider()
+    st.subheader("🌐 Multi-Language Results")
+    show_pipeline_stats()
+    
+    for row in st.session_state.multi_results:
+        show_multi_target_result(row)
+    
+    col_multi1, col_multi2 = st.columns(2)
+    with col_multi1:
+        st.download_button("📥 Download All Languages (CSV)", build_multi_target_csv(st.session_state.multi_results),
+            file_name="translations_all_languages.csv", mime="text/csv")
+    with col_multi2:
+        st.button("🔄 Retranslate", key="multi_retranslate", on_click=request_translation, args=(True,))
 
 # Display results
 if 'final_translation' in st.session_state:
@@ -612,6 +615,10 @@ if 'final_translation' in st.session_state:
             st.success("**Step 2**: ChatGPT Enhanced ✅")
         elif gpt_status == "Disabled":
             st.warning("**Step 2**: ChatGPT Disabled")
+        elif gpt_status == QA_SKIPPED_STATUS:
+            st.success("**Step 2**: ChatGPT Skipped ⏭️ (Sarvam passed all checks)")
+        elif gpt_status == QA_PENDING_STATUS:
+            st.info("**Step 2**: ChatGPT reviewing... ⏳")
         else:
             st.error(f"**Step 2**: {gpt_status}")
     with col_process3:
@@ -623,6 +630,8 @@ if 'final_translation' in st.session_state:
         else:
             st.error("**Quality**: Needs Review ⚠️")
     
+    show_pipeline_stats()
+    
     # Show translations
     if st.session_state.get('gpt_status') == "Enhanced":
         # Show before/after comparison
@@ -654,10 +663,18 @@ if 'final_translation' in st.session_state:
         st.markdown("### 🎯 Final Translation")
         st.text_area("Translation Result:", value=st.session_state.final_translation, height=150, key="translation_output")
         
+        # The review's streamed reply so far, until the cleaned result replaces the translation above
+        review = st.session_state.get("qa_review")
+        if review is not None and review.text_so_far:
+            st.info(f"✍️ ChatGPT is writing...\n\n{review.text_so_far}")
+        
         # Show any ChatGPT errors
         if st.session_state.get('gpt_error'):
             st.warning(f"ChatGPT Quality Check: {st.session_state.gpt_error}")
     
+    if st.session_state.get('csv_log_error'):
+        st.warning(f"Failed to log to CSV: {st.session_state.csv_log_error}")
+    
     # Enhanced Quality Analysis
     if not st.session_state.final_translation.startswith("❌"):
         st.subheader("📊 Enhanced Quality Assessment")
@@ -693,23 +710,16 @@ if 'final_translation' in st.session_state:
     with col_btn1:
         st.download_button("📥 Download Translation", st.session_state.final_translation, 
             file_name=f"translation_{st.session_state.target_lang_ui.lower()}.txt")
+    # Read only when the log file has changed since the last run
+    all_logs, csv_string, error = get_log_downloads()
     with col_btn2:
         # Download ALL CSV logs
-        csv_file = get_csv_filename()
-        if os.path.exists(csv_file):
-            with open(csv_file, "rb") as file:
-                st.download_button("📊 All Logs (Excel)", file.read(), 
-                    file_name="translation_logs_all.csv", mime="text/csv")
+        if all_logs is not None:
+            st.download_button("📊 All Logs (Excel)", all_logs, 
+                file_name="translation_logs_all.csv", mime="text/csv")
     with col_btn3:
         # Download THIS MONTH's CSV logs only
-        monthly_data, error = get_monthly_csv_data()
-        if monthly_data:
-            # Convert to CSV string
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerows(monthly_data)
-            csv_string = output.getvalue()
-            
+        if csv_string:
             current_month_name = datetime.now().strftime("%B_%Y")
             st.download_button(
                 f"📅 {datetime.now().strftime('%B')} Logs", 
@@ -726,8 +736,7 @@ if 'final_translation' in st.session_state:
                 disabled=True
             )
     with col_btn4:
-        if st.button("🔄 Retranslate"):
-            st.rerun()
+        st.button("🔄 Retranslate", on_click=request_translation, args=(True,))
     
     # Additional insights
     if st.session_state.get('gpt_status') == "Enhanced":
@@ -750,6 +759,7 @@ if 'final_translation' in st.session_state:
             - Total Training Patterns: {enhancement_info['total_patterns']}
             - Total Quality Fixes: {enhancement_info['total_fixes']}
             - Last Updated: {enhancement_info['last_updated']}
+            - Rule Pack: {enhancement_info['rule_pack_hash'][:12]}
             """)
 
 # Enhanced Help section
@@ -766,6 +776,8 @@ with st.expander("ℹ️ Enhanced AI Quality Guide"):
     - Generates contextually accurate translation with training optimization
     
     **Step 2: ChatGPT Quality Review with Training Examples** (if enabled)
+    - Skipped when the Sarvam translation passes every quality check (Payment/Financial is always reviewed)
+    - Runs in the background: the Sarvam translation shows right away and is updated in place when the review finishes
     - Reviews Sarvam translation using comprehensive training examples
     - Maintains exact same context settings and language patterns
     - Applies improvements based on proven quality patterns
@@ -849,12 +861,35 @@ with st.expander("📊 CSV Download Options"):
 st.markdown("---")
 
 # Show current enhancement status
-col_status1, col_status2, col_status3 = st.columns(3)
+col_status1, col_status2, col_status3, col_status4 = st.columns(4)
 with col_status1:
     st.metric("Enhancement Version", enhancement_info['version'])
 with col_status2:
     st.metric("Training Layers", len(enhancement_info['training_layers']))
 with col_status3:
     st.metric("Supported Languages", len(enhancement_info['supported_languages']))
+with col_status4:
+    # Vendor endpoints failing fast after repeated timeouts/5xx errors
+    breaker_states = get_circuit_breaker_states()
+    tripped = [name for name, status in breaker_states.items() if status["state"] != "closed"]
+    st.metric("Vendor Circuits", f"{len(tripped)} open" if tripped else "All closed",
+              help="\n\n".join(
+                  f"{name}: {status['state']} ({status['consecutive_failures']} consecutive failures, "
+                  f"opened {status['times_opened']}x, {status['rejected']} calls skipped)"
+                  for name, status in breaker_states.items()
+              ) or "No vendor calls yet")
+    for name in tripped:
+        retry_in = breaker_states[name]["retry_in_seconds"]
+        st.caption(f"⛔ {name}: {breaker_states[name]['state']}" + (f", probing again in {retry_in:.0f}s" if retry_in else ""))
 
 st.markdown(f"*FRND Enhanced Translator • AI-Powered Quality Assurance • Training v{enhancement_info['version']} • Monthly CSV Logging*")
+
+# Finish a background ChatGPT review: the page above already shows the Sarvam result,
+# and each rerun redraws it in place until the review's result replaces it
+if "qa_review" in st.session_state:
+    review = st.session_state.qa_review
+    if review.wait(QA_POLL_SECONDS):
+        del st.session_state.qa_review
+        final_translation, gpt_error = review.result()
+        complete_single_translation(final_translation, gpt_error, "Enhanced" if not gpt_error else f"Error: {gpt_error}")
+    st.rerun()
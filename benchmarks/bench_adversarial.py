@@ -0,0 +1,82 @@
+# Benchmark: cleanup and analysis stages on 10 KB - 1 MB pathological inputs
+# Each input targets a pattern that backtracks quadratically (or worse) as a plain regex.
+# Fails if any stage exceeds its time ceiling or grows faster than linearly with input size.
+# Run from the repo root: python -m benchmarks.bench_adversarial
+
+import time
+
+import translation_enhancements as enhancements
+from benchmarks import legacy
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+# Generous for a slow CI box; a quadratic stage blows through it by orders of magnitude
+CEILING_SECONDS_PER_MB = 3.0
+MIN_CEILING_SECONDS = 0.25
+# 100 KB -> 1 MB is 10x more input; linear stays near 10x, quadratic is near 100x
+MAX_GROWTH = 30
+
+PATHOLOGICAL_UNITS = {
+    "regarding, no period": "regarding the offer ",
+    "concerning, no period": "concerning FRND ",
+    "this message is about, no period": "This message is about ",
+    "malayalam marker, no period": "കുറിച്ചാണ് ",
+    "[ with translate/from, no ]": "[translate from ",
+    "[INST: without ]": "[INST: keep going ",
+    "bracket run": "[",
+    "brace run": "{",
+    "} run without ]": "}",
+    "blank lines before a word": "\n \n",
+    "spaces before no emoji": " ",
+    "digits without PM": "1",
+    "chatgpt meta, no period": "The translation is already good ",
+}
+
+STAGES = {
+    "clean_translation_output": lambda text: enhancements._clean_translation_output_uncached(text, "hi-IN"),
+    "strip_chatgpt_meta_commentary": enhancements.strip_chatgpt_meta_commentary,
+    "analyze_enhanced_translation_quality": lambda text: enhancements.analyze_enhanced_translation_quality(text, text, "en-IN", "hi-IN"),
+}
+
+def build_input(unit, size):
+    # A trailing word with a comma so the line-start comma pass has work to do
+    return (unit * (size // len(unit) + 1))[:size] + "x,"
+
+def time_once(stage, text):
+    start = time.perf_counter()
+    stage(text)
+    return time.perf_counter() - start
+
+def legacy_sample(unit, size=1_000):
+    """The old chain on a 1 KB input, for comparison (2 KB of the ChatGPT meta case already takes ~45s)"""
+    text = build_input(unit, size)
+    return time_once(lambda t: legacy.strip_chatgpt_meta_commentary(legacy.clean_translation_output(t, "hi-IN")), text)
+
+def main():
+    failures = []
+    for name, unit in PATHOLOGICAL_UNITS.items():
+        for stage_name, stage in STAGES.items():
+            timings = []
+            for size in SIZES:
+                elapsed = time_once(stage, build_input(unit, size))
+                ceiling = max(MIN_CEILING_SECONDS, CEILING_SECONDS_PER_MB * size / 1_000_000)
+                if elapsed > ceiling:
+                    failures.append(f"{stage_name} on {name!r} ({size} chars): {elapsed:.2f}s > {ceiling:.2f}s")
+                timings.append(elapsed)
+
+            growth = timings[-1] / max(timings[-2], 1e-4)
+            if growth > MAX_GROWTH:
+                failures.append(f"{stage_name} on {name!r}: 100 KB -> 1 MB grew {growth:.0f}x")
+            print(f"{name:34} {stage_name:38} " + "  ".join(f"{t * 1000:8.1f}ms" for t in timings))
+
+        print(f"{name:34} {'old cleanup chain (1 KB only)':38} {legacy_sample(unit) * 1000:8.1f}ms")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        raise SystemExit(1)
+    print("\nAll stages within their time ceilings")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Benchmark: fused quality analyzer vs the old confidence + analysis double pass
+# Doubles as the output check over every sample message/output pair.
+# The old repeat check counted substrings of the raw text, so it missed trigrams split by
+# newlines or double spaces and matched inside longer words; those cases are reported, not failed.
+# Run from the repo root: python -m benchmarks.bench_analyzer
+
+import time
+
+import translation_enhancements as enhancements
+from benchmarks import legacy
+from benchmarks.corpus import SAMPLE_MESSAGES, SAMPLE_OUTPUTS, TARGET_LANGUAGES
+
+REPEAT_FLAG = "🔄 Repeated phrases detected - may indicate translation error"
+LONG_SIZES = [1_000, 10_000, 100_000]
+
+def check_identical_output():
+    mismatches = 0
+    repeat_differences = 0
+    for target_lang in TARGET_LANGUAGES:
+        for original in SAMPLE_MESSAGES + [""]:
+            message_context = enhancements.build_message_context(original)
+            for translated in SAMPLE_OUTPUTS:
+                old_flags, old_confidence = legacy.analyze_enhanced_translation_quality(original, translated, "en-IN", target_lang, message_context)
+                new_flags, new_confidence = enhancements.analyze_enhanced_translation_quality(original, translated, "en-IN", target_lang, message_context)
+                if (old_flags, old_confidence) == (new_flags, new_confidence):
+                    continue
+                same_other_flags = [f for f in old_flags if f != REPEAT_FLAG] == [f for f in new_flags if f != REPEAT_FLAG]
+                if same_other_flags and (REPEAT_FLAG in old_flags) != (REPEAT_FLAG in new_flags):
+                    repeat_differences += 1
+                    continue
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"MISMATCH [{target_lang}]: {original!r} -> {translated!r}\n"
+                          f"  legacy: {old_flags!r} {old_confidence}\n  fused:  {new_flags!r} {new_confidence}")
+    return mismatches, repeat_differences
+
+def unique_words_text(size):
+    """No repeated trigram anywhere: the old check scans the whole text once per word"""
+    words = []
+    length = 0
+    while length < size:
+        word = f"word{len(words)}"
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+def time_once(analyze, original, translated):
+    start = time.perf_counter()
+    analyze(original, translated, "en-IN", "hi-IN")
+    return time.perf_counter() - start
+
+def time_per_pair(analyze, rounds=20):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for original, translated in zip(SAMPLE_MESSAGES, SAMPLE_OUTPUTS):
+            analyze(original, translated, "en-IN", "hi-IN")
+    return (time.perf_counter() - start) / (rounds * min(len(SAMPLE_MESSAGES), len(SAMPLE_OUTPUTS)))
+
+def main():
+    mismatches, repeat_differences = check_identical_output()
+    print(f"Output check: {mismatches} mismatches; {repeat_differences} pairs differ only in the repeated-phrase check")
+
+    legacy_time = time_per_pair(legacy.analyze_enhanced_translation_quality)
+    fused_time = time_per_pair(enhancements.analyze_enhanced_translation_quality)
+    print(f"Sample pairs:   old {legacy_time * 1e6:9.1f} µs   fused {fused_time * 1e6:9.1f} µs")
+
+    for size in LONG_SIZES:
+        translated = unique_words_text(size)
+        original = translated[: size // 2]
+        legacy_long = time_once(legacy.analyze_enhanced_translation_quality, original, translated)
+        fused_long = time_once(enhancements.analyze_enhanced_translation_quality, original, translated)
+        print(f"{size:>7} chars:  old {legacy_long * 1000:9.1f} ms   fused {fused_long * 1000:9.1f} ms")
+
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
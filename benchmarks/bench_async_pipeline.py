@@ -0,0 +1,63 @@
+# Benchmark: Sarvam + ChatGPT for a batch of messages, one after another vs on the async pipeline
+# Runs against the local stub server with a fixed per-call latency standing in for the vendors.
+# Doubles as the output check: the async pipeline must return exactly what the sync one does.
+# Also reports the longest event-loop stall, since pre- and post-processing run on worker threads.
+# Run from the repo root: python -m benchmarks.bench_async_pipeline
+
+import asyncio
+import threading
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import stub_pipeline
+
+STUB_LATENCY_SECONDS = 0.1
+MESSAGES = SAMPLE_MESSAGES[:8]
+TARGET_LANG = "hi-IN"
+
+def translate_and_review(text):
+    sarvam = pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", "code-mixed", bypass_cache=True)
+    return pipeline.chatgpt_quality_check_and_improve(text, sarvam, TARGET_LANG, "code-mixed", "", "", 2, bypass_cache=True)
+
+async def translate_and_review_async(text):
+    sarvam = await pipeline.translate_text_async(text, "en-IN", TARGET_LANG, "Male", "code-mixed", bypass_cache=True)
+    return await pipeline.chatgpt_quality_check_and_improve_async(text, sarvam, TARGET_LANG, "code-mixed", "", "", 2, bypass_cache=True)
+
+async def watch_loop_lag(stop, interval=0.001):
+    """Longest time the pipeline's event loop could not run a ready callback, until stop is set"""
+    worst = 0.0
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - before - interval)
+    return worst
+
+def main():
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS):
+        # Warm both paths so connection setup and the event loop start are not timed
+        translate_and_review(MESSAGES[0])
+        pipeline.run_sync(translate_and_review_async(MESSAGES[0]))
+
+        start = time.perf_counter()
+        sync_results = [translate_and_review(text) for text in MESSAGES]
+        sync_time = time.perf_counter() - start
+
+        stop = threading.Event()
+        loop_lag = asyncio.run_coroutine_threadsafe(watch_loop_lag(stop), pipeline.get_event_loop())
+        start = time.perf_counter()
+        async_results = pipeline.run_all_sync([translate_and_review_async(text) for text in MESSAGES])
+        async_time = time.perf_counter() - start
+        stop.set()
+
+    mismatches = sum(1 for old, new in zip(sync_results, async_results) if old != new)
+    print(f"Output check: {mismatches} mismatches across {len(MESSAGES)} messages")
+    print(f"{len(MESSAGES)} messages x 2 vendor calls at {STUB_LATENCY_SECONDS * 1000:.0f} ms each")
+    print(f"  one after another: {sync_time:6.2f} s")
+    print(f"  async pipeline:    {async_time:6.2f} s (event loop stalled at most {loop_lag.result() * 1000:.1f} ms)")
+
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
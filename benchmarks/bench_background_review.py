@@ -0,0 +1,138 @@
+# Check: a background ChatGPT review gives the blocking call's result, lets the Sarvam output show
+# first, and leaves no work behind when it is cancelled or abandoned with its session.
+# Run from the repo root: python -m benchmarks.bench_background_review
+
+import asyncio
+import gc
+import statistics
+import threading
+import time
+
+import translation_pipeline as pipeline
+import vendor_clients
+from benchmarks.bench_async_pipeline import STUB_LATENCY_SECONDS
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import stub_pipeline
+
+TARGET_LANG = "hi-IN"
+MODE = "code-mixed"
+STREAM_CHUNK_DELAY_SECONDS = 0.02
+# A stream this slow takes seconds to finish, so a cancelled one must be seen to stop early
+SLOW_STREAM_CHUNK_DELAY_SECONDS = 0.2
+CANCEL_GRACE_SECONDS = 1.0
+# As many as the OpenAI client's connection pool streams at once
+CONCURRENT_STREAMS = vendor_clients.POOL_SIZE
+
+def review_args(text, sarvam):
+    return (text, sarvam, TARGET_LANG, MODE, "", "", 2, None, True)
+
+def wait_until(condition, timeout):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+async def count_pending_tasks():
+    return len(asyncio.all_tasks()) - 1
+
+def check_results(timings):
+    """Streamed and plain background reviews match the blocking call; Sarvam shows up well before the review"""
+    failures = 0
+    for text in SAMPLE_MESSAGES:
+        start = time.perf_counter()
+        sarvam = pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", MODE, bypass_cache=True)
+        timings["sarvam_visible"].append(time.perf_counter() - start)
+        reviews = [pipeline.submit_chatgpt_review(*review_args(text, sarvam), stream=stream) for stream in [False, True]]
+        reviews[0].wait()
+        timings["review_done"].append(time.perf_counter() - start)
+        expected = pipeline.chatgpt_quality_check_and_improve(*review_args(text, sarvam))
+        for stream, review in zip([False, True], reviews):
+            review.wait()
+            if review.result() != expected:
+                failures += 1
+                print(f"FAIL background review (stream={stream}) differs:\n  {review.result()!r}\n  {expected!r}")
+    return failures
+
+def check_concurrent_streams(server):
+    """Streamed reviews hold no thread each: a full connection pool's worth streams at once on the pipeline loop"""
+    text = SAMPLE_MESSAGES[0]
+    threads_before = threading.active_count()
+    reviews = [pipeline.submit_chatgpt_review(*review_args(text, text), stream=True) for _ in range(CONCURRENT_STREAMS)]
+    all_open = wait_until(lambda: server.httpd.open_streams == CONCURRENT_STREAMS, CANCEL_GRACE_SECONDS)
+    # The stub server spends a thread per open stream; the pipeline's workers may all start up
+    extra_threads = threading.active_count() - threads_before - server.httpd.open_streams
+    for review in reviews:
+        review.cancel()
+    if not all_open or extra_threads > pipeline.PIPELINE_WORKERS:
+        print(f"FAIL {CONCURRENT_STREAMS} streamed reviews: {server.httpd.open_streams} streaming at once, "
+              f"{extra_threads} extra threads")
+        return 1
+    return 0
+
+def check_cancelled(server, stream):
+    """cancel() (e.g. the user translating again) stops the request instead of letting it run out"""
+    text = SAMPLE_MESSAGES[0]
+    review = pipeline.submit_chatgpt_review(*review_args(text, text), stream=stream)
+    if stream and not wait_until(lambda: review.text_so_far, CANCEL_GRACE_SECONDS):
+        print("FAIL slow stream produced no output")
+        return 1
+    review.cancel()
+    if not review.wait(CANCEL_GRACE_SECONDS) or not review.future.cancelled():
+        print(f"FAIL cancelled review (stream={stream}) still running")
+        return 1
+    if stream and not wait_until(lambda: server.httpd.open_streams == 0, CANCEL_GRACE_SECONDS):
+        print("FAIL cancelled stream was not closed")
+        return 1
+    return 0
+
+def check_abandoned(server):
+    """A review dropped with its session (no cancel() call) is cancelled once collected"""
+    text = SAMPLE_MESSAGES[1]
+    review = pipeline.submit_chatgpt_review(*review_args(text, text), stream=True)
+    future = review.future
+    # Bound as a default, so the lambda holds its own reference and is gone once wait_until returns
+    wait_until(lambda streaming=review: streaming.text_so_far, CANCEL_GRACE_SECONDS)
+    del review
+    gc.collect()
+    if not future.cancelled() or not wait_until(lambda: server.httpd.open_streams == 0, CANCEL_GRACE_SECONDS):
+        print("FAIL abandoned review kept running")
+        return 1
+    return 0
+
+def main():
+    timings = {"sarvam_visible": [], "review_done": []}
+    failures = 0
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS, stream_chunk_delay=STREAM_CHUNK_DELAY_SECONDS) as server:
+        failures += check_results(timings)
+        server.httpd.stream_chunk_delay = SLOW_STREAM_CHUNK_DELAY_SECONDS
+        failures += check_concurrent_streams(server)
+        wait_until(lambda: server.httpd.open_streams == 0, CANCEL_GRACE_SECONDS)
+        threads_before = threading.active_count()
+
+        for _ in range(5):
+            failures += check_cancelled(server, stream=False)
+            failures += check_cancelled(server, stream=True)
+            failures += check_abandoned(server)
+        pending_tasks = pipeline.run_sync(count_pending_tasks())
+        threads_after = threading.active_count()
+
+    if pending_tasks:
+        failures += 1
+        print(f"FAIL {pending_tasks} tasks left on the pipeline loop")
+    if threads_after > threads_before:
+        failures += 1
+        print(f"FAIL thread count grew from {threads_before} to {threads_after}")
+
+    print(f"Background review check: {failures} failures over {len(SAMPLE_MESSAGES)} messages")
+    print(f"{STUB_LATENCY_SECONDS * 1000:.0f} ms per vendor call (median):")
+    print(f"  Sarvam result on screen after: {statistics.median(timings['sarvam_visible']) * 1000:7.1f} ms")
+    print(f"  review finished after:         {statistics.median(timings['review_done']) * 1000:7.1f} ms")
+    print(f"  threads: {threads_before} before cancel/abandon checks, {threads_after} after")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Benchmark: preprocess_many/postprocess_many vs calling the single-text functions in a loop
+# Doubles as the output check: batch results must equal the single-text results
+# Run from the repo root: python -m benchmarks.bench_batch
+
+import statistics
+import time
+
+import translation_enhancements as enhancements
+from benchmarks.corpus import SAMPLE_MESSAGES, SAMPLE_OUTPUTS, TARGET_LANGUAGES
+
+# A replay-sized batch of logged messages
+REPLAY_SIZE = 3000
+# Single and batch runs alternate, and the median is reported, so warm-up and drift hit both alike
+REPEATS = 7
+
+def replay_batch(corpus):
+    return [corpus[i % len(corpus)] for i in range(REPLAY_SIZE)]
+
+def check_identical_output():
+    mismatches = 0
+    for target_lang in TARGET_LANGUAGES:
+        expected = [enhancements.enhanced_preprocess_input_for_completeness(text, target_lang) for text in SAMPLE_MESSAGES]
+        actual = list(enhancements.preprocess_many(SAMPLE_MESSAGES, target_lang))
+        for text, old, new in zip(SAMPLE_MESSAGES, expected, actual):
+            if old != new:
+                mismatches += 1
+                print(f"MISMATCH preprocess_many [{target_lang}]: {text!r}\n  single: {old!r}\n  batch:  {new!r}")
+
+        expected = [enhancements.enhanced_postprocess_translation_output(text, target_lang) for text in SAMPLE_OUTPUTS]
+        actual = list(enhancements.postprocess_many(SAMPLE_OUTPUTS, target_lang))
+        for text, old, new in zip(SAMPLE_OUTPUTS, expected, actual):
+            if old != new:
+                mismatches += 1
+                print(f"MISMATCH postprocess_many [{target_lang}]: {text!r}\n  single: {old!r}\n  batch:  {new!r}")
+    return mismatches
+
+def time_call(run):
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / REPLAY_SIZE
+
+def time_pair(single, batch):
+    """Median per-text seconds of the single-text loop and of the batch function"""
+    single_times, batch_times = [], []
+    for _ in range(REPEATS):
+        single_times.append(time_call(single))
+        batch_times.append(time_call(batch))
+    return statistics.median(single_times), statistics.median(batch_times)
+
+def main():
+    mismatches = check_identical_output()
+    print(f"Output check: {mismatches} mismatches across {len(TARGET_LANGUAGES)} languages")
+
+    messages = replay_batch(SAMPLE_MESSAGES)
+    outputs = replay_batch(SAMPLE_OUTPUTS)
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for target_lang in TARGET_LANGUAGES:
+        single_pre, batch_pre = time_pair(
+            lambda: [enhancements.enhanced_preprocess_input_for_completeness(text, target_lang) for text in messages],
+            lambda: list(enhancements.preprocess_many(messages, target_lang)))
+        single_post, batch_post = time_pair(
+            lambda: [enhancements.enhanced_postprocess_translation_output(text, target_lang) for text in outputs],
+            lambda: list(enhancements.postprocess_many(outputs, target_lang)))
+        for i, seconds in enumerate([single_pre, batch_pre, single_post, batch_post]):
+            totals[i] += seconds
+        print(f"[{target_lang}] preprocess  {single_pre * 1e6:7.1f} -> {batch_pre * 1e6:7.1f} µs/text ({single_pre / batch_pre:.2f}x)   "
+              f"postprocess {single_post * 1e6:7.1f} -> {batch_post * 1e6:7.1f} µs/text ({single_post / batch_post:.2f}x)")
+    print(f"All languages: preprocess {totals[0] / totals[1]:.2f}x, postprocess {totals[2] / totals[3]:.2f}x (median of {REPEATS} alternating runs)")
+
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Benchmark: a long announcement as one Sarvam request vs split into chunks sent concurrently
+# The stub server's latency grows with input length, as a real model's does.
+# Doubles as the output check: chunks rejoin into the original lines and match the single request's output.
+# Run from the repo root: python -m benchmarks.bench_chunking
+
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import patched, stub_pipeline
+
+LATENCY_PER_CHAR_SECONDS = 0.0002
+TARGET_LANG = "hi-IN"
+# No request is ever split when the limit is larger than the whole message
+UNCHUNKED = 10 ** 9
+
+def long_announcement(repeats):
+    """Sample messages back to back, one per line, plus one paragraph far over the chunk size"""
+    lines = [line for text in SAMPLE_MESSAGES for line in text.split("\n") if line.strip()] * repeats
+    paragraph = " ".join(text.replace("\n", " ") for text in SAMPLE_MESSAGES[:12])
+    return "\n".join(lines[:len(lines) // 2] + [paragraph] + lines[len(lines) // 2:])
+
+def translate(text, chunk_chars):
+    pipeline.SARVAM_CHUNK_CHARS = chunk_chars
+    return pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", "code-mixed", bypass_cache=True)
+
+def timed(run):
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+def main():
+    default_chunk_chars = pipeline.SARVAM_CHUNK_CHARS
+    failures = 0
+    # translate() sets the chunk size per call; the default is put back afterwards
+    with stub_pipeline(latency_per_char=LATENCY_PER_CHAR_SECONDS), patched(pipeline, SARVAM_CHUNK_CHARS=default_chunk_chars):
+        translate(SAMPLE_MESSAGES[0], default_chunk_chars)
+        translate(long_announcement(1), default_chunk_chars)
+
+        print(f"Sarvam stub at {LATENCY_PER_CHAR_SECONDS * 1e6:.0f} us per input character, chunks of {default_chunk_chars} chars")
+        for repeats in [1, 2, 4]:
+            text = long_announcement(repeats)
+            chunks = pipeline.segment_for_translation(text, default_chunk_chars)
+            single, single_time = timed(lambda: translate(text, UNCHUNKED))
+            chunked, chunked_time = timed(lambda: translate(text, default_chunk_chars))
+
+            # Rejoined untranslated chunks are the original lines; the stub echoes, so both requests agree
+            rejoined = pipeline.join_translated_chunks(chunks, [chunk.text for chunk in chunks])
+            if rejoined.split("\n") != [" ".join(line.split()) for line in text.split("\n") if line.strip()]:
+                failures += 1
+                print(f"LINES LOST at {len(text)} chars")
+            if chunked != single:
+                failures += 1
+                print(f"MISMATCH at {len(text)} chars")
+            print(f"  {len(text):6} chars, {len(chunks):3} chunks: one request {single_time:6.2f} s, chunked {chunked_time:6.2f} s")
+
+        longest = max(len(chunk.text) for chunk in chunks)
+        if longest > default_chunk_chars:
+            failures += 1
+            print(f"OVERSIZED chunk: {longest} chars")
+
+    print(f"Output check: {failures} failures")
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
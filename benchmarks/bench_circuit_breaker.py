@@ -0,0 +1,139 @@
+# Check: during an OpenAI outage the ChatGPT review stops waiting out timeouts once the endpoint's
+# circuit opens, falls back to the cleaned Sarvam output at once, and recovers through a half-open probe.
+# Run from the repo root: python -m benchmarks.bench_circuit_breaker
+
+import time
+
+import translation_pipeline as pipeline
+import vendor_clients
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import patched, stub_pipeline
+from vendor_clients import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+
+FAILURE_THRESHOLD = 5
+COOLDOWN_SECONDS = 0.5
+# Stands in for the 30 s production read timeout
+READ_TIMEOUT_SECONDS = 0.3
+OUTAGE_LATENCY_SECONDS = 2.0
+# Gap between streamed chunks once a stream stalls, past the read timeout
+STREAM_STALL_SECONDS = 0.6
+REVIEWS = 20
+
+def check_state_machine():
+    """closed -> open after N failures -> one half-open probe -> open again or closed"""
+    failures = 0
+    breaker = CircuitBreaker("stub", failure_threshold=3, cooldown_seconds=0.1)
+    def expect(condition, message):
+        nonlocal failures
+        if not condition:
+            failures += 1
+            print(f"FAIL {message}: {breaker.status()}")
+    def rejected():
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            return True
+        return False
+
+    for status_code in [500, 503]:
+        breaker.before_call()
+        breaker.record_response(status_code)
+    breaker.before_call()
+    breaker.record_response(200)
+    expect(breaker.status()["consecutive_failures"] == 0, "a success resets the failure count")
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+    expect(breaker.status()["state"] == CircuitBreaker.OPEN and rejected(), "opens after 3 consecutive failures")
+    time.sleep(0.1)
+    expect(not rejected(), "lets a probe through after the cooldown")
+    expect(rejected(), "only one probe at a time")
+    breaker.record_failure()
+    expect(breaker.status()["state"] == CircuitBreaker.OPEN and rejected(), "a failed probe reopens")
+    time.sleep(0.1)
+    expect(not rejected(), "probes again after another cooldown")
+    breaker.record_abandoned()
+    expect(not rejected(), "a cancelled probe frees the probe slot")
+    breaker.record_response(404)
+    expect(breaker.status()["state"] == CircuitBreaker.CLOSED and not rejected(), "a non-5xx probe response closes")
+    return failures
+
+def review(text, sarvam):
+    start = time.perf_counter()
+    result = pipeline.chatgpt_quality_check_and_improve(text, sarvam, "hi-IN", "code-mixed", "", "", 2, bypass_cache=True)
+    return result, time.perf_counter() - start
+
+def check_stalled_streams(server, texts, sarvam):
+    """A streamed review whose 200 headers arrive but whose body stalls counts as a failure, not a success"""
+    failures = 0
+    breaker = get_circuit_breaker("openai", "/v1/chat/completions")
+    server.httpd.stream_chunk_chars = 8
+    server.httpd.stream_chunk_delay = STREAM_STALL_SECONDS
+    stalled = [
+        pipeline.chatgpt_quality_check_and_improve_stream(text, translation, "hi-IN", "code-mixed", "", "", 2, bypass_cache=True)
+        for text, translation in zip(texts[:FAILURE_THRESHOLD + 2], sarvam)
+    ]
+    errors = [error for _, error in stalled]
+    expected = [pipeline.CHATGPT_CONNECTION_ERROR] * FAILURE_THRESHOLD + [pipeline.CHATGPT_UNAVAILABLE_ERROR] * 2
+    if errors != expected:
+        failures += 1
+        print(f"FAIL stalled streams should open the circuit: {errors}")
+
+    # A probe only closes the circuit once its stream reaches [DONE]
+    server.httpd.stream_chunk_delay = 0.0
+    time.sleep(COOLDOWN_SECONDS)
+    _, error = pipeline.chatgpt_quality_check_and_improve_stream(texts[0], sarvam[0], "hi-IN", "code-mixed", "", "", 2, bypass_cache=True)
+    if error or breaker.status()["state"] != CircuitBreaker.CLOSED:
+        failures += 1
+        print(f"FAIL a complete stream did not close the circuit ({error}): {breaker.status()}")
+    return failures
+
+def main():
+    failures = check_state_machine()
+    breaker = get_circuit_breaker("openai", "/v1/chat/completions")
+    texts = [SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)] for i in range(REVIEWS)]
+    with stub_pipeline() as server, \
+            patched(breaker, failure_threshold=FAILURE_THRESHOLD, cooldown_seconds=COOLDOWN_SECONDS), \
+            patched(vendor_clients.openai_client, timeout=(vendor_clients.CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS)):
+        sarvam = [pipeline.translate_text(text, "en-IN", "hi-IN", "Male", "code-mixed", bypass_cache=True) for text in texts]
+        healthy = [review(text, translation) for text, translation in zip(texts, sarvam)]
+
+        # Outage: every ChatGPT call would wait out the read timeout
+        server.httpd.latency = OUTAGE_LATENCY_SECONDS
+        openai_before = vendor_clients.get_vendor_metrics()["openai"]["requests"]
+        outage = [review(text, translation) for text, translation in zip(texts, sarvam)]
+        sent_during_outage = vendor_clients.get_vendor_metrics()["openai"]["requests"] - openai_before
+
+        # Recovery: after the cooldown one probe goes through and closes the circuit
+        server.httpd.latency = 0.0
+        time.sleep(COOLDOWN_SECONDS)
+        recovered = [review(text, translation) for text, translation in zip(texts, sarvam)]
+        failures += check_stalled_streams(server, texts, sarvam)
+
+    timed_out = [seconds for (_, error), seconds in outage if error == pipeline.CHATGPT_TIMEOUT_ERROR]
+    skipped = [seconds for (_, error), seconds in outage if error == pipeline.CHATGPT_UNAVAILABLE_ERROR]
+    if len(timed_out) != FAILURE_THRESHOLD or len(skipped) != REVIEWS - FAILURE_THRESHOLD:
+        failures += 1
+        print(f"FAIL expected {FAILURE_THRESHOLD} timeouts then fast fallbacks, got {len(timed_out)} and {len(skipped)}")
+    if sent_during_outage != FAILURE_THRESHOLD:
+        failures += 1
+        print(f"FAIL {sent_during_outage} ChatGPT requests sent during the outage, expected {FAILURE_THRESHOLD}")
+    if any(translation != clean for ((translation, _), _), clean in zip(outage, sarvam)):
+        failures += 1
+        print("FAIL outage fallback is not the cleaned Sarvam translation")
+    if [result for result, _ in recovered] != [result for result, _ in healthy] or breaker.status()["state"] != CircuitBreaker.CLOSED:
+        failures += 1
+        print(f"FAIL did not recover after the cooldown: {breaker.status()}")
+
+    print(f"Circuit breaker check: {failures} failures")
+    print(f"{REVIEWS} ChatGPT reviews during an outage ({READ_TIMEOUT_SECONDS * 1000:.0f} ms read timeout, opens after {FAILURE_THRESHOLD} failures):")
+    print(f"  without a breaker (estimated): {REVIEWS * READ_TIMEOUT_SECONDS:6.2f} s")
+    print(f"  with the breaker:              {sum(seconds for _, seconds in outage):6.2f} s "
+          f"({len(timed_out)} timed out, {len(skipped)} skipped at {max(skipped, default=0) * 1000:.2f} ms max)")
+    print(f"  breaker: {breaker.status()}")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Benchmark: unified output cleanup vs the old leak/brand/formatting/post-processing chain
+# Doubles as the output check over the sample outputs plus bracket-heavy fuzz strings
+# Run from the repo root: python -m benchmarks.bench_cleanup
+
+import random
+import time
+
+import translation_enhancements as enhancements
+from benchmarks import legacy
+from benchmarks.corpus import SAMPLE_OUTPUTS, TARGET_LANGUAGES
+
+FUZZ_TOKENS = [
+    "[", "]", "[[", "]]", "{", "}", "}]", ",", ", ", " ", "\n", "\n\n", ".", "!", "?",
+    "FRND", "Team", "INST:", "INSTRUCTION:", "Context:", "Apply:", "translate", "from",
+    "regarding", "concerning", "This message is about", "കുറിച്ചാണ്", "live", "join",
+    "5 PM", "10PM", "₹ 40", "👉", "💥", "hello", "नमस्ते", "ı", "ſ", "İ", "We're LIVE", "Join now",
+    "The", "is", "already", "good", "No improvements", "needed", "meets", "requirements", "Translation:",
+]
+FUZZ_CASES = 5000
+
+def fuzz_corpus(seed=7):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 24))) for _ in range(FUZZ_CASES)]
+
+def check_identical_output(corpus):
+    mismatches = 0
+    for target_lang in TARGET_LANGUAGES:
+        for text in corpus:
+            expected = legacy.clean_translation_output(text, target_lang)
+            actual = enhancements._clean_translation_output_uncached(text, target_lang)
+            if expected != actual:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"MISMATCH [{target_lang}]: {text!r}\n  legacy:  {expected!r}\n  unified: {actual!r}")
+
+    for text in corpus:
+        expected = legacy.strip_chatgpt_meta_commentary(text)
+        actual = enhancements.strip_chatgpt_meta_commentary(text)
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"MISMATCH strip_chatgpt_meta_commentary: {text!r}\n  legacy:  {expected!r}\n  unified: {actual!r}")
+    return mismatches
+
+def count_unstable(corpus, target_lang="hi-IN"):
+    """Texts where running the old chain twice changes the result again"""
+    return sum(
+        1 for text in corpus
+        if legacy.clean_translation_output(legacy.clean_translation_output(text, target_lang), target_lang)
+        != legacy.clean_translation_output(text, target_lang)
+    )
+
+def check_memo_warmth(corpus, target_lang="hi-IN"):
+    """Cleaning a cleaned text must give the same result with a cold memo as with a warm one"""
+    mismatches = 0
+    for text in corpus:
+        cleaned = enhancements.clean_translation_output(text, target_lang)
+        if enhancements.clean_translation_output(cleaned, target_lang) != enhancements._clean_translation_output_uncached(cleaned, target_lang):
+            mismatches += 1
+    return mismatches
+
+def time_per_text(clean, corpus, target_lang, rounds=5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            clean(text, target_lang)
+    return (time.perf_counter() - start) / (rounds * len(corpus))
+
+def main():
+    corpus = SAMPLE_OUTPUTS + fuzz_corpus()
+    mismatches = check_identical_output(corpus)
+    print(f"Output check: {mismatches} mismatches across {len(corpus) * (len(TARGET_LANGUAGES) + 1)} cleanups")
+    print(f"Old chain not idempotent on {count_unstable(corpus)} of {len(corpus)} texts")
+    memo_mismatches = check_memo_warmth(corpus)
+    print(f"Memo check: {memo_mismatches} re-cleans differ between a warm and a cold memo")
+
+    target_lang = "hi-IN"
+    legacy_time = time_per_text(legacy.clean_translation_output, SAMPLE_OUTPUTS, target_lang)
+    unified_time = time_per_text(enhancements._clean_translation_output_uncached, SAMPLE_OUTPUTS, target_lang)
+    for text in SAMPLE_OUTPUTS:
+        enhancements.clean_translation_output(text, target_lang)
+    memo_time = time_per_text(enhancements.clean_translation_output, SAMPLE_OUTPUTS, target_lang)
+
+    print(f"Old cleanup chain:     {legacy_time * 1e6:8.1f} µs/text")
+    print(f"Unified cleanup:       {unified_time * 1e6:8.1f} µs/text")
+    print(f"Memo hit:              {memo_time * 1e6:8.1f} µs/text")
+
+    if mismatches or memo_mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
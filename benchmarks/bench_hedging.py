@@ -0,0 +1,127 @@
+# Check: hedged Sarvam requests cut the p99 of a long-tailed latency distribution,
+# without changing results and without exceeding the hedge rate cap.
+# Runs translate_text from several threads (like concurrent Streamlit sessions) against the local stub server.
+# Run from the repo root: python -m benchmarks.bench_hedging
+
+import asyncio
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+import translation_pipeline as pipeline
+import vendor_clients
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import patched, stub_pipeline
+from benchmarks.stub_server import StubServer
+from vendor_clients import AsyncVendorClient, HedgePolicy, get_vendor_metrics
+
+REQUESTS = 400
+CONCURRENCY = 8
+# Most responses take ~50 ms; 3% stall for a second
+FAST_SECONDS = (0.04, 0.06)
+SLOW_SECONDS = 1.0
+SLOW_SHARE = 0.03
+
+def make_latency_sampler(seed):
+    rng = random.Random(seed)
+    def sample(path):
+        return SLOW_SECONDS if rng.random() < SLOW_SHARE else rng.uniform(*FAST_SECONDS)
+    return sample
+
+def translate(text):
+    start = time.perf_counter()
+    result = pipeline.translate_text(text, "en-IN", "hi-IN", "Male", "code-mixed", bypass_cache=True)
+    return result, time.perf_counter() - start
+
+def run(hedging, hedge_policy=None):
+    texts = [SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)] for i in range(REQUESTS)]
+    sarvam_before = get_vendor_metrics()["sarvam"]["requests"]
+    client = vendor_clients.async_sarvam_client
+    with patched(pipeline, SARVAM_HEDGING=hedging), patched(client, hedging=hedge_policy or client.hedging), \
+            ThreadPoolExecutor(CONCURRENCY) as executor:
+        outcomes = list(executor.map(translate, texts))
+    return outcomes, get_vendor_metrics()["sarvam"]["requests"] - sarvam_before
+
+def check_both_failed():
+    """A request whose primary and hedge both time out raises, and is not counted as a hedge win"""
+    policy = HedgePolicy(min_samples=1, max_rate=1.0)
+    policy.record_latency(0.01)
+    with StubServer(latency=0.5) as server:
+        client = AsyncVendorClient("hedge-check", server.base_url, read_timeout=0.2, hedging=policy)
+        async def post():
+            try:
+                return await client.post_hedged("/translate", json={"input": "Join now"})
+            finally:
+                await client.aclose()
+        try:
+            asyncio.run(post())
+            raised = False
+        except httpx.TimeoutException:
+            raised = True
+    stats = policy.metrics()
+    return raised and stats["hedged"] == 1 and stats["hedge_wins"] == 0, stats
+
+def percentile(latencies, p):
+    return statistics.quantiles(latencies, n=100)[p - 1]
+
+def main():
+    failures = 0
+    both_failed_ok, both_failed_stats = check_both_failed()
+    if not both_failed_ok:
+        failures += 1
+        print(f"FAIL primary and hedge both timed out: {both_failed_stats}")
+    # The default rate limit would dominate these latencies
+    with stub_pipeline() as server, patched(vendor_clients.sarvam_policy.rate_limiter, rate_per_second=0):
+        # Both runs see the same latency sequence
+        server.httpd.latency_sampler = make_latency_sampler(1)
+        plain, plain_requests = run(hedging=False)
+        server.httpd.latency_sampler = make_latency_sampler(1)
+        # A window holding every sample, so each request sent can be matched to its recorded latency
+        hedge_policy = HedgePolicy(window=REQUESTS * 2)
+        hedged, hedged_requests = run(hedging=True, hedge_policy=hedge_policy)
+        # Hedging everything past the median would duplicate half the requests; the cap must hold
+        greedy_policy = HedgePolicy(percentile=50, max_rate=0.1)
+        greedy, greedy_requests = run(hedging=True, hedge_policy=greedy_policy)
+
+    expected = [result for result, _ in plain]
+    for label, outcomes in [("hedged", hedged), ("greedy hedged", greedy)]:
+        if [result for result, _ in outcomes] != expected:
+            failures += 1
+            print(f"FAIL {label} translations differ from unhedged ones")
+    hedge_stats = hedge_policy.metrics()
+    greedy_stats = greedy_policy.metrics()
+    for policy, stats in [(hedge_policy, hedge_stats), (greedy_policy, greedy_stats)]:
+        if stats["hedged"] > stats["requests"] * policy.max_rate:
+            failures += 1
+            print(f"FAIL hedge rate above its cap: {stats}")
+    if len(hedge_policy._latencies) != hedged_requests:
+        failures += 1
+        print(f"FAIL {len(hedge_policy._latencies)} latencies recorded for {hedged_requests} Sarvam requests (cancelled ones missing)")
+    if greedy_requests > REQUESTS * (1 + greedy_policy.max_rate):
+        failures += 1
+        print(f"FAIL {greedy_requests} Sarvam requests for {REQUESTS} translations with a {greedy_policy.max_rate:.0%} cap")
+
+    plain_latencies = [latency for _, latency in plain]
+    hedged_latencies = [latency for _, latency in hedged]
+    if percentile(hedged_latencies, 99) >= percentile(plain_latencies, 99):
+        failures += 1
+        print("FAIL hedging did not improve p99")
+
+    print(f"Hedging check: {failures} failures")
+    print(f"{REQUESTS} Sarvam translations, {CONCURRENCY} at a time, {SLOW_SHARE:.0%} stalling for {SLOW_SECONDS:.1f}s:")
+    for label, latencies, requests_sent in [("unhedged", plain_latencies, plain_requests), ("hedged", hedged_latencies, hedged_requests)]:
+        print(f"  {label:9} p50 {percentile(latencies, 50) * 1000:7.1f} ms   p95 {percentile(latencies, 95) * 1000:7.1f} ms   "
+              f"p99 {percentile(latencies, 99) * 1000:7.1f} ms   {requests_sent} requests sent")
+    print(f"  hedging at p{hedge_policy.percentile:.0f}: {hedge_stats['hedged']} hedged ({hedge_stats['hedge_rate']:.1%}), "
+          f"{hedge_stats['hedge_wins']} won by the duplicate, {hedge_stats['capped']} refused by the cap")
+    print(f"  hedging at p50 with a {greedy_policy.max_rate:.0%} cap: {greedy_stats['hedged']} hedged, {greedy_stats['capped']} refused, "
+          f"{greedy_requests} requests sent")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Benchmark: one message into all campaign languages, one language after another vs fanned out
+# Runs against the local stub server with a fixed per-call latency standing in for the vendors.
+# Doubles as the output check: every language must match its single-language sync result.
+# Run from the repo root: python -m benchmarks.bench_multi_target
+
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.bench_async_pipeline import STUB_LATENCY_SECONDS
+from benchmarks.harness import patched, stub_pipeline
+
+CAMPAIGN_TARGETS = ["hi-IN", "ta-IN", "te-IN", "ml-IN", "kn-IN", "or-IN"]
+MESSAGE = "💛 The FRND Meeting is happening now! From call tips to earnings to what's new on the app — it's all being discussed live! 🎯 Jump in now if you haven't already!"
+
+def translate_one_language(target_lang):
+    sarvam = pipeline.translate_text(MESSAGE, "en-IN", target_lang, "Male", "modern-colloquial", bypass_cache=True)
+    final, gpt_error = pipeline.chatgpt_quality_check_and_improve(MESSAGE, sarvam, target_lang, "modern-colloquial", "", "", 2, bypass_cache=True)
+    return sarvam, final, gpt_error
+
+def fan_out(target_langs):
+    return pipeline.translate_all_targets(MESSAGE, "en-IN", target_langs, "Male", "modern-colloquial", bypass_cache=True)
+
+def timed(run):
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+def main():
+    # Every language gets its ChatGPT review, as in the one-after-another baseline
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS), patched(pipeline, QA_SKIP_CONFIDENCE=2.0):
+        fan_out(CAMPAIGN_TARGETS[:1])
+
+        sequential, sequential_time = timed(lambda: {target: translate_one_language(target) for target in CAMPAIGN_TARGETS})
+        single_times = [timed(lambda: fan_out([target]))[1] for target in CAMPAIGN_TARGETS]
+        fanned_out, fan_out_time = timed(lambda: fan_out(CAMPAIGN_TARGETS))
+
+    mismatches = 0
+    for target in CAMPAIGN_TARGETS:
+        result = fanned_out[target]
+        if (result.sarvam_translation, result.final_translation, result.gpt_error) != sequential[target]:
+            mismatches += 1
+            print(f"MISMATCH [{target}]\n  sequential: {sequential[target]!r}\n  fanned out: {result!r}")
+
+    print(f"Output check: {mismatches} mismatches across {len(CAMPAIGN_TARGETS)} languages")
+    print(f"{len(CAMPAIGN_TARGETS)} languages x 2 vendor calls at {STUB_LATENCY_SECONDS * 1000:.0f} ms each")
+    print(f"  one language after another: {sequential_time:6.2f} s")
+    print(f"  slowest single language:    {max(single_times):6.2f} s")
+    print(f"  all languages fanned out:   {fan_out_time:6.2f} s")
+
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
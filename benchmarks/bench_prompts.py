@@ -0,0 +1,81 @@
+# Report: ChatGPT review prompts with every training example vs context-selected, token-budgeted examples
+# Prompt tokens and build time over the sample corpus, plus review latency against the local stub
+# server, whose delay grows with prompt length (a stand-in for the vendor's per-token cost).
+# Run from the repo root: python -m benchmarks.bench_prompts
+
+import statistics
+import time
+
+import translation_enhancements as enhancements
+import translation_pipeline as pipeline
+from benchmarks import legacy
+from benchmarks.corpus import SAMPLE_MESSAGES, TARGET_LANGUAGES
+from benchmarks.harness import patched, stub_pipeline
+
+MODE = "modern-colloquial"
+FORMALITY = 3
+BUILD_REPEATS = 20
+LATENCY_PER_CHAR_SECONDS = 0.00005
+LATENCY_MESSAGES = SAMPLE_MESSAGES[:8]
+MESSAGE_CONTEXTS = {text: enhancements.build_message_context(text) for text in SAMPLE_MESSAGES}
+
+def legacy_builder(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, message_context=None, rule_pack=None):
+    # The old builder took no message context or rule pack: it always inlined every example from its own tables
+    return legacy.get_enhanced_chatgpt_prompt_with_training(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints)
+
+def build_all(builder, target_lang, hints):
+    # Callers already hold the message context they built for the Sarvam step
+    return [builder(text, text, target_lang, MODE, "", "", FORMALITY, hints[text], MESSAGE_CONTEXTS[text]) for text in SAMPLE_MESSAGES]
+
+def time_builds(builder, target_lang, hints):
+    start = time.perf_counter()
+    for _ in range(BUILD_REPEATS):
+        build_all(builder, target_lang, hints)
+    return (time.perf_counter() - start) / (BUILD_REPEATS * len(SAMPLE_MESSAGES)) * 1e6
+
+def review_latency(target_lang):
+    start = time.perf_counter()
+    for text in LATENCY_MESSAGES:
+        pipeline.chatgpt_quality_check_and_improve(text, text, target_lang, MODE, "", "", FORMALITY, bypass_cache=True)
+    return (time.perf_counter() - start) / len(LATENCY_MESSAGES) * 1000
+
+def main():
+    print(f"Prompt budget {enhancements.CHATGPT_PROMPT_TOKEN_BUDGET} tokens, {len(SAMPLE_MESSAGES)} messages per language")
+    print(f"{'lang':6} {'tokens old':>10} {'new':>6} {'cut':>5} {'max new':>8} {'examples old':>13} {'new':>5} "
+          f"{'build old':>10} {'new':>8} {'review old':>11} {'new':>8}")
+
+    selected_builder = pipeline.get_enhanced_chatgpt_prompt_with_training
+    over_budget = 0
+    all_old, all_new = [], []
+    with stub_pipeline(latency_per_char=LATENCY_PER_CHAR_SECONDS):
+        review_latency(TARGET_LANGUAGES[0])
+
+        for target_lang in TARGET_LANGUAGES:
+            hints = {text: enhancements.build_context_hints(text, target_lang) for text in SAMPLE_MESSAGES}
+            old_prompts = build_all(legacy_builder, target_lang, hints)
+            new_prompts = build_all(selected_builder, target_lang, hints)
+            old_tokens = [enhancements.estimate_prompt_tokens(prompt) for prompt in old_prompts]
+            new_tokens = [enhancements.estimate_prompt_tokens(prompt) for prompt in new_prompts]
+            over_budget += sum(1 for tokens in new_tokens if tokens > enhancements.CHATGPT_PROMPT_TOKEN_BUDGET)
+            all_old += old_tokens
+            all_new += new_tokens
+
+            old_build = time_builds(legacy_builder, target_lang, hints)
+            new_build = time_builds(selected_builder, target_lang, hints)
+
+            with patched(pipeline, get_enhanced_chatgpt_prompt_with_training=legacy_builder):
+                old_review = review_latency(target_lang)
+            new_review = review_latency(target_lang)
+
+            old_mean, new_mean = statistics.mean(old_tokens), statistics.mean(new_tokens)
+            print(f"{target_lang:6} {old_mean:10.0f} {new_mean:6.0f} {1 - new_mean / old_mean:5.0%} {max(new_tokens):8} "
+                  f"{statistics.mean(p.count('English: ') for p in old_prompts):13.1f} {statistics.mean(p.count('English: ') for p in new_prompts):5.1f} "
+                  f"{old_build:8.1f}us {new_build:6.1f}us {old_review:9.0f}ms {new_review:6.0f}ms")
+
+    print(f"All languages: {statistics.mean(all_old):.0f} -> {statistics.mean(all_new):.0f} tokens per prompt "
+          f"({1 - statistics.mean(all_new) / statistics.mean(all_old):.0%} fewer), {over_budget} prompts over budget")
+    if over_budget:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Check: the confidence gate in front of the ChatGPT review, and the calls and time it saves
+# Runs the multi-language pipeline against the local stub server with the gate on and off.
+# Run from the repo root: python -m benchmarks.bench_qa_gate
+
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.bench_async_pipeline import STUB_LATENCY_SECONDS
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import patched, stub_pipeline
+from translation_enhancements import build_message_context
+from vendor_clients import get_vendor_metrics
+
+TARGET_LANGS = ["hi-IN", "ta-IN"]
+# No confidence reaches this, so every translation is reviewed as before the gate
+GATE_OFF = 2.0
+
+def lowercase_sarvam(text):
+    # Loses "LIVE" and "WhatsApp Channel", so those messages get quality flags; placeholders keep their case
+    return text.lower().replace("<pw", "<PW")
+
+GATE_CASES = [
+    # (confidence, quality flags, Message Type, review expected)
+    (1.0, [], "", False),
+    (1.0, [], "Marketing/Promotional", False),
+    (0.8, [], "", True),
+    (1.0, ["📺 'LIVE' should be preserved in all caps"], "", True),
+    (1.0, [], "Payment/Financial", True),
+]
+
+DETECTED_CASES = [
+    # (message, review expected) with no Message Type picked: the detected context's threshold applies
+    ("Earn real money in your wallet tonight", False),
+    ("Your salary and income are credited", True),
+    ("We're live! Join now!", False),
+]
+
+def check_gate_decisions():
+    failures = 0
+    for confidence, quality_flags, context_type, expected in GATE_CASES:
+        if pipeline.should_run_chatgpt_qa(confidence, quality_flags, context_type) != expected:
+            failures += 1
+            print(f"FAIL gate({confidence}, {quality_flags}, {context_type!r}) should be {expected}")
+    for text, expected in DETECTED_CASES:
+        if pipeline.should_run_chatgpt_qa(1.0, [], "", build_message_context(text)) != expected:
+            failures += 1
+            print(f"FAIL gate for detected context of {text!r} should be {expected}")
+    return failures
+
+def run_campaign(skip_confidence):
+    openai_before = get_vendor_metrics()["openai"]["requests"]
+    start = time.perf_counter()
+    with patched(pipeline, QA_SKIP_CONFIDENCE=skip_confidence):
+        results = [
+            pipeline.translate_all_targets(text, "en-IN", TARGET_LANGS, "Male", "modern-colloquial", bypass_cache=True)
+            for text in SAMPLE_MESSAGES
+        ]
+    elapsed = time.perf_counter() - start
+    return results, elapsed, get_vendor_metrics()["openai"]["requests"] - openai_before
+
+def main():
+    failures = check_gate_decisions()
+    default_skip_confidence = pipeline.QA_SKIP_CONFIDENCE
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS, sarvam_transform=lowercase_sarvam):
+        run_campaign(GATE_OFF)
+
+        reviewed, reviewed_time, reviewed_calls = run_campaign(GATE_OFF)
+        gated, gated_time, gated_calls = run_campaign(default_skip_confidence)
+
+    skipped = 0
+    for by_lang in gated:
+        for result in by_lang.values():
+            if result.gpt_status != pipeline.QA_SKIPPED_STATUS:
+                continue
+            skipped += 1
+            if result.final_translation != result.sarvam_translation or result.gpt_error:
+                failures += 1
+                print(f"FAIL skipped review changed the output: {result!r}")
+    if gated_calls != reviewed_calls - skipped:
+        failures += 1
+        print(f"FAIL {gated_calls} ChatGPT calls with the gate, expected {reviewed_calls - skipped}")
+
+    translations = len(SAMPLE_MESSAGES) * len(TARGET_LANGS)
+    print(f"Gate check: {failures} failures")
+    print(f"{translations} translations, {STUB_LATENCY_SECONDS * 1000:.0f} ms per vendor call, skip at confidence >= {default_skip_confidence}")
+    print(f"  always reviewed: {reviewed_time:6.2f} s, {reviewed_calls} ChatGPT calls")
+    print(f"  gated:           {gated_time:6.2f} s, {gated_calls} ChatGPT calls ({skipped} skipped)")
+    print(f"  gate counters: {pipeline.get_qa_gate_stats()['by_reason']}")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
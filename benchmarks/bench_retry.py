@@ -0,0 +1,100 @@
+# Check: vendor client retries, Retry-After handling and token-bucket rate limiting
+# Runs the sync and async clients against the local stub server with scripted failures.
+# Run from the repo root: python -m benchmarks.bench_retry
+
+import asyncio
+import socket
+import time
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from vendor_clients import AsyncVendorClient, VendorClient, VendorPolicy
+
+PAYLOAD = {"input": "We're LIVE! Join now!"}
+
+def make_client(server, client_class=VendorClient, rate_per_second=0, burst=1):
+    # Short backoff so the scripted failures do not slow the check down
+    policy = VendorPolicy("stub", rate_per_second, burst, max_attempts=3, backoff_base=0.05, backoff_max=0.2)
+    return client_class("stub", server.base_url, read_timeout=10, policy=policy)
+
+def timed(run):
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+def check(failures, name, passed, detail):
+    print(f"{'ok  ' if passed else 'FAIL'} {name:44} {detail}")
+    if not passed:
+        failures.append(name)
+
+def main():
+    failures = []
+
+    with StubServer(fault_statuses=[503, 429]) as server:
+        client = make_client(server)
+        response = client.post("/translate", json=PAYLOAD)
+        metrics = client.policy.metrics()
+        check(failures, "transient 503 + 429 recovered", response.status_code == 200 and metrics["retries"] == 2,
+              f"status {response.status_code}, {metrics['retries_by_reason']}")
+
+    with StubServer(fault_statuses=[503, 503, 503]) as server:
+        client = make_client(server)
+        response = client.post("/translate", json=PAYLOAD)
+        metrics = client.policy.metrics()
+        check(failures, "gives up after max attempts", response.status_code == 503 and metrics["gave_up"] == 1,
+              f"status {response.status_code} after {metrics['requests']} attempts")
+
+    with StubServer(fault_statuses=[400]) as server:
+        client = make_client(server)
+        response = client.post("/translate", json=PAYLOAD)
+        check(failures, "400 is not retried", response.status_code == 400 and client.policy.metrics()["requests"] == 1,
+              f"status {response.status_code}")
+
+    with StubServer(fault_statuses=[429], retry_after=1) as server:
+        client = make_client(server)
+        response, elapsed = timed(lambda: client.post("/translate", json=PAYLOAD))
+        check(failures, "Retry-After: 1 is honored", response.status_code == 200 and elapsed >= 1.0,
+              f"status {response.status_code} after {elapsed:.2f}s")
+
+    with StubServer(fault_statuses=[429], retry_after=3600) as server:
+        client = make_client(server)
+        response, elapsed = timed(lambda: client.post("/translate", json=PAYLOAD))
+        check(failures, "Retry-After: 3600 is not waited for", response.status_code == 429 and elapsed < 1.0,
+              f"status {response.status_code} after {elapsed:.2f}s")
+
+    with StubServer(fault_statuses=[502, 504]) as server:
+        client = make_client(server, AsyncVendorClient)
+        response = asyncio.run(client.post("/translate", json=PAYLOAD))
+        metrics = client.policy.metrics()
+        check(failures, "async client recovers too", response.status_code == 200 and metrics["retries"] == 2,
+              f"status {response.status_code}, {metrics['retries_by_reason']}")
+
+    # A port nothing listens on: connection errors are retried, then raised
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        closed_port = probe.getsockname()[1]
+    client = VendorClient("stub", f"http://127.0.0.1:{closed_port}", read_timeout=10,
+                          policy=VendorPolicy("stub", 0, 1, max_attempts=3, backoff_base=0.05, backoff_max=0.2))
+    try:
+        client.post("/translate", json=PAYLOAD)
+        raised = False
+    except requests.exceptions.ConnectionError:
+        raised = True
+    metrics = client.policy.metrics()
+    check(failures, "connection refused retried, then raised", raised and metrics["retries_by_reason"] == {"connection_error": 2},
+          f"{metrics['requests']} attempts")
+
+    requests_sent, rate, burst = 40, 20, 5
+    with StubServer() as server:
+        client = make_client(server, rate_per_second=rate, burst=burst)
+        _, elapsed = timed(lambda: [client.post("/translate", json=PAYLOAD) for _ in range(requests_sent)])
+        expected = (requests_sent - burst) / rate
+        check(failures, f"{requests_sent} requests at {rate}/s (burst {burst})", expected * 0.9 <= elapsed <= expected + 1.0,
+              f"{elapsed:.2f}s (expected ~{expected:.2f}s), waited {client.policy.metrics()['rate_limit_wait_seconds']:.2f}s for tokens")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Check: the streamed ChatGPT review gives the same result as the whole-response call, sooner on screen
+# Compares time to first visible output with the non-streaming call's time to any output,
+# against the local stub server with per-chunk generation time.
+# Run from the repo root: python -m benchmarks.bench_streaming
+
+import statistics
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.bench_async_pipeline import STUB_LATENCY_SECONDS
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import stub_pipeline
+
+TARGET_LANG = "hi-IN"
+MODE = "code-mixed"
+# Roughly a few tokens every 20 ms, like a real completion
+STREAM_CHUNK_CHARS = 8
+STREAM_CHUNK_DELAY_SECONDS = 0.02
+
+def review(text, sarvam, stream, on_delta=None):
+    if stream:
+        return pipeline.chatgpt_quality_check_and_improve_stream(
+            text, sarvam, TARGET_LANG, MODE, "", "", 2, bypass_cache=True, on_delta=on_delta
+        )
+    return pipeline.chatgpt_quality_check_and_improve(text, sarvam, TARGET_LANG, MODE, "", "", 2, bypass_cache=True)
+
+def check_message(text, timings):
+    failures = 0
+    sarvam = pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", MODE, bypass_cache=True)
+
+    start = time.perf_counter()
+    expected = review(text, sarvam, stream=False)
+    timings["whole"].append(time.perf_counter() - start)
+
+    updates = []
+    start = time.perf_counter()
+    def on_delta(text_so_far):
+        if not updates:
+            timings["first_output"].append(time.perf_counter() - start)
+        updates.append(text_so_far)
+    streamed = review(text, sarvam, stream=True, on_delta=on_delta)
+    timings["streamed"].append(time.perf_counter() - start)
+
+    if streamed != expected:
+        failures += 1
+        print(f"FAIL streamed result differs:\n  {streamed!r}\n  {expected!r}")
+    if not updates or any(not later.startswith(earlier) for earlier, later in zip(updates, updates[1:])):
+        failures += 1
+        print(f"FAIL on_delta did not receive a growing reply: {updates!r}")
+    return failures
+
+def check_errors(server):
+    """A rejected stream falls back to the cleaned Sarvam output like the whole-response call"""
+    text = SAMPLE_MESSAGES[0]
+    sarvam = pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", MODE, bypass_cache=True)
+    server.httpd.faults = [400]
+    streamed = review(text, sarvam, stream=True)
+    server.httpd.faults = [400]
+    expected = review(text, sarvam, stream=False)
+    if streamed != expected:
+        print(f"FAIL rejected stream: {streamed!r} != {expected!r}")
+        return 1
+    return 0
+
+def main():
+    timings = {"whole": [], "first_output": [], "streamed": []}
+    failures = 0
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS, stream_chunk_chars=STREAM_CHUNK_CHARS,
+                       stream_chunk_delay=STREAM_CHUNK_DELAY_SECONDS) as server:
+        for text in SAMPLE_MESSAGES:
+            failures += check_message(text, timings)
+        failures += check_errors(server)
+
+    print(f"Streaming check: {failures} failures over {len(SAMPLE_MESSAGES)} messages")
+    print(f"ChatGPT review, {STUB_LATENCY_SECONDS * 1000:.0f} ms latency + {STREAM_CHUNK_DELAY_SECONDS * 1000:.0f} ms per {STREAM_CHUNK_CHARS}-char chunk (median):")
+    print(f"  whole response, first output:  {statistics.median(timings['whole']) * 1000:7.1f} ms")
+    print(f"  streamed, first output:        {statistics.median(timings['first_output']) * 1000:7.1f} ms")
+    print(f"  streamed, complete:            {statistics.median(timings['streamed']) * 1000:7.1f} ms")
+    print(f"  recorded: {pipeline.get_streaming_stats()}")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Benchmark: fused training-fix scan vs one re.sub per LAYER1/2/3_TRAINING_FIXES phrase
+# Doubles as the output check: the fused scan must match the layer-by-layer loop
+# Run from the repo root: python -m benchmarks.bench_training_fixes
+
+import re
+import time
+
+import translation_enhancements as enhancements
+from benchmarks import legacy
+from benchmarks.corpus import SAMPLE_MESSAGES, SAMPLE_OUTPUTS, TARGET_LANGUAGES
+
+CORPUS = SAMPLE_OUTPUTS + SAMPLE_MESSAGES
+
+def legacy_training_fixes(text, target_lang):
+    text = legacy.apply_training_based_quality_fixes(text, target_lang)
+    text = legacy.apply_additional_training_fixes(text, target_lang)
+    return legacy.apply_festival_training_fixes(text, target_lang)
+
+def fused_training_fixes(text, target_lang):
+    return enhancements.get_compiled_rule_set("training_fixes", target_lang, None).apply(text)
+
+def check_identical_output():
+    mismatches = 0
+    for target_lang in TARGET_LANGUAGES:
+        for text in CORPUS:
+            # Fused scan and each single-layer scan against the old loops
+            checks = [
+                (legacy_training_fixes, fused_training_fixes),
+                (legacy.apply_training_based_quality_fixes, enhancements.apply_training_based_quality_fixes),
+                (legacy.apply_additional_training_fixes, enhancements.apply_additional_training_fixes),
+                (legacy.apply_festival_training_fixes, enhancements.apply_festival_training_fixes),
+            ]
+            for old, new in checks:
+                expected = old(text, target_lang)
+                actual = new(text, target_lang)
+                if expected != actual:
+                    mismatches += 1
+                    print(f"MISMATCH {new.__name__} [{target_lang}]: {text!r}\n  legacy: {expected!r}\n  fused:  {actual!r}")
+    return mismatches
+
+def time_per_text(apply_fixes, rounds=20):
+    elapsed = 0.0
+    texts_run = 0
+    for _ in range(rounds):
+        for target_lang in TARGET_LANGUAGES:
+            for text in CORPUS:
+                re.purge()
+                start = time.perf_counter()
+                apply_fixes(text, target_lang)
+                elapsed += time.perf_counter() - start
+                texts_run += 1
+    return elapsed / texts_run
+
+def main():
+    mismatches = check_identical_output()
+    print(f"Output check: {mismatches} mismatches across {len(CORPUS) * len(TARGET_LANGUAGES)} text/language pairs")
+
+    for target_lang in TARGET_LANGUAGES:
+        rule_set = enhancements.get_compiled_rule_set("training_fixes", target_lang, None)
+        print(f"  {target_lang}: {len(rule_set)} phrases in {len(rule_set.stages)} scan(s)")
+
+    legacy_time = time_per_text(legacy_training_fixes)
+    fused_time = time_per_text(fused_training_fixes)
+
+    print(f"One re.sub per phrase: {legacy_time * 1e6:8.1f} µs/text")
+    print(f"Fused scan:            {fused_time * 1e6:8.1f} µs/text")
+    print(f"Speedup:               {legacy_time / fused_time:8.1f}x")
+
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
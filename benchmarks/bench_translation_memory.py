@@ -0,0 +1,121 @@
+# Benchmark: campaign messages built from already-approved lines, with and without the translation memory
+# Runs against the local stub server with a fixed per-call latency standing in for the vendors.
+# Doubles as the output check: approved lines come back verbatim, in order, only new lines reach Sarvam,
+# and near matches are never served from the memory.
+# Run from the repo root: python -m benchmarks.bench_translation_memory
+
+import time
+
+import translation_pipeline as pipeline
+from benchmarks.bench_async_pipeline import STUB_LATENCY_SECONDS
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import stub_pipeline
+from translation_cache import CHATGPT_STAGE, SARVAM_STAGE
+from translation_enhancements import clean_translation_output
+from translation_memory import TranslationMemory
+from vendor_clients import get_vendor_metrics
+
+TARGET_LANG = "hi-IN"
+MODE = "code-mixed"
+APPROVED = SAMPLE_MESSAGES[:16]
+NEW_LINES = SAMPLE_MESSAGES[16:24]
+
+def approved_translation(line):
+    # Marked so memory lines can be told apart from the stub's echo, and cleaned like a real approved output
+    return clean_translation_output(f"✓ {line}", TARGET_LANG)
+
+def collapse_whitespace(text):
+    return " ".join(text.split())
+
+def campaign_messages():
+    """Multi-line messages: some fully approved, some mixing approved and new lines, then the near variants"""
+    messages = ["\n".join(APPROVED[i:i + 3]) for i in range(0, 12, 3)]
+    messages += [f"{APPROVED[i]}\n{NEW_LINES[i]}\n{APPROVED[i + 1]}" for i in range(4)]
+    return messages + [variant for variant, _ in NEAR_VARIANTS]
+
+# A punctuation-only variant gets a review suggestion; variants with other amounts or names get none.
+# None of them may be served from the memory.
+NEAR_VARIANTS = [
+    (APPROVED[2].replace("already!", "already!!"), True),
+    (APPROVED[7].replace("₹40K", "₹50K"), False),
+    (APPROVED[11].replace("₹1000", "₹100"), False),
+    (APPROVED[4].replace("[Name]", "[Friend]"), False),
+]
+
+# Cleanup joins the first two lines and re-breaks at the sentence end: two lines each, not line by line
+REFLOWED_SOURCE = "Go online now\nEarn real money. Join the session!"
+REFLOWED_TRANSLATION = "Abhi online jao\nAsli paise kamao. Session join karo!"
+
+def check_reflowed_translation():
+    """A cleaned multi-line translation is stored whole, never as misaligned line pairs"""
+    memory = TranslationMemory()
+    cleaned = clean_translation_output(REFLOWED_TRANSLATION, TARGET_LANG)
+    memory.add_translation(REFLOWED_SOURCE, cleaned, TARGET_LANG, MODE)
+    failures = 0
+    for line in REFLOWED_SOURCE.split("\n"):
+        if memory.lookup(line, TARGET_LANG, MODE) is not None:
+            failures += 1
+            print(f"MISALIGNED PAIR: {line!r} -> {memory.lookup(line, TARGET_LANG, MODE)!r} (from {cleaned!r})")
+    if memory.lookup_lines(REFLOWED_SOURCE, TARGET_LANG, MODE) != [(REFLOWED_SOURCE, cleaned)]:
+        failures += 1
+        print(f"WHOLE MESSAGE NOT SERVED: {memory.lookup_lines(REFLOWED_SOURCE, TARGET_LANG, MODE)!r}")
+    return failures
+
+def translate_and_review(text, bypass):
+    sarvam = pipeline.translate_text(text, "en-IN", TARGET_LANG, "Male", MODE, bypass_cache=bypass)
+    return pipeline.chatgpt_quality_check_and_improve(text, sarvam, TARGET_LANG, MODE, "", "", 2, bypass_cache=bypass)
+
+def vendor_requests():
+    return {vendor: metrics["requests"] for vendor, metrics in get_vendor_metrics().items()}
+
+def run(messages, bypass):
+    before = vendor_requests()
+    start = time.perf_counter()
+    results = [translate_and_review(text, bypass) for text in messages]
+    elapsed = time.perf_counter() - start
+    after = vendor_requests()
+    return results, elapsed, {vendor: after[vendor] - before[vendor] for vendor in after}
+
+def main():
+    messages = campaign_messages()
+    failures = check_reflowed_translation()
+    with stub_pipeline(latency=STUB_LATENCY_SECONDS):
+        memory = pipeline.translation_memory
+        for line in APPROVED:
+            memory.add_translation(line, approved_translation(line), TARGET_LANG, MODE)
+        translate_and_review(NEW_LINES[-1], True)
+
+        # bypass_cache also bypasses the memory: every line goes to the vendors
+        _, without_time, without_calls = run(messages, True)
+        pipeline.translation_cache.clear()
+        results, with_time, with_calls = run(messages, False)
+
+    for text, (final, _) in zip(messages, results):
+        expected = [approved_translation(line) for line in text.split("\n") if line in APPROVED]
+        positions = [collapse_whitespace(final).find(collapse_whitespace(line)) for line in expected]
+        if -1 in positions or positions != sorted(positions):
+            failures += 1
+            print(f"MISMATCH: approved lines missing or out of order\n  {text!r}\n  {final!r}")
+    served = {collapse_whitespace(approved_translation(line)) for line in APPROVED}
+    for (variant, suggested), (final, _) in zip(NEAR_VARIANTS, results[-len(NEAR_VARIANTS):]):
+        if collapse_whitespace(final) in served:
+            failures += 1
+            print(f"SERVED NEAR MATCH: {variant!r} -> {final!r}")
+        if (memory.suggest(variant, TARGET_LANG, MODE) is not None) != suggested:
+            failures += 1
+            print(f"SUGGESTION {'MISSING' if suggested else 'NOT REFUSED'}: {variant!r}")
+
+    stats = memory.stats()
+    print(f"Output check: {failures} failures across {len(messages)} messages")
+    print(f"{len(messages)} messages, {stats['segments']} approved segments, "
+          f"{STUB_LATENCY_SECONDS * 1000:.0f} ms per vendor call")
+    print(f"  without memory: {without_time:6.2f} s, vendor calls {without_calls}")
+    print(f"  with memory:    {with_time:6.2f} s, vendor calls {with_calls}")
+    print(f"  hit rate {stats['hit_rate']:.0%} ({stats['exact_hits']} exact / {stats['misses']} misses, {stats['suggestions']} suggestions), "
+          f"calls saved: Sarvam {stats['calls_saved'].get(SARVAM_STAGE, 0)}, ChatGPT {stats['calls_saved'].get(CHATGPT_STAGE, 0)}")
+
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
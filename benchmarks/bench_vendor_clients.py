@@ -0,0 +1,59 @@
+# Benchmark: pooled keep-alive vendor clients vs a bare requests.post per call
+# Runs against the local stub server over HTTP and, when openssl is available, HTTPS.
+# A real vendor adds network round trips to every handshake, so the saving there is larger.
+# Run from the repo root: python -m benchmarks.bench_vendor_clients
+
+import time
+
+import requests
+
+from benchmarks.stub_server import StubServer, tls_available
+from vendor_clients import VendorClient
+
+REQUESTS = 200
+PREWARM_CONNECTIONS = 4
+PAYLOAD = {"input": "We're LIVE! Join now!", "source_language_code": "en-IN", "target_language_code": "hi-IN"}
+
+def time_per_request(post):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = post()
+        response.raise_for_status()
+    return (time.perf_counter() - start) / REQUESTS
+
+def compare(tls):
+    with StubServer(tls=tls) as server:
+        verify = server.cert_file or True
+        url = f"{server.base_url}/translate"
+        bare = time_per_request(lambda: requests.post(url, json=PAYLOAD, timeout=10, verify=verify))
+
+        client = VendorClient("stub", server.base_url, read_timeout=10, verify=verify)
+        client.prewarm()
+        pooled = time_per_request(lambda: client.post("/translate", json=PAYLOAD))
+        client.close()
+
+    print(f"{server.scheme.upper():5}  bare requests.post {bare * 1000:7.2f} ms   "
+          f"pooled client {pooled * 1000:7.2f} ms   saved {(bare - pooled) * 1000:6.2f} ms/request")
+
+def check_prewarm():
+    """prewarm(connections=N) must leave N connections open, counted as the stub accepts them"""
+    with StubServer(latency=0.05) as server:
+        accepted = []
+        server.httpd.verify_request = lambda request, client_address: accepted.append(client_address) or True
+        client = VendorClient("stub", server.base_url, read_timeout=10)
+        client.prewarm(connections=PREWARM_CONNECTIONS)
+        client.close()
+    print(f"Prewarm check: {len(accepted)} connections opened for connections={PREWARM_CONNECTIONS}")
+    return len(accepted) == PREWARM_CONNECTIONS
+
+def main():
+    if not check_prewarm():
+        raise SystemExit(1)
+    compare(tls=False)
+    if tls_available():
+        compare(tls=True)
+    else:
+        print("HTTPS  skipped (no openssl to make a test certificate)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Sample FRND messages used by the benchmarks
+# Drawn from the training examples so every context and layer gets exercised
+
+SAMPLE_MESSAGES = [
+    "We're LIVE! Join now!",
+    "Don't miss it! Click & Join the meeting",
+    "💛 The FRND Meeting is happening now! From call tips to earnings to what's new on the app — it's all being discussed live! 🎯 Jump in now if you haven't already!",
+    "FRND Meeting is LIVE right now! Tap to join – useful tips being shared!",
+    "Hi [Name]! 👋 FRND's brand-new WhatsApp Channel is here… and guess what? You're on the special invite list! 🎉",
+    "Be the first to know about discounts. Learn simple ways to connect with your favourite trainer. Get news on campaign, events & surprise rewards",
+    "Joining is completely free and numbers will not be visible to anyone. Click on Join Channel and dont forget to tap on follow. It's that simple & never miss anything fun on FRND!",
+    "Want to earn ₹40K/month? Join our new WhatsApp Channel. All tips here. Click to join!",
+    "Hey! Secret to big earnings? Tired of small earnings? Let's fix that",
+    "New here? You're not alone. Ready to level up? Few days in now and you're doing great",
+    "Go online now and earn real money in your wallet",
+    "Gift Your Bhai ₹1000 Hamper this Rakhi! Make this Rakhi extra special",
+    "Happy Raksha Bandhan! Protect your brother with love. Rakhi special offer inside",
+    "It's a holiday today! Holiday = Time to Earn. Long weekend means peak time",
+    "Tonight's the Night! Why wait? Go online now. Let the spotlight find YOU",
+    "Challenge is ON! Top earners get a special badge. Don't miss out",
+    "Just by Being Online you earn real money. More time = More Yellow Roses",
+    "Surprise! A gift hamper is waiting. Just by being online earn real money in your wallet",
+    "Welcome to FRND! First time here? Tap here to go online",
+    "Click here to level up your badge. Go online for audio & video calls",
+    "Your number stays 100% Private. Number Privacy is our priority, chats are safe and secure",
+    "Start earning today with more money and big earnings from your income",
+    "Update your Profile photo and get Premium Coins with a Recharge",
+    "Audio Call and Video Call are now available on the FRND App",
+    "Join the session tonight at 8 PM for pro tips and call updates",
+    "Really help yourself - amazing session, awesome tips, super earnings update",
+    "We're waiting for you! Let's talk about earnings",
+    "Get ₹ 500 bonus at 4am peak time tonight",
+    "Share the WhatsApp Channel with friends and join now",
+    "Meeting reminder: the live session starts in 10 minutes. Don't miss!",
+    "Hi [Name], and guess what? New here? Ready to level up with us",
+]
+
+# Partially translated vendor output, where the literal training fixes do most work
+SAMPLE_OUTPUTS = [
+    "Hum LIVE hain! Join now aur Click & Join karo. Don't miss it!",
+    "We're LIVE right now - Join now! Click & Join Now",
+    "Want to earn ₹40K/month? Join our new WhatsApp Channel! All tips here. Click to join",
+    "Hey! Secret to big earnings. Tired of small earnings? Let's fix that 💥",
+    "New here? You're not alone. Ready to level up? Few days in now",
+    "Gift Your Bhai ₹1000 Hamper! Just by Being Online earn real money in your wallet",
+    "Holiday = Time to Earn real money in your wallet. It's a holiday today!",
+    "Tonight's the Night! Why wait? Challenge is ON, Top earners ke liye. Let the spotlight find YOU",
+    "FRND Meeting is LIVE right now! Tap to join - Jump in now",
+    "The FRND Meeting is happening now, from call tips to earnings",
+    "Hi [Name]! brand-new WhatsApp Channel, and guess what? special invite list",
+    "Be the first to know about discounts. Learn simple ways to connect with favourite trainer",
+    "completely free, numbers will not be visible, dont forget to tap on follow, never miss anything fun on FRND",
+    "Raksha Bandhan par your brother ko Go online now bolo, peak time hai",
+    "join new WhatsApp Channel and tap to join now, that simple",
+    "JOIN NOW! we're waiting, really help karega, amazing session",
+]
+
+TARGET_LANGUAGES = ["hi-IN", "ta-IN", "te-IN", "ml-IN", "kn-IN", "or-IN"]
@@ -0,0 +1,55 @@
+# Shared setup for the benchmarks that drive the pipeline against stub vendors
+# stub_pipeline() starts a StubServer (or takes the URL of a running one), points every vendor
+# client at it, and gives the pipeline stub API keys, a memory-only cache and an empty
+# translation memory. patched() overrides any other setting for a block. Both put every
+# value back on exit, so a benchmark never leaves the pipeline configured for the stub.
+
+from contextlib import ExitStack, contextmanager
+
+import translation_pipeline as pipeline
+import vendor_clients
+from benchmarks.stub_server import StubServer
+from translation_cache import TranslationCache
+from translation_memory import TranslationMemory
+
+STUB_API_KEY = "stub-key"
+VENDOR_CLIENTS = ["sarvam_client", "openai_client", "async_sarvam_client", "async_openai_client"]
+
+@contextmanager
+def patched(target, **values):
+    """Set attributes of a module or object for the block, then restore their old values"""
+    old_values = {name: getattr(target, name) for name in values}
+    for name, value in values.items():
+        setattr(target, name, value)
+    try:
+        yield target
+    finally:
+        for name, value in old_values.items():
+            setattr(target, name, value)
+
+@contextmanager
+def clients_pointed_at(base_url):
+    """Send every vendor client's requests to base_url for the block"""
+    with ExitStack() as stack:
+        for name in VENDOR_CLIENTS:
+            stack.enter_context(patched(getattr(vendor_clients, name), base_url=base_url))
+        yield
+
+@contextmanager
+def stub_pipeline(base_url=None, sarvam_api_key=STUB_API_KEY, openai_api_key=STUB_API_KEY, **server_options):
+    """Run the block against stub vendors; yields the StubServer (built from server_options), or None for base_url
+
+    The memory-only cache keeps stub results out of the real cache database, and the
+    empty translation memory sends every line to the vendors.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patched(
+            pipeline, SARVAM_API_KEY=sarvam_api_key, OPENAI_API_KEY=openai_api_key,
+            translation_cache=TranslationCache(db_path=""), translation_memory=TranslationMemory()
+        ))
+        server = None
+        if base_url is None:
+            server = stack.enter_context(StubServer(**server_options))
+            base_url = server.base_url
+        stack.enter_context(clients_pointed_at(base_url))
+        yield server
@@ -0,0 +1,714 @@
+# Baseline implementations kept as a reference for the benchmarks
+# Benchmarks check the optimized pipeline against these for identical output
+
+import re
+
+from translation_enhancements import build_message_context, get_active_rule_pack
+
+# The same tables the optimized pipeline loads from rules/
+_TABLES = get_active_rule_pack().tables
+QUALITY_TRAINING_PATTERNS = _TABLES["quality_training_patterns"]
+ADDITIONAL_QUALITY_PATTERNS = _TABLES["additional_quality_patterns"]
+FESTIVAL_QUALITY_PATTERNS = _TABLES["festival_quality_patterns"]
+TEAM_TRAINING_CORRECTIONS = _TABLES["team_training_corrections"]
+LAYER1_TRAINING_FIXES = _TABLES["layer1_training_fixes"]
+LAYER2_TRAINING_FIXES = _TABLES["layer2_training_fixes"]
+LAYER3_TRAINING_FIXES = _TABLES["layer3_training_fixes"]
+
+def detect_message_context_type(text):
+    """Detect the type of message for better context application"""
+    text_lower = text.lower()
+    
+    # Festival/Holiday context (highest priority)
+    if any(word in text_lower for word in ["rakhi", "raksha bandhan", "brother", "bhai"]):
+        return "rakhi_festival"
+    if any(word in text_lower for word in ["holiday", "weekend", "vacation"]):
+        return "holiday_celebration"
+    if any(word in text_lower for word in ["gift", "hamper", "surprise"]):
+        return "gift_giving"
+    if any(word in text_lower for word in ["challenge", "top earner", "rank", "spotlight"]):
+        return "festival_competition"
+    if any(word in text_lower for word in ["tonight", "peak time", "4am", "bonus"]):
+        return "time_sensitive_promo"
+    
+    # WhatsApp Channel promotion
+    if "whatsapp channel" in text_lower or "channel" in text_lower:
+        return "whatsapp_promotion"
+    
+    # Meeting/Live context  
+    if any(word in text_lower for word in ["meeting", "live", "happening now", "tap to join"]):
+        return "meeting_live"
+    
+    # Earnings/Money focused
+    if any(word in text_lower for word in ["earn", "₹", "money", "income", "salary"]):
+        return "earnings_focused"
+    
+    # Welcome/Onboarding
+    if any(word in text_lower for word in ["welcome", "new here", "first time"]):
+        return "welcome_onboarding"
+    
+    # App feature explanation
+    if any(word in text_lower for word in ["tap here", "click", "go online", "badge", "level up"]):
+        return "app_features"
+    
+    # Privacy/Safety messaging
+    if any(word in text_lower for word in ["private", "privacy", "safe", "secure"]):
+        return "privacy_safety"
+    
+    return "general"
+
+# -------------------- PATTERN APPLICATION FUNCTIONS -------------------- #
+
+def apply_quality_training_patterns(text, target_lang):
+    """Apply Layer 1 training patterns with team corrections"""
+    lang_code = target_lang.split('-')[0].lower()
+    if lang_code not in ["hi", "ta", "te", "ml", "kn"]:
+        return text
+    
+    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada"}
+    pattern_key = pattern_map.get(lang_code)
+    if not pattern_key or pattern_key not in QUALITY_TRAINING_PATTERNS:
+        return text
+    
+    patterns = QUALITY_TRAINING_PATTERNS[pattern_key]
+    message_context = detect_message_context_type(text)
+    
+    # Apply basic patterns
+    if "preferred_mixing" in patterns:
+        for english_word, preferred_translation in patterns["preferred_mixing"]:
+            text = re.sub(f"\\b{re.escape(english_word)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    
+    # Apply meeting-specific patterns for Malayalam (from team training)
+    if target_lang == "ml-IN" and message_context == "meeting_live":
+        if "meeting_specific" in patterns:
+            for english_phrase, preferred_translation in patterns["meeting_specific"]:
+                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+def apply_additional_quality_patterns(text, target_lang):
+    """Apply Layer 2 training patterns with team corrections"""
+    lang_code = target_lang.split('-')[0].lower()
+    if lang_code not in ["hi", "ta", "te", "ml", "kn"]:
+        return text
+    
+    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada"}
+    pattern_key = pattern_map.get(lang_code)
+    if not pattern_key or pattern_key not in ADDITIONAL_QUALITY_PATTERNS:
+        return text
+    
+    patterns = ADDITIONAL_QUALITY_PATTERNS[pattern_key]
+    message_context = detect_message_context_type(text)
+    
+    # Apply context-specific patterns
+    if message_context == "whatsapp_promotion" and "whatsapp_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["whatsapp_patterns"]:
+            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    # Apply channel-specific patterns for Malayalam and Kannada (from team training)
+    if message_context == "whatsapp_promotion":
+        if target_lang == "ml-IN" and "channel_specific" in patterns:
+            for english_phrase, preferred_translation in patterns["channel_specific"]:
+                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+        elif target_lang == "kn-IN" and "channel_specific" in patterns:
+            for english_phrase, preferred_translation in patterns["channel_specific"]:
+                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    if message_context == "earnings_focused" and "earnings_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["earnings_patterns"]:
+            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    
+    if message_context in ["welcome_onboarding", "general"] and "casual_connectors" in patterns:
+        for english_phrase, preferred_translation in patterns["casual_connectors"]:
+            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    if message_context == "app_features" and "app_tech_terms" in patterns:
+        for english_phrase, preferred_translation in patterns["app_tech_terms"]:
+            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+def apply_festival_quality_patterns(text, target_lang):
+    """Apply Layer 3 festival patterns"""
+    lang_code = target_lang.split('-')[0].lower()
+    if lang_code not in ["hi", "ta", "te", "ml", "kn", "or"]:
+        return text
+    
+    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada", "or": "odia"}
+    pattern_key = pattern_map.get(lang_code)
+    if not pattern_key or pattern_key not in FESTIVAL_QUALITY_PATTERNS:
+        return text
+    
+    patterns = FESTIVAL_QUALITY_PATTERNS[pattern_key]
+    festival_context = detect_message_context_type(text)
+    
+    # Apply context-specific patterns
+    if festival_context == "rakhi_festival" and "rakhi_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["rakhi_patterns"]:
+            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    
+    if festival_context in ["holiday_celebration", "time_sensitive_promo"] and "holiday_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["holiday_patterns"]:
+            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    
+    if festival_context == "gift_giving" and "gift_earning_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["gift_earning_patterns"]:
+            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    if festival_context in ["festival_competition", "time_sensitive_promo"] and "encouragement_patterns" in patterns:
+        for english_phrase, preferred_translation in patterns["encouragement_patterns"]:
+            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+def apply_team_training_corrections(text, target_lang):
+    """Apply team-specific corrections based on training data"""
+    if target_lang not in TEAM_TRAINING_CORRECTIONS:
+        return text
+    
+    corrections = TEAM_TRAINING_CORRECTIONS[target_lang]
+    message_context = detect_message_context_type(text)
+    
+    # Apply meeting corrections for Malayalam
+    if target_lang == "ml-IN" and message_context == "meeting_live":
+        if "meeting_corrections" in corrections:
+            for english_phrase, preferred_translation in corrections["meeting_corrections"]:
+                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    # Apply WhatsApp corrections
+    if message_context == "whatsapp_promotion" and "whatsapp_corrections" in corrections:
+        for english_phrase, preferred_translation in corrections["whatsapp_corrections"]:
+            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+# -------------------- TRAINING FIXES APPLICATION FUNCTIONS -------------------- #
+
+def apply_training_based_quality_fixes(text, target_lang):
+    """Apply Layer 1 training fixes with team corrections"""
+    if target_lang not in LAYER1_TRAINING_FIXES:
+        return text
+    
+    fixes = LAYER1_TRAINING_FIXES[target_lang]
+    for english_phrase, quality_translation in fixes.items():
+        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+def apply_additional_training_fixes(text, target_lang):
+    """Apply Layer 2 training fixes with team corrections"""
+    if target_lang not in LAYER2_TRAINING_FIXES:
+        return text
+    
+    fixes = LAYER2_TRAINING_FIXES[target_lang]
+    for english_phrase, quality_translation in fixes.items():
+        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+def apply_festival_training_fixes(text, target_lang):
+    """Apply Layer 3 festival training fixes"""
+    if target_lang not in LAYER3_TRAINING_FIXES:
+        return text
+    
+    fixes = LAYER3_TRAINING_FIXES[target_lang]
+    for english_phrase, quality_translation in fixes.items():
+        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
+    
+    return text
+
+# -------------------- OUTPUT CLEANUP -------------------- #
+
+def enhanced_postprocess_translation_output(text, target_lang):
+    """Main post-processing function that applies all training fixes + team corrections"""
+    
+    # Layer 1: Original training fixes + team corrections
+    result = apply_training_based_quality_fixes(text, target_lang)
+    
+    # Layer 2: Additional training fixes + team corrections
+    result = apply_additional_training_fixes(result, target_lang)
+    
+    # Layer 3: Festival training fixes
+    result = apply_festival_training_fixes(result, target_lang)
+    
+    # Enhanced emoji and formatting
+    result = enhance_emoji_and_formatting_based_on_training(result, target_lang)
+    
+    # NEW: Apply team-specific issue fixes
+    result = fix_team_identified_issues(result, target_lang)
+    
+    return result
+
+def fix_team_identified_issues(text, target_lang):
+    """Fix issues identified by team training data"""
+    
+    # Remove over-explanation patterns
+    over_explanation_patterns = [
+        r'This message is about.*?\.',
+        r'.*?കുറിച്ചാണ്.*?\.',
+        r'.*?regarding.*?\.',
+        r'.*?concerning.*?\.',
+    ]
+    
+    for pattern in over_explanation_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    
+    # Ensure proper emoji preservation 
+    text = re.sub(r'\s+([👋🎉💥💬🎯👉])', r' \1', text)
+    
+    # Fix segmentation issues - ensure proper line breaks
+    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Remove excessive line breaks
+    text = re.sub(r'([.!?])\s*([A-Za-z])', r'\1\n\n\2', text)  # Add breaks after sentences where needed
+    
+    return text.strip()
+
+def enhance_emoji_and_formatting_based_on_training(text, target_lang):
+    """Enhance emoji and formatting based on training examples + team corrections"""
+    
+    # Ensure LIVE stays in caps and gets proper treatment
+    text = re.sub(r'\blive\b', 'LIVE', text, flags=re.IGNORECASE)
+    
+    # Ensure proper emoji spacing (observed in examples)
+    text = re.sub(r'(\d+)\s*PM', r'\1 PM', text)  # Proper PM spacing
+    text = re.sub(r'₹\s*(\d+)', r'₹\1', text)    # Proper rupee spacing
+    
+    # Add missing exclamation marks where appropriate (pattern from examples + team data)
+    if "join" in text.lower() and not text.strip().endswith(('!', '?')):
+        text = text.strip() + '!'
+    
+    # Preserve bullet points and structure from team corrections
+    text = re.sub(r'(\n)(💥|💬|🎯)', r'\1\n\2', text)  # Ensure proper spacing for bullet emojis
+    
+    return text
+
+
+def clean_instruction_leaks_from_result(text):
+    """Clean all possible instruction leaks from translation result + team training patterns"""
+    
+    instruction_patterns = [
+        r'\[INSTRUCTION:.*?\]\s*', r'\[INST:.*?\]\s*', r'\[Translate completely including:.*?\]\s*',
+        r'\[translate from:.*?\]\s*', r'\[.*?translate.*?from.*?\]\s*', r'^\[.*?\]\s*',
+        r'\[Context:.*?\]\s*', r'\[Apply quality patterns:.*?\]\s*', r'\[Festival context:.*?\]\s*',
+        r'\[Apply:.*?\]\s*',
+        # Team training: Remove over-explanation patterns
+        r'This message is about.*?\.',
+        r'.*?കുറിച്ചാണ്.*?\.',
+        r'.*?regarding.*?\.',
+    ]
+    
+    for pattern in instruction_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
+    
+    return text
+
+def fix_brand_name_issues(text, target_lang):
+    """Fix brand name formatting issues"""
+    fixes = {
+        r"\[\[\[+([^\[\]]*)\]\]\]+": r"\1", r"\[\[+([^\[\]]*)\]\]+": r"\1", r"\[+([^\[\]]*)\]+": r"\1",
+        r"\{\{\{+([^\{\}]*)\}\}\}+": r"\1", r"\{\{+([^\{\}]*)\}\}+": r"\1", r"\{+([^\{\}]*)\}+": r"\1",
+        r"FRND\}+\]+": "FRND", r"Team\s*FRND\}+\]+": "Team FRND", r"\}+\]+": "",
+        r"^\]+,?\s*": "", r"\]+,\s*": "", r"\]+\s*": "", r"^\s*,\s*": "",
+    }
+    
+    for pattern, replacement in fixes.items():
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE | re.MULTILINE)
+    
+    return text
+
+def fix_formatting_issues(text, target_lang):
+    """Fix unnecessary spacing and cleanup"""
+    instruction_patterns = [
+        r'\[translate from:.*?\]\s*', r'\[.*?translate.*?from.*?\]\s*', r'^\[.*?\]\s*',
+        r'\[INST.*?\]\s*', r'\[INSTRUCTION.*?\]\s*',
+    ]
+    
+    for pattern in instruction_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
+    
+    # Clean remaining bracket artifacts
+    bracket_artifacts = [r'^\]+,?\s*', r'\]+,\s*', r'\]+\s*', r'^\s*,\s*', r',\s*,\s*']
+    
+    for pattern in bracket_artifacts:
+        text = re.sub(pattern, '', text, flags=re.MULTILINE)
+    
+    # General formatting cleanup
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    
+    return text
+
+def clean_translation_output(text, target_lang):
+    """The cleanup chain app.py ran on every Sarvam and ChatGPT result"""
+    text = clean_instruction_leaks_from_result(text)
+    text = fix_brand_name_issues(text, target_lang)
+    text = fix_formatting_issues(text, target_lang)
+    return enhanced_postprocess_translation_output(text, target_lang)
+
+def strip_chatgpt_meta_commentary(text):
+    """The meta-response cleanup app.py ran on every ChatGPT reply"""
+    meta_patterns = [
+        r'^(CORRECTED TRANSLATION|IMPROVED TRANSLATION|FIXED TRANSLATION|Translation|Final Translation|Here is the corrected translation|The corrected translation is):\s*',
+        r'The.*?translation.*?is.*?already.*?good.*?\.',
+        r'No improvements.*?needed.*?\.',
+        r'The Sarvam translation.*?is.*?already.*?\.',
+        r'This translation.*?meets.*?requirements.*?\.',
+    ]
+    
+    for pattern in meta_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    
+    return text.strip()
+
+# -------------------- QUALITY ANALYSIS -------------------- #
+
+def detect_team_quality_issues(text, translated_text):
+    """Detect quality issues based on team training data"""
+    issues = []
+    
+    # Check for over-explanation patterns
+    if any(phrase in translated_text.lower() for phrase in [
+        "this message is about", "regarding", "concerning", "കുറിച്ചാണ്", "ବିଷୟରେ"
+    ]):
+        issues.append("over_explanation")
+    
+    # Check for incomplete translation
+    original_sentences = len([s for s in text.split('.') if s.strip()])
+    translated_sentences = len([s for s in translated_text.split('.') if s.strip()])
+    if original_sentences > translated_sentences + 1:
+        issues.append("incomplete_translation")
+    
+    # Check for missing emoji preservation
+    original_emojis = len([c for c in text if ord(c) > 127])
+    translated_emojis = len([c for c in translated_text if ord(c) > 127])
+    if original_emojis > translated_emojis:
+        issues.append("missing_formatting")
+    
+    return issues
+
+def calculate_enhanced_translation_confidence(original, translated, source_lang, target_lang, message_context=None):
+    """Calculate confidence score with enhanced quality checks + team training insights"""
+    if not translated or translated.startswith("❌") or not original:
+        return 0.0
+    
+    confidence = 1.0
+    
+    # Universal issue checks
+    if re.search(r'\[+[^\[\]]*\]+', translated):
+        confidence -= 0.3
+    
+    # Check for incomplete translations (team training insight)
+    original_sentences = len(re.findall(r'[.!?]+', original))
+    translated_sentences = len(re.findall(r'[.!?।]+', translated))
+    if original_sentences > translated_sentences + 1:
+        confidence -= 0.4
+    
+    # Check length ratio
+    length_ratio = len(translated) / len(original) if original else 1
+    if length_ratio > 3.0 or length_ratio < 0.3:
+        confidence -= 0.2
+    
+    # Check for repeated phrases
+    words = translated.split()
+    if len(words) > 4:
+        for i in range(len(words) - 2):
+            phrase = " ".join(words[i:i+3])
+            if translated.count(phrase) > 1:
+                confidence -= 0.3
+                break
+    
+    # Enhanced checks for training pattern compliance
+    message_context = message_context or build_message_context(original)
+    lang_code = target_lang.split('-')[0].lower()
+    
+    # Check if key training patterns were applied correctly
+    if message_context.context_type == "rakhi_festival":
+        if message_context.mentions("rakhi") and "Rakhi" not in translated:
+            confidence -= 0.2
+        if message_context.mentions("brother") and lang_code == "hi" and "bhai" not in translated.lower():
+            confidence -= 0.1
+    
+    if message_context.context_type == "whatsapp_promotion":
+        if message_context.mentions("whatsapp channel") and "WhatsApp Channel" not in translated:
+            confidence -= 0.2
+    
+    if message_context.mentions("live") and "LIVE" not in translated:
+        confidence -= 0.1
+    
+    # NEW: Team training specific checks
+    team_issues = detect_team_quality_issues(original, translated)
+    if "over_explanation" in team_issues:
+        confidence -= 0.3
+    if "incomplete_translation" in team_issues:
+        confidence -= 0.4
+    if "missing_formatting" in team_issues:
+        confidence -= 0.2
+    
+    return max(0.0, min(1.0, confidence))
+
+def analyze_enhanced_translation_quality(original, translated, source_lang, target_lang, message_context=None):
+    """Enhanced quality analysis with training pattern compliance + team insights"""
+    quality_flags = []
+    
+    if not translated or translated.startswith("❌"):
+        return quality_flags, 0.0
+    
+    message_context = message_context or build_message_context(original)
+    confidence = calculate_enhanced_translation_confidence(original, translated, source_lang, target_lang, message_context)
+    
+    # Universal quality checks
+    if re.search(r'\[+[^\[\]]*\]+', translated):
+        quality_flags.append("🔧 Brand name formatting issue detected - brackets around text")
+    
+    # Check for incomplete sentence translation (enhanced with team training)
+    original_sentences = len(re.findall(r'[.!?]+', original))
+    translated_sentences = len(re.findall(r'[.!?।]+', translated))
+    if original_sentences > translated_sentences + 1:
+        quality_flags.append("📝 Incomplete translation detected - missing sentences (team training insight)")
+    
+    # Check dramatic length changes
+    if original and translated:
+        length_ratio = len(translated) / len(original)
+        if length_ratio > 3.0:
+            quality_flags.append("📏 Translation much longer than original - possible over-explanation (team insight)")
+        elif length_ratio < 0.3:
+            quality_flags.append("📏 Translation much shorter than original - may be missing content")
+    
+    # Check for repeated phrases
+    words = translated.split()
+    if len(words) > 4:
+        for i in range(len(words) - 2):
+            phrase = " ".join(words[i:i+3])
+            if translated.count(phrase) > 1:
+                quality_flags.append("🔄 Repeated phrases detected - may indicate translation error")
+                break
+    
+    # Enhanced training pattern compliance checks
+    lang_code = target_lang.split('-')[0].lower()
+    
+    # Festival pattern compliance
+    if message_context.context_type == "rakhi_festival":
+        if message_context.mentions("rakhi") and "Rakhi" not in translated:
+            quality_flags.append("🎊 Festival context: 'Rakhi' should be preserved in English")
+        if message_context.mentions("brother") and lang_code == "hi" and "bhai" not in translated.lower():
+            quality_flags.append("👨‍👧‍👦 Missing cultural term: should use 'bhai' for brother in Hindi")
+    
+    # WhatsApp pattern compliance
+    if message_context.context_type == "whatsapp_promotion":
+        if message_context.mentions("whatsapp channel") and "WhatsApp Channel" not in translated:
+            quality_flags.append("📱 WhatsApp Channel should be preserved in mixed case")
+    
+    # Live session compliance
+    if message_context.mentions("live") and "LIVE" not in translated:
+        quality_flags.append("📺 'LIVE' should be preserved in all caps")
+    
+    # NEW: Team training specific quality checks
+    team_issues = detect_team_quality_issues(original, translated)
+    if "over_explanation" in team_issues:
+        quality_flags.append("🎯 Over-explanation detected - should be direct translation (team insight)")
+    if "incomplete_translation" in team_issues:
+        quality_flags.append("⚠️ Incomplete translation - missing content (team training pattern)")
+    
+    return quality_flags, confidence
+
+# -------------------- CHATGPT PROMPT -------------------- #
+
+def get_enhanced_chatgpt_prompt_with_training(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None):
+    """Build enhanced ChatGPT prompt with all training examples + team corrections"""
+    
+    # Build training examples including team corrections
+    training_examples = build_comprehensive_chatgpt_training_examples(target_lang)
+    
+    # Language-specific instructions
+    lang_instructions = {
+        "hi-IN": "Hindi with Roman script (Hinglish) and English code-mixing. Example: 'weekend ON ho gaya hai'",
+        "ta-IN": "Tamil script with selective English words preserved. Example: 'Saturday – weekend OFFICIALLY ON!'", 
+        "te-IN": "Telugu with Roman script and English code-mixing. Example: 'weekend officially ON lo undhi'",
+        "ml-IN": "Malayalam script with simple English terms preserved where natural. CRITICAL: Direct translation only, avoid over-explanation",
+        "kn-IN": "Kannada script with simple English terms preserved where natural. CRITICAL: Maintain proper word order, translate ALL components",
+        "or-IN": "Odia script with simple English terms preserved where natural"
+    }
+    
+    # Mode instructions
+    mode_instructions = {
+        "modern-colloquial": "modern, casual, conversational style",
+        "formal": "formal, professional, respectful tone",
+        "classic-colloquial": "literal, word-for-word accuracy prioritized",
+        "code-mixed": "heavy English-local language mixing, trendy expressions"
+    }
+    
+    # Formality mapping
+    formality_descriptions = {
+        1: "very casual, informal", 2: "casual, friendly", 3: "neutral, balanced",
+        4: "respectful, semi-formal", 5: "very formal, professional"
+    }
+    
+    # Build language context
+    language_context = f"""
+Language Target: {lang_instructions.get(target_lang, "the target language")}
+Style Mode: {mode_instructions.get(mode, mode)}
+Formality Level: {formality_descriptions.get(formality_level, "balanced")}
+"""
+    
+    # Add team training warnings
+    team_warnings = """
+TEAM TRAINING CRITICAL RULES:
+- NO over-explanation or meta-commentary about the message
+- Translate ALL sentences completely - do not skip any content
+- Maintain proper word order and sentence structure
+- Preserve ALL emojis and formatting exactly
+- Direct translation only - avoid describing what the message is about
+"""
+    
+    # Hints from preprocessing, passed as metadata
+    context_notes = f"\n{context_hints.to_prompt_section()}\n" if context_hints else ""
+    
+    prompt = f"""TASK: Fix and improve this translation following the quality patterns shown in ALL training examples + team corrections.
+
+ORIGINAL ENGLISH:
+{original_text}
+
+TRANSLATION TO FIX:
+{sarvam_translation}
+
+REQUIREMENTS:
+{language_context}
+
+{team_warnings}
+{context_notes}
+{training_examples}
+
+CRITICAL RULES (UPDATED WITH TEAM TRAINING):
+1. Follow the EXACT patterns shown in ALL training examples above (all 3 layers + team corrections)
+2. Fix any bracket issues around brand names (FRND}}]], Team FRND}}]] should be FRND, Team FRND)
+3. Complete any incomplete sentences - translate EVERYTHING
+4. Use the same mixing patterns as training examples
+5. Keep exact same script (Roman/Native) and formality level
+6. Preserve all emojis and formatting exactly
+7. Apply festival/holiday context if relevant
+8. Apply WhatsApp channel context if relevant  
+9. Apply meeting/live session context if relevant
+10. NO over-explanation - direct translation only
+11. Maintain proper word order and structure
+12. DO NOT add explanations or comments
+13. ONLY return the corrected translation text
+
+CORRECTED TRANSLATION:"""
+
+    return prompt
+
+def build_comprehensive_chatgpt_training_examples(target_lang):
+    """Build training examples for ChatGPT that include all 3 layers + team corrections"""
+    
+    lang_code = target_lang.split('-')[0].lower()
+    
+    if lang_code == "hi":
+        return """
+TRAINING EXAMPLES (follow these patterns exactly):
+
+LAYER 1 - Meeting/Live patterns:
+English: "We're LIVE! Join now!"
+Quality Hindi: "Hum LIVE hain! Abhi join karo!"
+
+English: "Don't miss it!"
+Quality Hindi: "Miss mat karna!"
+
+LAYER 2 - WhatsApp Channel patterns:
+English: "Join our new WhatsApp Channel"
+Quality Hindi: "Naya WhatsApp Channel join karo"
+
+English: "Tired of small earnings? Let's fix that"
+Quality Hindi: "Kam earnings se thak gaye hoge na? Chinta mat karo"
+
+LAYER 3 - Festival patterns:
+English: "Gift Your Bhai ₹1000 Hamper"
+Quality Hindi: "Apne Bhai ko do ₹1000 ka Hamper"
+
+English: "Just by Being Online earn real money"
+Quality Hindi: "Sirf Online aakar kamao real money"
+
+English: "Tonight's the Night! Why wait?"
+Quality Hindi: "Aaj ki raat hai khaas! Toh phir rukna kyu?"
+"""
+    elif lang_code == "ta":
+        return """
+TRAINING EXAMPLES (follow these patterns exactly):
+
+LAYER 1 - Meeting/Live patterns:
+English: "We're LIVE! Join now!"
+Quality Tamil: "நாங்க LIVE ஆ இருக்கோம்! இப்போவே join பண்ணுங்க!"
+
+English: "Really helpful session"
+Quality Tamil: "session definitely உங்களுக்கு help ஆகும்!"
+
+LAYER 2 - WhatsApp Channel patterns:
+English: "New here? You're not alone"
+Quality Tamil: "இது உங்க first time-a? நீங்கள் தனியா இல்ல"
+
+LAYER 3 - Festival patterns:
+English: "Just by Being Online earn real money"
+Quality Tamil: "FRND-ல Onlineல இருந்தாலே போதும் நேரடி பணம் சேரும்"
+
+English: "Make this Rakhi extra special"
+Quality Tamil: "இந்த Rakhi-யை Special-aa ஆக்குங்க"
+"""
+    elif lang_code == "te":
+        return """
+TRAINING EXAMPLES (follow these patterns exactly):
+
+LAYER 1 - Meeting/Live patterns:
+English: "We're LIVE! Join now!"
+Quality Telugu: "Manam LIVE lo unnam! Ipude join avvandi!"
+
+LAYER 2 - WhatsApp Channel patterns:
+English: "New here?"
+Quality Telugu: "App ki new ah?"
+
+LAYER 3 - Festival patterns:
+English: "Gift Your Bhai ₹1000 Hamper"
+Quality Telugu: "మీ బ్రదర్ కి Gift చేయొచ్చు ₹1000 హ్యాంపర్"
+"""
+    elif lang_code == "ml":
+        return """
+TRAINING EXAMPLES + TEAM CORRECTIONS (follow these patterns exactly):
+
+LAYER 1 - Meeting/Live patterns + TEAM TRAINING:
+English: "💛 The FRND Meeting is happening now! From call tips to earnings to what's new on the app — it's all being discussed live! 🎯 Jump in now if you haven't already!"
+WRONG (Sarvam): "ഫ്രണ്ട്" മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു. "കോൾ" ഫീച്ചർ എങ്ങനെ യൂസ് ചെയ്യാമെന്നുള്ള ടിപ്സ് ഷെയർ ചെയ്യുന്നു...
+TEAM CORRECTED: "💛 FRND മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു! കോൾ ടിപ്സ് മുതൽ എർണിങ്സ് വരെ ഡിസ്കസ് ചെയ്യുന്നു, ആപ്പിലെ ലേറ്റസ്റ്റ് അപ്ഡേറ്റ്സിനെ കുറിച്ചും സംസാരിക്കുന്നു. 🎯 ഇപ്പോൾ തന്നെ ചേരൂ!"
+
+English: "FRND Meeting is LIVE right now! Tap to join – useful tips being shared!"
+WRONG (Sarvam): ഇപ്പോൾ ലൈവ് ആയിട്ടുള്ള ഒരു മീറ്റിങ്ങിനെ കുറിച്ചാണീ മെസ്സേജ്...
+TEAM CORRECTED: "FRND മീറ്റിംഗ് ഇപ്പോൾ LIVE ആണ്! ജോയിൻ ചെയ്യാൻ ടാപ്പ് ചെയ്യൂ"
+
+LAYER 2 - WhatsApp Channel patterns + TEAM TRAINING:
+English: "Hi [Name]! 👋 FRND's brand-new WhatsApp Channel is here… and guess what? You're on the special invite list! 🎉"
+TEAM CORRECTED: "നമസ്കാരം [പേര്]! 👋 FRND-ന്റെ പുതിയ WhatsApp ചാനൽ എത്തിയിരിക്കുന്നു ഒന്ന് Guess ചെയാമോ? നിങ്ങൾ സ്പെഷ്യൽ ഇൻവൈറ്റ് ലിസ്റ്റിലുണ്ട്! 🎉"
+
+CRITICAL TEAM TRAINING RULES:
+- NO over-explanation (avoid "കുറിച്ചാണ്" patterns)
+- Direct translation only
+- Complete ALL sentences
+- Preserve ALL emojis exactly
+"""
+    elif lang_code == "kn":
+        return """
+TRAINING EXAMPLES + TEAM CORRECTIONS (follow these patterns exactly):
+
+LAYER 2 - WhatsApp Channel patterns + TEAM TRAINING:
+English: "Hi [Name]! 👋 FRND's brand-new WhatsApp Channel is here… and guess what? You're on the special invite list! 🎉"
+TEAM CORRECTED: "ನಮಸ್ಕಾರ [Name]! 👋 FRND ನ ಹೊಚ್ಚ ಹೊಸ WhatsApp ಚಾನೆಲ್ ಇಲ್ಲಿದೆ...ಮತ್ತು ಗೆಸ್ಸ್ ಮಾಡಿ ? ನೀವು ಸ್ಪೆಷಲ್ ಲಿಸ್ಟಲ್ಲಿ ಇದ್ದೀರಿ! 🎉"
+
+English: "Be the first to know about discounts"
+TEAM CORRECTED: "ಡಿಸ್ಕೌಂಟ್ಸ್ ಬಗ್ಗೆ ಫಸ್ಟ್ ಆಗಿ ತಿಳಿಯಿರಿ"
+
+English: "It's that simple & never miss anything fun on FRND!"
+TEAM CORRECTED: "ಇಷ್ಟು ಸಿಂಪಲ್, FRND‌ನಲ್ಲಿ ಮಜಾ ಯಾವತ್ತೂ ಮಿಸ್ ಆಗೋದು ಇಲ್ಲ!"
+
+CRITICAL TEAM TRAINING RULES:
+- Maintain proper word order
+- Translate ALL components
+- No missing words or lines
+- Preserve structure and formatting
+"""
+    
+    return ""
@@ -0,0 +1,122 @@
+# Load test: the full pipeline (Sarvam, quality analysis, QA gate, ChatGPT review) at N concurrent sessions
+# Starts the bundled stub vendors (or targets LOAD_TEST_BASE_URL, e.g. a standalone stub_server) and
+# reports throughput and p50/p95/p99 per stage. Vendor rate limits, retries and breakers stay in effect.
+# Run from the repo root: python -m benchmarks.load_test
+#   LOAD_TEST_SESSIONS=32 LOAD_TEST_PROFILE=long-tail LOAD_TEST_ERROR_RATE=0.02 python -m benchmarks.load_test
+
+import math
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import translation_pipeline as pipeline
+import vendor_clients
+from benchmarks.corpus import SAMPLE_MESSAGES
+from benchmarks.harness import STUB_API_KEY, patched, stub_pipeline
+from benchmarks.stub_server import latency_profile
+from translation_enhancements import analyze_enhanced_translation_quality, build_message_context
+from vendor_clients import get_circuit_breaker_states, get_vendor_metrics
+
+SESSIONS = int(os.getenv("LOAD_TEST_SESSIONS", "8"))
+TRANSLATIONS_PER_SESSION = int(os.getenv("LOAD_TEST_TRANSLATIONS", "10"))
+TARGET_LANGS = os.getenv("LOAD_TEST_TARGETS", "hi-IN,ta-IN,te-IN").split(",")
+# Stub settings: latency profile around each endpoint's median, scaled down so a default run takes seconds
+PROFILE = os.getenv("LOAD_TEST_PROFILE", "lognormal")
+LATENCY_SCALE = float(os.getenv("LOAD_TEST_LATENCY_SCALE", "0.25"))
+ERROR_RATE = float(os.getenv("LOAD_TEST_ERROR_RATE", "0"))
+# An already running stub (or other vendor stand-in) instead of the in-process one
+BASE_URL = os.getenv("LOAD_TEST_BASE_URL", "")
+# Echoed stub output passes the QA gate almost always; review everything to load the ChatGPT stage like real traffic
+ALWAYS_REVIEW = os.getenv("LOAD_TEST_ALWAYS_REVIEW", "1") == "1"
+# Drop the vendor token buckets to measure the pipeline itself rather than the configured rate limits
+UNTHROTTLED = os.getenv("LOAD_TEST_UNTHROTTLED", "0") == "1"
+
+STAGES = ["sarvam", "analysis", "chatgpt", "total"]
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * p / 100) - 1)]
+
+def translate_once(text, target_lang):
+    """One translation the way the single-language view runs it, with per-stage seconds"""
+    timings = {}
+    start = time.perf_counter()
+    message_context = build_message_context(text, "")
+    sarvam = pipeline.translate_text(text, "en-IN", target_lang, "Male", "modern-colloquial",
+                                     message_context=message_context, bypass_cache=True)
+    timings["sarvam"] = time.perf_counter() - start
+
+    analysis_start = time.perf_counter()
+    quality_flags, confidence = analyze_enhanced_translation_quality(text, sarvam, "en-IN", target_lang, message_context)
+    timings["analysis"] = time.perf_counter() - analysis_start
+
+    outcome = "sarvam_error" if sarvam.startswith("❌") else "skipped"
+    if outcome != "sarvam_error" and (ALWAYS_REVIEW or pipeline.should_run_chatgpt_qa(confidence, quality_flags, "", message_context)):
+        review_start = time.perf_counter()
+        _, gpt_error = pipeline.chatgpt_quality_check_and_improve(
+            text, sarvam, target_lang, "modern-colloquial", "", "", 3, bypass_cache=True, message_context=message_context
+        )
+        timings["chatgpt"] = time.perf_counter() - review_start
+        outcome = "chatgpt_fallback" if gpt_error else "reviewed"
+    timings["total"] = time.perf_counter() - start
+    return timings, outcome
+
+def run_session(index, results, lock):
+    """One user session: translations back to back, each message and language picked in rotation"""
+    for n in range(TRANSLATIONS_PER_SESSION):
+        text = SAMPLE_MESSAGES[(index * TRANSLATIONS_PER_SESSION + n) % len(SAMPLE_MESSAGES)]
+        outcome = translate_once(text, TARGET_LANGS[(index + n) % len(TARGET_LANGS)])
+        with lock:
+            results.append(outcome)
+
+def run_load():
+    results = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(SESSIONS) as executor:
+        for future in [executor.submit(run_session, index, results, lock) for index in range(SESSIONS)]:
+            future.result()
+    return results, time.perf_counter() - start
+
+def report(results, elapsed, target):
+    outcomes = Counter(outcome for _, outcome in results)
+    print(f"Load test: {SESSIONS} sessions x {TRANSLATIONS_PER_SESSION} translations into {', '.join(TARGET_LANGS)} against {target}")
+    print(f"  {len(results)} translations in {elapsed:.2f} s: {len(results) / elapsed:.1f} translations/s "
+          f"({outcomes['reviewed']} reviewed, {outcomes['skipped']} gate-skipped, "
+          f"{outcomes['chatgpt_fallback']} ChatGPT fallbacks, {outcomes['sarvam_error']} Sarvam errors)")
+    print(f"  {'stage':10} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for stage in STAGES:
+        values = [timings[stage] for timings, _ in results if stage in timings]
+        if not values:
+            continue
+        print(f"  {stage:10} {len(values):6d} " + " ".join(
+            f"{value * 1000:9.1f}" for value in [percentile(values, 50), percentile(values, 95), percentile(values, 99), max(values)]
+        ))
+    for vendor, metrics in get_vendor_metrics().items():
+        print(f"  {vendor}: {metrics['requests']} requests, {metrics['retries']} retries {metrics['retries_by_reason']}, "
+              f"{metrics['rate_limit_wait_seconds']:.1f}s rate-limited, {metrics['gave_up']} gave up")
+    for name, status in get_circuit_breaker_states().items():
+        print(f"  circuit {name}: {status['state']} (opened {status['times_opened']}x, {status['rejected']} calls skipped)")
+
+def main():
+    with ExitStack() as stack:
+        if UNTHROTTLED:
+            for policy in [vendor_clients.sarvam_policy, vendor_clients.openai_policy]:
+                stack.enter_context(patched(policy.rate_limiter, rate_per_second=0))
+        if BASE_URL:
+            stack.enter_context(stub_pipeline(
+                BASE_URL, os.getenv("SARVAM_API_KEY", STUB_API_KEY), os.getenv("OPENAI_API_KEY", STUB_API_KEY)
+            ))
+            target = BASE_URL
+        else:
+            stack.enter_context(stub_pipeline(latency_sampler=latency_profile(PROFILE, LATENCY_SCALE), error_rate=ERROR_RATE))
+            target = f"stub vendors ({PROFILE} latency x{LATENCY_SCALE:g}, {ERROR_RATE:.1%} errors)"
+        results, elapsed = run_load()
+    report(results, elapsed, target)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# Local stand-ins for the Sarvam and OpenAI APIs, for benchmarks that must not hit the real vendors
+# Speaks HTTP/1.1 keep-alive like the real APIs; optionally serves TLS with a throwaway self-signed cert.
+# Also runs standalone, so the app itself can be pointed at it:
+#   STUB_PORT=8765 STUB_LATENCY_PROFILE=lognormal STUB_ERROR_RATE=0.01 python -m benchmarks.stub_server
+#   SARVAM_BASE_URL=http://localhost:8765 OPENAI_BASE_URL=http://localhost:8765 streamlit run app.py
+
+import json
+import math
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Echo-style vendor responses: Sarvam returns its input, OpenAI returns the translation it was asked to fix"""
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without this Nagle stalls keep-alive replies ~40ms
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_event_stream(self, reply):
+        """Stream a chat reply as OpenAI-style SSE chunks (chunked transfer encoding), then [DONE]"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        size = self.server.stream_chunk_chars
+        events = [{"choices": [{"delta": {"content": reply[i:i + size]}, "index": 0}]} for i in range(0, len(reply), size)]
+        self.server.count_stream(1)
+        try:
+            # Raw UTF-8 like the real API, so clients must not fall back to a default charset
+            for index, event in enumerate([json.dumps(event, ensure_ascii=False) for event in events] + ["[DONE]"]):
+                # Generation time between content chunks; [DONE] follows the last one straight away
+                if 0 < index < len(events) and self.server.stream_chunk_delay:
+                    time.sleep(self.server.stream_chunk_delay)
+                data = f"data: {event}\n\n".encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except ConnectionError:
+            # The client hung up mid-stream
+            self.close_connection = True
+        finally:
+            self.server.count_stream(-1)
+
+    def do_HEAD(self):
+        # A HEAD costs the vendor round trip too, so concurrent pre-warm requests overlap like real ones
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        latency = self.server.latency + self.server.latency_per_char * request_chars(payload)
+        if self.server.latency_sampler:
+            latency += self.server.latency_sampler(self.path)
+        if latency:
+            time.sleep(latency)
+
+        fault_status = self.server.next_fault()
+        if fault_status:
+            self.send_response(fault_status)
+            if self.server.retry_after is not None:
+                self.send_header("Retry-After", str(self.server.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/translate":
+            translated = payload.get("input", "")
+            if self.server.sarvam_transform:
+                translated = self.server.sarvam_transform(translated)
+            self._send_json(200, {"translated_text": translated})
+        elif self.path == "/v1/chat/completions":
+            prompt = payload.get("messages", [{}])[-1].get("content", "")
+            reply = translation_to_fix(prompt)
+            if payload.get("stream"):
+                self._send_event_stream(reply)
+                return
+            # A whole reply takes as long to generate as the streamed one
+            if self.server.stream_chunk_delay:
+                time.sleep(self.server.stream_chunk_delay * max(stream_chunk_count(reply, self.server.stream_chunk_chars) - 1, 0))
+            self._send_json(200, {"choices": [{"message": {"role": "assistant", "content": reply}}]})
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+def request_chars(payload):
+    """Input size of a vendor request: the Sarvam input, or every chat message's content"""
+    if "messages" in payload:
+        return sum(len(message.get("content", "")) for message in payload["messages"])
+    return len(payload.get("input", ""))
+
+# -------------------- LATENCY PROFILES -------------------- #
+
+# Median latency per endpoint, roughly what the real vendors take for a short FRND message
+ENDPOINT_MEDIAN_SECONDS = {"/translate": 0.3, "/v1/chat/completions": 1.2}
+# Spread of the lognormal profiles, and how often / how much slower the long tail is
+LOGNORMAL_SIGMA = 0.35
+LONG_TAIL_SHARE = 0.02
+LONG_TAIL_FACTOR = 10
+
+def lognormal_latency(rng, median):
+    return rng.lognormvariate(math.log(median), LOGNORMAL_SIGMA) if median else 0.0
+
+LATENCY_PROFILES = {
+    "none": lambda rng, median: 0.0,
+    "fixed": lambda rng, median: median,
+    "lognormal": lognormal_latency,
+    "long-tail": lambda rng, median: lognormal_latency(rng, median) * (LONG_TAIL_FACTOR if rng.random() < LONG_TAIL_SHARE else 1),
+}
+
+def latency_profile(name, scale=1.0, seed=None):
+    """A latency_sampler drawing from a named profile around each endpoint's median (times scale)"""
+    if name not in LATENCY_PROFILES:
+        raise ValueError(f"Unknown latency profile {name!r}; expected one of {', '.join(LATENCY_PROFILES)}")
+    draw = LATENCY_PROFILES[name]
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    def sample(path):
+        with lock:
+            return draw(rng, ENDPOINT_MEDIAN_SECONDS.get(path, 0.0) * scale)
+    return sample
+
+def stream_chunk_count(reply, chunk_chars):
+    return -(-len(reply) // chunk_chars)
+
+def translation_to_fix(prompt):
+    """The text between "TRANSLATION TO FIX:" and "REQUIREMENTS:" in a review prompt, or the whole prompt"""
+    marker = "TRANSLATION TO FIX:"
+    if marker not in prompt:
+        return prompt
+    return prompt.split(marker, 1)[1].split("\nREQUIREMENTS:", 1)[0].strip()
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency=0.0, fault_statuses=(), retry_after=None, latency_per_char=0.0, sarvam_transform=None,
+                 stream_chunk_chars=8, stream_chunk_delay=0.0, latency_sampler=None, error_rate=0.0, error_status=503,
+                 seed=None, port=0):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.latency = latency
+        self.latency_sampler = latency_sampler
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self.stream_chunk_chars = stream_chunk_chars
+        self.stream_chunk_delay = stream_chunk_delay
+        self.latency_per_char = latency_per_char
+        self.sarvam_transform = sarvam_transform
+        self.faults = list(fault_statuses)
+        self.retry_after = retry_after
+        self.open_streams = 0
+        self._lock = threading.Lock()
+
+    def next_fault(self):
+        """The status to fail the next request with: scripted faults first, then error_rate at random"""
+        with self._lock:
+            if self.faults:
+                return self.faults.pop(0)
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self.error_status
+            return None
+
+    def handle_error(self, request, client_address):
+        # Clients that cancel a request hang up mid-reply; that is expected, not an error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def count_stream(self, change):
+        """Track open SSE streams, so a check can see that an abandoned one was closed"""
+        with self._lock:
+            self.open_streams += change
+
+class StubServer:
+    """A threaded stub vendor server on 127.0.0.1, usable as a context manager
+
+    fault_statuses are returned, in order, for the first requests (e.g. [503, 429]),
+    with a Retry-After header when retry_after is set. latency_per_char adds delay
+    proportional to a request's input (Sarvam text or chat prompt), like a real model's.
+    sarvam_transform, if given, is applied to the echoed Sarvam input to fake flawed output.
+    Chat requests with "stream": true get the reply as SSE chunks of stream_chunk_chars
+    characters, stream_chunk_delay seconds apart (the time a model spends per token).
+    latency_sampler(path), if given, is called per request for extra seconds of latency
+    (see latency_profile()). After the scripted faults, error_rate of the requests fail
+    with error_status. port 0 picks a free port.
+    """
+
+    def __init__(self, latency=0.0, tls=False, fault_statuses=(), retry_after=None, latency_per_char=0.0, sarvam_transform=None,
+                 stream_chunk_chars=8, stream_chunk_delay=0.0, latency_sampler=None, error_rate=0.0, error_status=503,
+                 seed=None, port=0):
+        self.httpd = StubHTTPServer(latency, fault_statuses, retry_after, latency_per_char, sarvam_transform,
+                                    stream_chunk_chars, stream_chunk_delay, latency_sampler, error_rate, error_status,
+                                    seed, port)
+        self.cert_file = None
+        self._cert_dir = None
+        if tls:
+            self._cert_dir = tempfile.mkdtemp(prefix="stub-tls-")
+            self.cert_file, key_file = make_self_signed_cert(self._cert_dir)
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(self.cert_file, key_file)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self.scheme = "https" if tls else "http"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-server", daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"{self.scheme}://localhost:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+
+def tls_available():
+    return shutil.which("openssl") is not None
+
+def make_self_signed_cert(directory):
+    """Create a localhost certificate with the openssl CLI, returning (cert_file, key_file)"""
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+         "-keyout", key_file, "-out", cert_file],
+        check=True, capture_output=True
+    )
+    return cert_file, key_file
+
+def main():
+    """Serve the stub vendors until interrupted"""
+    profile = os.getenv("STUB_LATENCY_PROFILE", "lognormal")
+    error_rate = float(os.getenv("STUB_ERROR_RATE", "0"))
+    sampler = latency_profile(profile, float(os.getenv("STUB_LATENCY_SCALE", "1")))
+    with StubServer(latency_sampler=sampler, error_rate=error_rate, port=int(os.getenv("STUB_PORT", "8765"))) as server:
+        print(f"Stub Sarvam/OpenAI at {server.base_url} ({profile} latency, {error_rate:.1%} errors); Ctrl+C to stop")
+        print(f"  SARVAM_BASE_URL={server.base_url} OPENAI_BASE_URL={server.base_url} streamlit run app.py")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
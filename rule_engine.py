@@ -0,0 +1,203 @@
+# RULE ENGINE - Compiled phrase rules for the translation training layers
+# Ordered (phrase, replacement) rule lists are compiled once into the fewest
+# single-pass regex scans that give the same result as applying the rules
+# one re.sub at a time
+
+import re
+
+_WORD_CHAR = re.compile(r"\w")
+
+# -------------------- TRIE PATTERN BUILDER -------------------- #
+
+def build_trie_pattern(phrases):
+    """Build a regex source matching any phrase, preferring the longest match at each position"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase.lower():
+            node = node.setdefault(char, {})
+        node[""] = True
+    return _trie_node_pattern(trie)
+
+def _trie_node_pattern(node):
+    """Render one trie node as a regex fragment"""
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+
+    body = "(?:" + "|".join(branches) + ")"
+    # Greedy optional tail so the longer phrase wins when both match
+    return body + "?" if "" in node else body
+
+def build_word_pattern(words):
+    """Build a word-bounded, longest-match-first regex source for words, or None if there are none"""
+    # The trie folds case, so duplicates like "Profile"/"profile" collapse to one branch
+    words = [word for word in words if word]
+    if not words:
+        return None
+    return f"\\b(?:{build_trie_pattern(words)})\\b"
+
+def build_word_matcher(words):
+    """Compile words into one case-insensitive, word-bounded, longest-match-first regex"""
+    pattern = build_word_pattern(words)
+    if pattern is None:
+        return None
+    return re.compile(pattern, flags=re.IGNORECASE)
+
+# -------------------- RULE CONFLICT ANALYSIS -------------------- #
+
+def _is_word_char(char):
+    return bool(_WORD_CHAR.match(char))
+
+def _is_aligned(text, start, end):
+    """True if text[start:end] does not cut through a word at either end"""
+    if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+        return False
+    if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+        return False
+    return True
+
+def _contains_aligned(outer, inner):
+    """True if inner occurs in outer without cutting through a word"""
+    start = outer.find(inner)
+    while start != -1:
+        if _is_aligned(outer, start, start + len(inner)):
+            return True
+        start = outer.find(inner, start + 1)
+    return False
+
+def _edges_overlap(left, right):
+    """True if a proper suffix of left equals a prefix of right on word-aligned edges"""
+    for size in range(1, min(len(left), len(right))):
+        if (left[-size:] == right[:size]
+                and _is_aligned(left, len(left) - size, len(left))
+                and _is_aligned(right, 0, size)):
+            return True
+    return False
+
+def _can_overlap(first, second):
+    """True if occurrences of the two literals can share characters in real text
+
+    Overlaps that only happen when two phrases are glued together mid-word
+    (e.g. "join now" + "we're" as "join nowe're") are not counted.
+    """
+    return (_contains_aligned(second, first) or _contains_aligned(first, second)
+            or _edges_overlap(first, second) or _edges_overlap(second, first))
+
+def rules_conflict(earlier, later):
+    """True if applying earlier then later can differ from one combined scan"""
+    earlier_phrase, earlier_replacement, _ = earlier
+    later_phrase, _, later_bounded = later
+
+    first = earlier_phrase.lower()
+    second = later_phrase.lower()
+    replacement = earlier_replacement.lower()
+
+    # Matches of the two rules could overlap in the original text
+    if _can_overlap(first, second):
+        return True
+
+    # The later rule could match inside or across the earlier rule's output
+    if not replacement or _can_overlap(replacement, second):
+        return True
+
+    # A word-bounded later rule could see different \b edges after the rewrite
+    if later_bounded:
+        if _is_word_char(first[0]) != _is_word_char(replacement[0]):
+            return True
+        if _is_word_char(first[-1]) != _is_word_char(replacement[-1]):
+            return True
+
+    return False
+
+def split_into_stages(rules):
+    """Group ordered rules into consecutive stages that are safe to run as one scan"""
+    stages = []
+    current = []
+
+    for rule in rules:
+        if any(rules_conflict(existing, rule) for existing in current):
+            stages.append(current)
+            current = []
+        current.append(rule)
+
+    if current:
+        stages.append(current)
+
+    return stages
+
+# -------------------- COMPILED RULE SETS -------------------- #
+
+class RuleStage:
+    """One conflict-free group of rules compiled into a single alternation regex"""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.lookup = {}
+        for phrase, replacement, _ in rules:
+            self.lookup.setdefault(phrase.lower(), replacement)
+
+        bounded = [phrase for phrase, _, is_bounded in rules if is_bounded]
+        unbounded = [phrase for phrase, _, is_bounded in rules if not is_bounded]
+
+        alternatives = []
+        if bounded:
+            alternatives.append(f"\\b(?:{build_trie_pattern(bounded)})\\b")
+        if unbounded:
+            alternatives.append(f"(?:{build_trie_pattern(unbounded)})")
+
+        self.pattern = "|".join(alternatives)
+        self._regex = None
+
+    @property
+    def regex(self):
+        # Compiled on first use, so stages loaded from the rule pack cache cost nothing until needed
+        if self._regex is None:
+            self._regex = re.compile(self.pattern, flags=re.IGNORECASE)
+        return self._regex
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_regex"] = None
+        return state
+
+    def _replace(self, match):
+        matched = match.group(0)
+        replacement = self.lookup.get(matched.lower())
+        if replacement is not None:
+            return replacement
+
+        # Case-folding that str.lower() does not mirror (e.g. the Kelvin sign)
+        for phrase, replacement, _ in self.rules:
+            if re.fullmatch(re.escape(phrase), matched, flags=re.IGNORECASE):
+                return replacement
+        return matched
+
+    def apply(self, text):
+        return self.regex.sub(self._replace, text)
+
+class CompiledRuleSet:
+    """Ordered phrase rules compiled once and applied in as few scans as possible"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.stages = [RuleStage(stage) for stage in split_into_stages(self.rules)]
+
+    def apply(self, text):
+        for stage in self.stages:
+            text = stage.apply(text)
+        return text
+
+    def __len__(self):
+        return len(self.rules)
+
+def word_rules(pairs):
+    """Rules that only match on word boundaries"""
+    return [(phrase, replacement, True) for phrase, replacement in pairs]
+
+def phrase_rules(pairs):
+    """Rules that match anywhere in the text"""
+    return [(phrase, replacement, False) for phrase, replacement in pairs]
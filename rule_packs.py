@@ -0,0 +1,215 @@
+# RULE PACKS - Training tables and preserved words loaded from data files
+# The tables in rules/*.json and preserve_words.txt make up one rule pack,
+# identified by a hash of their contents. Compiled matchers are cached on disk
+# under that hash, and a watcher thread swaps in a new pack when the files change
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import threading
+
+from rule_engine import CompiledRuleSet, build_word_pattern
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RULES_DIR = os.getenv("RULE_PACK_DIR", os.path.join(BASE_DIR, "rules"))
+PRESERVE_WORDS_FILE = os.getenv("PRESERVE_WORDS_FILE", os.path.join(BASE_DIR, "preserve_words.txt"))
+CACHE_DIR = os.getenv("RULE_PACK_CACHE_DIR", os.path.join(RULES_DIR, ".cache"))
+WATCH_INTERVAL_SECONDS = float(os.getenv("RULE_PACK_WATCH_INTERVAL", "5"))
+
+# Compiled packs kept on disk; older ones are pruned when a new pack is cached
+CACHE_KEEP = 5
+
+# -------------------- RULE PACK -------------------- #
+
+class RulePack:
+    """One version of the training tables and preserved words, with the matchers compiled from them"""
+
+    def __init__(self, pack_hash, tables, preserve_words):
+        self.pack_hash = pack_hash
+        self.tables = tables
+        self.preserve_words = preserve_words
+        self.preserve_word_pattern = build_word_pattern(preserve_words)
+        self.rule_sets = {}
+        self._preserve_word_matcher = None
+
+    @property
+    def preserve_word_matcher(self):
+        if self._preserve_word_matcher is None and self.preserve_word_pattern:
+            self._preserve_word_matcher = re.compile(self.preserve_word_pattern, flags=re.IGNORECASE)
+        return self._preserve_word_matcher
+
+    def get_rule_set(self, key, build_rules):
+        """Get the compiled rule set for key, compiling build_rules() on first use"""
+        rule_set = self.rule_sets.get(key)
+        if rule_set is None:
+            rule_set = CompiledRuleSet(build_rules())
+            self.rule_sets[key] = rule_set
+        return rule_set
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_preserve_word_matcher"] = None
+        return state
+
+# -------------------- LOADING -------------------- #
+
+def list_pack_files(rules_dir=RULES_DIR, preserve_words_file=PRESERVE_WORDS_FILE):
+    """All files that make up a rule pack, in a stable order"""
+    files = []
+    if os.path.isdir(rules_dir):
+        files = [os.path.join(rules_dir, name) for name in sorted(os.listdir(rules_dir)) if name.endswith(".json")]
+    if os.path.exists(preserve_words_file):
+        files.append(preserve_words_file)
+    return files
+
+def files_signature(paths):
+    """Cheap change marker for the watcher: (path, mtime, size) of every file"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def hash_pack_contents(contents):
+    """Content hash of a rule pack; file names are included so renames count as changes"""
+    digest = hashlib.sha256()
+    for path, data in contents:
+        digest.update(os.path.basename(path).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def _pairs_to_tuples(value):
+    """JSON has no tuples, so [phrase, replacement] lists come back as tuples like the old tables"""
+    if isinstance(value, dict):
+        return {key: _pairs_to_tuples(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [tuple(item) if isinstance(item, list) else _pairs_to_tuples(item) for item in value]
+    return value
+
+def parse_pack_contents(contents, preserve_words_file=PRESERVE_WORDS_FILE):
+    """Turn raw file contents into (tables, preserve_words)"""
+    tables = {}
+    preserve_words = []
+    for path, data in contents:
+        if path == preserve_words_file:
+            text = data.decode("utf-8")
+            preserve_words = [line.strip() for line in text.splitlines() if line.strip()]
+        else:
+            table_name = os.path.splitext(os.path.basename(path))[0]
+            tables[table_name] = _pairs_to_tuples(json.loads(data.decode("utf-8")))
+    return tables, preserve_words
+
+def code_digest(code_files):
+    """Hash of the code that compiles a pack, so a code change never serves stale compiled rules"""
+    digest = hashlib.sha256()
+    for path in [__file__, *code_files]:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def _cache_path(cache_dir, pack_hash, code_hash):
+    return os.path.join(cache_dir, f"{pack_hash}-{code_hash}.pickle")
+
+def load_cached_pack(pack_hash, code_hash, cache_dir=CACHE_DIR):
+    """Load a compiled pack from the disk cache, or None if it is missing or unreadable"""
+    try:
+        with open(_cache_path(cache_dir, pack_hash, code_hash), "rb") as f:
+            pack = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable rule pack cache %s: %s", pack_hash, e)
+        return None
+    return pack if isinstance(pack, RulePack) and pack.pack_hash == pack_hash else None
+
+def save_cached_pack(pack, code_hash, cache_dir=CACHE_DIR):
+    """Write a compiled pack to the disk cache; a failed write only costs the next cold start"""
+    path = _cache_path(cache_dir, pack.pack_hash, code_hash)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(pack, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Could not write rule pack cache %s: %s", pack.pack_hash, e)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+    _prune_cache(cache_dir)
+
+def _prune_cache(cache_dir, keep=CACHE_KEEP):
+    """Remove all but the newest cached packs"""
+    try:
+        paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pickle")]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[keep:]:
+            os.remove(path)
+    except OSError:
+        pass
+
+def load_rule_pack(warm=None, code_files=(), rules_dir=RULES_DIR, preserve_words_file=PRESERVE_WORDS_FILE, cache_dir=CACHE_DIR):
+    """Load the current rule pack, from the disk cache when its content hash has been compiled before
+
+    warm(pack) is called on a freshly built pack to compile its rule sets before caching;
+    code_files are the modules warm() depends on and are part of the cache key.
+    """
+    code_hash = code_digest(code_files)
+    contents = []
+    for path in list_pack_files(rules_dir, preserve_words_file):
+        with open(path, "rb") as f:
+            contents.append((path, f.read()))
+    pack_hash = hash_pack_contents(contents)
+
+    pack = load_cached_pack(pack_hash, code_hash, cache_dir)
+    if pack is not None:
+        return pack
+
+    tables, preserve_words = parse_pack_contents(contents, preserve_words_file)
+    pack = RulePack(pack_hash, tables, preserve_words)
+    if warm:
+        warm(pack)
+    save_cached_pack(pack, code_hash, cache_dir)
+    return pack
+
+# -------------------- WATCHER -------------------- #
+
+class RulePackWatcher(threading.Thread):
+    """Polls the rule pack files and calls on_change() when any of them is added, removed or modified"""
+
+    def __init__(self, on_change, interval=WATCH_INTERVAL_SECONDS, rules_dir=RULES_DIR, preserve_words_file=PRESERVE_WORDS_FILE):
+        super().__init__(name="rule-pack-watcher", daemon=True)
+        self.on_change = on_change
+        self.interval = interval
+        self.rules_dir = rules_dir
+        self.preserve_words_file = preserve_words_file
+        self._stop_event = threading.Event()
+        self._signature = self._current_signature()
+
+    def _current_signature(self):
+        return files_signature(list_pack_files(self.rules_dir, self.preserve_words_file))
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            signature = self._current_signature()
+            if signature == self._signature:
+                continue
+            try:
+                self.on_change()
+            except Exception as e:
+                # Keep serving the current pack; a fixed file will trigger another reload
+                logger.warning("Rule pack reload failed, keeping the active pack: %s", e)
+            self._signature = signature
+
+    def stop(self):
+        self._stop_event.set()
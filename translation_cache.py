@@ -0,0 +1,172 @@
+# TRANSLATION CACHE - Stage-aware result cache for the Sarvam and ChatGPT steps
+# An in-process LRU sits in front of a SQLite store that survives restarts.
+# Each stage is keyed on the normalized input, only the parameters that stage
+# actually uses, and the rule pack version, so editing rules/ invalidates it.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Set TRANSLATION_CACHE_DB to an empty string for a memory-only cache
+CACHE_DB_PATH = os.getenv("TRANSLATION_CACHE_DB", os.path.join(BASE_DIR, "translation_cache.sqlite3"))
+CACHE_TTL_SECONDS = float(os.getenv("TRANSLATION_CACHE_TTL", str(7 * 24 * 3600)))
+MEMORY_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_MEMORY_SIZE", "1024"))
+DISK_CACHE_MAX_ROWS = int(os.getenv("TRANSLATION_CACHE_MAX_ROWS", "50000"))
+
+# How many writes between sweeps of expired and overflowing disk rows
+PRUNE_EVERY_PUTS = 200
+
+SARVAM_STAGE = "sarvam"
+CHATGPT_STAGE = "chatgpt"
+
+# -------------------- KEYS -------------------- #
+
+def normalize_cache_text(text):
+    """Text as far as the cache is concerned: NFC, Unix newlines, no outer whitespace"""
+    return unicodedata.normalize("NFC", text.replace("\r\n", "\n")).strip()
+
+def make_cache_key(stage, text, params, version):
+    """Stable key for one stage: normalized text + that stage's parameters + rule pack version"""
+    material = json.dumps([stage, normalize_cache_text(text), params, version], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+# -------------------- CACHE -------------------- #
+
+class TranslationCache:
+    """Two-level (memory LRU, then SQLite) cache of stage results with TTL, eviction and hit counters
+
+    Values are anything JSON can hold: a translation string, or a dict such as a raw
+    ChatGPT response next to its cleaned result. Both levels are bounded by entry count.
+    """
+
+    def __init__(self, db_path=CACHE_DB_PATH, memory_size=MEMORY_CACHE_SIZE, ttl_seconds=CACHE_TTL_SECONDS, max_rows=DISK_CACHE_MAX_ROWS):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._disk_failed = False
+        self._puts = 0
+        self._stats = {}
+
+    def _count(self, stage, outcome):
+        stage_stats = self._stats.setdefault(stage, {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0})
+        stage_stats[outcome] += 1
+
+    def _db(self):
+        """The SQLite connection, opened on first use; None when disabled or unusable"""
+        if self._connection is None and self.db_path and not self._disk_failed:
+            try:
+                connection = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "key TEXT PRIMARY KEY, stage TEXT NOT NULL, value TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed_at)")
+                connection.commit()
+                self._connection = connection
+            except sqlite3.Error as e:
+                logger.warning("Translation cache falling back to memory only (%s): %s", self.db_path, e)
+                self._disk_failed = True
+        return self._connection
+
+    def _remember(self, key, value, created_at):
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _is_fresh(self, created_at, now):
+        return now - created_at < self.ttl_seconds
+
+    def get(self, stage, key, bypass=False):
+        """Cached value for key, or None on a miss; bypass=True always misses (the value is still refreshed by put)"""
+        with self._lock:
+            if bypass:
+                self._count(stage, "bypassed")
+                return None
+            now = time.time()
+
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self._count(stage, "memory_hits")
+                    return entry[0]
+                del self._memory[key]
+
+            db = self._db()
+            if db is not None:
+                try:
+                    row = db.execute("SELECT value, created_at FROM translations WHERE key = ?", (key,)).fetchone()
+                    if row is not None and self._is_fresh(row[1], now):
+                        db.execute("UPDATE translations SET accessed_at = ? WHERE key = ?", (now, key))
+                        db.commit()
+                        value = json.loads(row[0])
+                        self._remember(key, value, row[1])
+                        self._count(stage, "disk_hits")
+                        return value
+                except (sqlite3.Error, ValueError) as e:
+                    logger.warning("Translation cache read failed: %s", e)
+
+            self._count(stage, "misses")
+            return None
+
+    def put(self, stage, key, value):
+        """Store value for key in both levels"""
+        with self._lock:
+            now = time.time()
+            self._remember(key, value, now)
+
+            db = self._db()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO translations (key, stage, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, stage, json.dumps(value, ensure_ascii=False), now, now)
+                )
+                db.commit()
+                self._puts += 1
+                if self._puts % PRUNE_EVERY_PUTS == 0:
+                    self._prune(db, now)
+            except sqlite3.Error as e:
+                logger.warning("Translation cache write failed: %s", e)
+
+    def _prune(self, db, now):
+        """Drop expired rows, then the least recently used rows beyond max_rows"""
+        db.execute("DELETE FROM translations WHERE created_at <= ?", (now - self.ttl_seconds,))
+        db.execute(
+            "DELETE FROM translations WHERE key IN ("
+            "SELECT key FROM translations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,)
+        )
+        db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            db = self._db()
+            if db is not None:
+                db.execute("DELETE FROM translations")
+                db.commit()
+
+    def stats(self):
+        """Hit/miss counters per stage since the process started"""
+        with self._lock:
+            return {stage: dict(counts) for stage, counts in self._stats.items()}
+
+translation_cache = TranslationCache()
@@ -1,490 +1,28 @@
 # COMBINED TRANSLATION ENHANCEMENTS - All 3 Layers + Team Training
-# This file contains all translation quality patterns and can be updated daily
-# without modifying the main app.py file
+# This file contains all translation quality logic; the pattern tables in rules/
+# can be updated daily and are picked up without restarting the app
 
+import os
 import re
-
-# -------------------- LAYER 1: MEETING & LIVE SESSION PATTERNS -------------------- #
-
-# Training patterns extracted from your Google Sheet examples
-QUALITY_TRAINING_PATTERNS = {
-    "hindi": {
-        "preferred_mixing": [
-            ("meeting", "meeting"), ("join", "join karo"), ("live", "LIVE"), ("tips", "tips"),
-            ("call", "call"), ("earnings", "earnings"), ("update", "update"), ("session", "session"),
-        ],
-        "natural_connectors": [
-            ("We're", "Hum"), ("Let's talk about", "Chalo baat karte hain"),
-            ("Join now", "Abhi join karo"), ("Don't miss", "Miss mat karna"),
-            ("Click & Join", "Click karo aur join karo"),
-        ],
-        "emotional_expressions": [
-            ("awesome", "awesome"), ("amazing", "amazing"), ("super", "super"),
-            ("really help", "bohot kaam aayega"),
-        ]
-    },
-    "tamil": {
-        "preferred_mixing": [
-            ("meeting", "meeting"), ("live", "LIVE"), ("tips", "tips"), ("call", "call"),
-            ("join", "join பண்ணுங்க"), ("miss", "miss பண்ணாதீங்க"), ("update", "update"), ("session", "session"),
-        ],
-        "natural_connectors": [
-            ("We're", "நாங்க"), ("Let's talk", "பேசலாம்"), ("Join now", "இப்போவே join பண்ணுங்க"),
-            ("Don't miss", "miss பண்ணாதீங்க"), ("Click & Join", "Click பண்ணி join பண்ணுங்க"),
-        ],
-        "emotional_expressions": [
-            ("awesome", "awesome ஆக்கிச்சு"), ("amazing", "அருமையா"), ("super", "super"),
-            ("really help", "definitely உங்களுக்கு help ஆகும்"),
-        ]
-    },
-    "telugu": {
-        "preferred_mixing": [
-            ("meeting", "meeting"), ("live", "LIVE"), ("tips", "tips"), ("call", "call"),
-            ("join", "join avvandi"), ("miss", "miss avvakandi"), ("update", "update"),
-        ],
-        "natural_connectors": [
-            ("We're", "Manam"), ("Let's talk", "Maatladukundam"),
-            ("Join now", "Ipude join avvandi"), ("Don't miss", "Miss avvakandi"),
-        ],
-        "emotional_expressions": [
-            ("awesome", "awesome"), ("amazing", "chala baagundi"), ("super", "super"),
-            ("really help", "chala useful ga untundi"),
-        ]
-    },
-    "malayalam": {
-        "preferred_mixing": [
-            ("meeting", "മീറ്റിംഗ്"), ("live", "LIVE"), ("tips", "ടിപ്സ്"), ("call", "കോൾ"),
-            ("join", "ജോയിൻ ചെയ്യൂ"), ("update", "അപ്ഡേറ്റ്"), ("tap", "ടാപ്പ് ചെയ്യൂ"),
-        ],
-        "natural_connectors": [
-            ("We're", "ഞങ്ങൾ"), ("Let's talk", "നമുക്ക് സംസാരിക്കാം"),
-            ("Join now", "ഇപ്പോൾ ജോയിൻ ചെയ്യൂ"), ("Don't miss", "നഷ്ടപ്പെടുത്തരുത്"),
-            ("right now", "ഇപ്പോൾ തന്നെ"), ("Tap to join", "ജോയിൻ ചെയ്യാൻ ടാപ്പ് ചെയ്യൂ"),
-        ],
-        "meeting_specific": [
-            ("FRND Meeting", "FRND മീറ്റിംഗ്"), ("is LIVE", "LIVE ആണ്"), ("happening now", "ഇപ്പോൾ നടക്കുന്നു"),
-            ("Jump in now", "ഇപ്പോൾ തന്നെ ചേരൂ"), ("from call tips to earnings", "കോൾ ടിപ്സ് മുതൽ എർണിങ്സ് വരെ"),
-        ]
-    },
-    "kannada": {
-        "preferred_mixing": [
-            ("meeting", "ಮೀಟಿಂಗ್"), ("live", "LIVE"), ("tips", "ಸಲಹೆಗಳು"), ("call", "ಕರೆ"),
-            ("join", "ಸೇರಿ"), ("update", "ಅಪ್ಡೇಟ್"), ("channel", "ಚಾನೆಲ್"),
-        ],
-        "natural_connectors": [
-            ("We're", "ನಾವು"), ("Let's talk", "ಮಾತನಾಡೋಣ"),
-            ("Join now", "ಈಗಲೇ ಸೇರಿ"), ("Don't miss", "ತಪ್ಪಿಸಿಕೊಳ್ಳಬೇಡಿ"),
-            ("Hi [Name]", "ನಮಸ್ಕಾರ [Name]"), ("guess what", "ಗೆಸ್ ಮಾಡಿ"),
-        ],
-        "whatsapp_specific": [
-            ("WhatsApp Channel", "WhatsApp ಚಾನೆಲ್"), ("special invite list", "ಸ್ಪೆಷಲ್ ಲಿಸ್ಟ್"),
-            ("completely free", "ಫ್ರೀ ಆಗಿದೆ"), ("numbers will not be visible", "ಫೋನ್ ನಂಬರ್ ಪ್ರೈವೇಟ್ ಆಗಿರುತ್ತೆ"),
-            ("Join Channel", "ಜಾಯಿನ್ ಚಾನೆಲ್"), ("tap on follow", "ಫಾಲೋ ಮಾಡಿ"),
-        ]
-    }
-}
-
-# -------------------- LAYER 2: WHATSAPP CHANNEL & PRIVACY PATTERNS -------------------- #
-
-ADDITIONAL_QUALITY_PATTERNS = {
-    "hindi": {
-        "whatsapp_patterns": [
-            ("WhatsApp Channel", "WhatsApp Channel"), ("join now", "abhi join karo"),
-            ("click to join", "click karke join karo"), ("all tips", "saare tips"),
-            ("pro tips", "pro tips"), ("100% Private", "100% Private"), ("Number Privacy", "Number Privacy"),
-        ],
-        "earnings_patterns": [
-            ("₹40K/month", "mahine ka ₹40K"), ("big earnings", "achhi kamai"),
-            ("earn smarter", "kamao smarter"), ("small earnings", "kam earnings"),
-            ("more money", "zyada kamaai"), ("start earning", "kamai shuru karo"),
-        ],
-        "casual_connectors": [
-            ("Hey!", "Hey!"), ("Tired of", "thak gaye hoge na"), ("Let's fix that", "Chinta mat karo"),
-            ("ready to level up", "ready for level up"), ("You're not alone", "Don't worry, hum hai na"),
-            ("New here?", "Naye ho?"),
-        ],
-        "app_tech_terms": [
-            ("audio & video calls", "audio & video calls"), ("badge", "badge"), ("level up", "level up"),
-            ("go online", "online jao"), ("tap here", "tap karo"), ("click here", "click karo"),
-        ]
-    },
-    "tamil": {
-        "whatsapp_patterns": [
-            ("WhatsApp Channel", "WhatsApp Channel"), ("join now", "இப்போவே join பண்ணுங்க"),
-            ("click to join", "Click பண்ணி join பண்ணுங்க"), ("all tips", "எல்லா tips-உம்"),
-            ("pro tips", "pro tips"), ("100% Private", "100% Private & Safe"),
-            ("Number Privacy", "Number Privacy assured"),
-        ],
-        "earnings_patterns": [
-            ("₹40K/month", "₹40K/month"), ("big earnings", "பெரிய income"),
-            ("earn smarter", "smarter earn பண்ண"), ("small earnings", "கம்மி earnings"),
-            ("more money", "more money"), ("start earning", "earn பண்ண ஆரம்பிக்கலாம்"),
-        ],
-        "casual_connectors": [
-            ("Hey!", "Hey!"), ("Tired of", "bore ஆகிட்டீங்களா"), ("Let's fix that", "இப்போ fix பண்ணலாம்"),
-            ("ready to level up", "next level போக தயாரா"), ("You're not alone", "நீங்கள் தனியா இல்ல"),
-            ("New here?", "இது உங்க first time-a?"),
-        ],
-        "app_tech_terms": [
-            ("audio & video calls", "Audio & Video calls"), ("badge", "Badge"), ("level up", "level up"),
-            ("go online", "Go Online போங்க"), ("tap here", "இங்கே tap பண்ணுங்க"),
-        ]
-    },
-    "telugu": {
-        "whatsapp_patterns": [
-            ("WhatsApp Channel", "WhatsApp Channel"), ("join now", "ipude join avvandi"),
-            ("click to join", "Click chesi join avvandi"), ("all tips", "All tips"), ("100% Private", "100% Private"),
-        ],
-        "earnings_patterns": [
-            ("₹40K/month", "₹40K/month"), ("start earning", "earning start cheyyali"), ("level up", "level up"),
-        ],
-        "casual_connectors": [
-            ("New here?", "App ki new ah?"), ("ready to level up", "ready to level up?"), ("few days", "Few days aiyayi kadha"),
-        ],
-        "app_tech_terms": [
-            ("go online", "online vellandi"), ("audio & video calls", "audio & video calls"), ("badge", "badge"),
-        ]
-    },
-    "malayalam": {
-        "whatsapp_patterns": [
-            ("WhatsApp Channel", "WhatsApp ചാനൽ"), ("join now", "ഇപ്പോൾ ജോയിൻ ചെയ്യൂ"),
-            ("click to join", "ജോയിൻ ചെയ്യാൻ ക്ലിക്ക് ചെയ്യൂ"), ("all tips", "എല്ലാ ടിപ്പുകളും"),
-            ("pro tips", "പ്രൊ ടിപ്പുകൾ"), ("100% Private", "100% സ്വകാര്യവും സുരക്ഷിതവുമാണ്"),
-            ("special invite list", "സ്പെഷ്യൽ ഇൻവൈറ്റ് ലിസ്റ്റ്"), ("brand-new", "പുതിയ"),
-            ("completely free", "പൂർണ്ണമായും സൗജന്യം"), ("numbers will not be visible", "നമ്പർ മറ്റാരും കാണില്ല"),
-        ],
-        "earnings_patterns": [
-            ("₹40K/month", "മാസം 40K"), ("big earnings", "വലിയ വരുമാനം"),
-            ("small earnings", "ചെറിയ വരുമാനം"), ("start earning", "സമ്പാദിക്കാൻ ആരംഭിക്കാം"),
-        ],
-        "casual_connectors": [
-            ("New here?", "പുതിയ ആളാണോ?"), ("You're not alone", "നിങ്ങൾ ഒറ്റയ്ക്കല്ല"),
-            ("ready to level up", "ലെവൽ അപ്പ് ചെയ്യണ്ടേ"), ("Hi [Name]", "നമസ്കാരം [പേര്]"),
-            ("guess what", "ഒന്ന് Guess ചെയാമോ"), ("and guess what", "ഒന്ന് Guess ചെയാമോ"),
-        ],
-        "channel_specific": [
-            ("Be the first to know", "ആദ്യം അറിയാം"), ("Learn simple ways", "എളുപ്പ മാർഗങ്ങൾ പഠിക്കാം"),
-            ("Get news on", "വാർത്തകൾ അറിയാം"), ("discounts", "ഓഫറുകളുടെ വിവരങ്ങൾ"),
-            ("favourite trainer", "ഇഷ്ടപ്പെട്ട ട്രെയിനർ"), ("connect with", "കണക്റ്റ് ചെയ്യാൻ"),
-            ("surprise rewards", "സർപ്രൈസ് സമ്മാനങ്ങൾ"), ("dont forget to tap on follow", "Follow അമർത്താൻ മറക്കരുത്"),
-            ("never miss anything fun", "ഒരിക്കലും ഫൺ മിസ്സ് ആവില്ല"),
-        ]
-    },
-    "kannada": {
-        "whatsapp_patterns": [
-            ("WhatsApp Channel", "WhatsApp ಚಾನಲ್"), ("join now", "ಈಗಲೇ ಸೇರಿ"),
-            ("all tips", "ಎಲ್ಲಾ ಟಿಪ್ಸ್"), ("pro tips", "ಪ್ರೊ ಟಿಪ್ ಗಳು"), ("100% Private", "100% ಪ್ರೈವೇಟ್"),
-            ("brand-new", "ಹೊಚ್ಚ ಹೊಸ"), ("special invite list", "ಸ್ಪೆಷಲ್ ಲಿಸ್ಟ್"),
-            ("completely free", "ಫ್ರೀ"), ("numbers will not be visible", "ನಂಬರ್ ಪ್ರೈವೇಟ್ ಆಗಿರುತ್ತೆ"),
-        ],
-        "earnings_patterns": [
-            ("₹40K/month", "ತಿಂಗಳಿಗೆ ₹40K"), ("small earnings", "ಸಣ್ಣ ಗಳಿಕೆ"), ("start earning", "ಗಳಿಸಲು ಪ್ರಾರಂಭಿಸಿ"),
-        ],
-        "casual_connectors": [
-            ("New here?", "ಇಲ್ಲಿ ಹೊಸಬರೇ?"), ("You're not alone", "ನೀವು ಒಬ್ಬಂಟಿಯಲ್ಲ"),
-            ("ready to level up", "ಮುಂದಿನ ಹಂತಕ್ಕೆ ಹೋಗಲು ಸಿದ್ಧರಿದ್ದೀರಾ"),
-            ("guess what", "ಗೆಸ್ಸ್ ಮಾಡಿ"), ("Hi [Name]", "ನಮಸ್ಕಾರ [Name]"),
-        ],
-        "channel_specific": [
-            ("Be the first to know", "ಫಸ್ಟ್ ಆಗಿ ತಿಳಿಯಿರಿ"), ("Learn simple ways", "ಸರಳ ಮಾರ್ಗಗಳನ್ನು ತಿಳಿಯಿರಿ"),
-            ("Get news on", "ನ್ಯೂಸ್ ತಿಳಿಯಿರಿ"), ("discounts", "ಡಿಸ್ಕೌಂಟ್ಸ್"),
-            ("favourite trainer", "ಟ್ರೈನರ್ಸ್"), ("connect with", "ಕನೆಕ್ಟ್ ಆಗುವಾಕ್ಕ್"),
-            ("surprise rewards", "ಸುಪ್ರಿಸೆ ಗಾಲ"), ("dont forget to tap on follow", "ಫಾಲೋ ಮಾಡೋದನ್ನ ಮರೀಬೇಡಿ"),
-            ("never miss anything fun", "ಮಜಾ ಯಾವತ್ತೂ ಮಿಸ್ ಆಗೋದು ಇಲ್ಲ"), ("that simple", "ಇಷ್ಟು ಸಿಂಪಲ್"),
-        ]
-    }
-}
-
-# -------------------- LAYER 3: FESTIVAL & HOLIDAY PATTERNS -------------------- #
-
-FESTIVAL_QUALITY_PATTERNS = {
-    "hindi": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "Raksha Bandhan"), ("Rakhi", "Rakhi"), ("your brother", "apne bhai ko"),
-            ("Gift Your Bhai", "Apne Bhai ko do"), ("Protection", "Protection"),
-            ("₹1000 Hamper", "₹1000 ka Hamper"), ("₹1000 Gift", "₹1000 ka Gift"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "Holiday"), ("It's a holiday", "Aaj chhutti hai"), ("Holiday =", "Holiday ="),
-            ("time to earn", "kamaane ka time"), ("peak time", "peak time"), ("long weekend", "lamba weekend"),
-            ("Good Morning", "Good Morning"), ("Happy Raksha Bandhan", "Happy Raksha Bandhan"),
-        ],
-        "gift_earning_patterns": [
-            ("Just by being online", "Sirf Online aakar"), ("earn real money", "kamao real money"),
-            ("in your wallet", "apne wallet mein"), ("More time = More", "Jitna zyada time = Utne zyada"),
-            ("Make this Rakhi extra special", "Iss Rakhi ko banao extra special"),
-            ("Your time = Your earnings", "Tumhara time = Tumhari earning"),
-        ],
-        "encouragement_patterns": [
-            ("Tonight's the Night", "Aaj ki raat hai khaas"), ("Beautiful!", "Beautiful!"),
-            ("Don't miss out", "Miss mat karo"), ("Why wait?", "Toh phir rukna kyu?"),
-            ("Go online now", "Abhi online jao"), ("Let the spotlight find YOU", "spotlight aap tak khud aa jaayegi"),
-        ]
-    },
-    "tamil": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "Raksha Bandhan"), ("Rakhi", "Rakhi"), ("your brother", "உங்க அண்ணன்/தம்பிக்கு"),
-            ("₹1000 Gift", "₹1000 Gift"), ("₹1000 Hamper", "₹1000 Gift"), ("Protection", "பாதுகாப்பு"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "Holiday"), ("It's a holiday", "இன்று விடுமுறை"), ("Holiday =", "Holiday ="),
-            ("time to earn", "earn பண்ண நேரம்"), ("peak time", "Peak Time"),
-            ("Good Morning", "Good Morning"), ("Happy Raksha Bandhan", "Happy Raksha Bandhan"),
-        ],
-        "gift_earning_patterns": [
-            ("Just by being online", "FRND-ல Onlineல இருந்தாலே போதும்"), ("earn real money", "நேரடி பணம் சேரும்"),
-            ("in your wallet", "Wallet-ல"), ("More time = More", "அதிக நேரம் = அதிக"),
-            ("Make this Rakhi extra special", "இந்த Rakhi-யை Special-aa ஆக்குங்க"),
-            ("Your time = Your earnings", "உங்க நேரம் = உங்க சம்பாதிப்பு"),
-        ],
-        "encouragement_patterns": [
-            ("Tonight's the Night", "இன்று இரவு தான் உங்களுக்கு வாய்ப்பு"), ("Beautiful!", "Beautiful!"),
-            ("Don't miss out", "Miss பண்ணாதீங்க"), ("Why wait?", "Why Wait?"),
-            ("Go online now", "இப்போதே Online போங்க"), ("Let the spotlight find YOU", "உங்களை spotlight find பண்ண விடுங்க"),
-        ]
-    },
-    "telugu": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "Raksha Bandhan"), ("your brother", "మీ బ్రదర్ కి"),
-            ("₹1000 Hamper", "₹1000 హ్యాంపర్"), ("Protection", "రక్షణ"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "Holiday"), ("It's a holiday", "ఇవాళ హాలిడే"),
-            ("time to earn", "సంపాదించే సమయం"), ("peak time", "Peak Time"),
-        ],
-        "gift_earning_patterns": [
-            ("Just by being online", "FRND యాప్ లో ఆన్లైన్ ఉండడం ద్వారా"),
-            ("earn real money", "నిజమైన డబ్బు సంపాదించుకోవచ్చు"),
-            ("Your time = Your earnings", "మీ సమయం = మీ సంపాదన"),
-        ],
-        "encouragement_patterns": [
-            ("Don't miss out", "Miss avvakandi"), ("Go online now", "ఇప్పుడే ఆన్లైన్ వెళ్ళండి"),
-        ]
-    },
-    "malayalam": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "രക്ഷാ ബന്ധൻ"), ("your brother", "നിങ്ങളുടെ സഹോദരന്"), ("Protection", "പ്രൊട്ടക്ഷൻ"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "ഹോളിഡേ"), ("time to earn", "സമ്പാദിക്കാനുള്ള സമയം"), ("peak time", "പീക്ക് സമയം"),
-        ],
-        "gift_earning_patterns": [
-            ("earn real money", "റിയൽ പണം സമ്പാദിക്കൂ"), ("in your wallet", "നിങ്ങളുടെ വാലറ്റിൽ"),
-        ],
-        "encouragement_patterns": [
-            ("Don't miss out", "നഷ്ടപ്പെടുത്തരുത്"), ("Go online now", "ഇപ്പോൾ ഓൺലൈനിൽ പോകൂ"),
-        ]
-    },
-    "kannada": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "ರಕ್ಷಾ ಬಂಧನ"), ("your brother", "ನಿಮ್ಮ ಸಹೋದರನಿಗೆ"), ("Protection", "ರಕ್ಷಣೆ"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "ಹಾಲಿಡೇ"), ("time to earn", "ಗಳಿಸುವ ಸಮಯ"), ("peak time", "ಪೀಕ್ ಟೈಮ್"),
-        ],
-        "gift_earning_patterns": [
-            ("earn real money", "ನಿಜವಾದ ಹಣವನ್ನು ಗಳಿಸಿ"), ("in your wallet", "ನಿಮ್ಮ ವ್ಯಾಲೆಟ್ನಲ್ಲಿ"),
-        ],
-        "encouragement_patterns": [
-            ("Don't miss out", "ತಪ್ಪಿಸಿಕೊಳ್ಳಬೇಡಿ"), ("Go online now", "ಈಗಲೇ ಆನ್ಲೈನ್ಗೆ ಹೋಗಿ"),
-        ]
-    },
-    "odia": {
-        "rakhi_patterns": [
-            ("Raksha Bandhan", "Raksha Bandhan"), ("your brother", "ତୁମ ଭାଇଙ୍କୁ"), ("Protection", "ସୁରକ୍ଷା"),
-        ],
-        "holiday_patterns": [
-            ("Holiday", "ହଲିଡେ"), ("time to earn", "କମେଇବାର ସମୟ"),
-        ],
-        "gift_earning_patterns": [
-            ("earn real money", "ଟଙ୍କା କମାନ୍ତୁ"), ("Go online now", "ଏବେ ଅନଲାଇନ୍ ଆସନ୍ତୁ"),
-        ]
-    }
-}
-
-# -------------------- NEW: TEAM TRAINING CORRECTIONS -------------------- #
-
-# Based on the training data provided by your team
-TEAM_TRAINING_CORRECTIONS = {
-    "ml-IN": {
-        # From Malayalam training data - key issues identified
-        "meeting_corrections": [
-            # Issue: Over-explaining instead of direct translation
-            ("explained version", "direct translation"),
-            # Issue: Missing last line or incomplete sentences
-            ("incomplete_pattern", "complete_all_sentences"),
-            # Correct patterns from team corrections
-            ("The FRND Meeting is happening now", "FRND മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു"),
-            ("From call tips to earnings", "കോൾ ടിപ്സ് മുതൽ എർണിങ്സ് വരെ ഡിസ്കസ് ചെയ്യുന്നു"),
-            ("Jump in now if you haven't already", "ഇപ്പോൾ തന്നെ ചേരൂ"),
-            ("FRND Meeting is LIVE right now", "FRND മീറ്റിംഗ് ഇപ്പോൾ LIVE ആണ്"),
-            ("Tap to join – useful tips being shared", "ജോയിൻ ചെയ്യാൻ ടാപ്പ് ചെയ്യൂ"),
-        ],
-        "whatsapp_corrections": [
-            # More natural greeting and structure from team version
-            ("Hi [Name]", "നമസ്കാരം [പേര്]"),
-            ("brand-new WhatsApp Channel", "പുതിയ WhatsApp ചാനൽ"),
-            ("guess what", "ഒന്ന് Guess ചെയാമോ"),
-            ("special invite list", "സ്പെഷ്യൽ ഇൻവൈറ്റ് ലിസ്റ്റ്"),
-            ("Be the first to know about discounts", "ഓഫറുകളുടെ വിവരങ്ങൾ ആദ്യം അറിയാം"),
-            ("Learn simple ways to connect", "എളുപ്പ മാർഗങ്ങൾ പഠിക്കാം"),
-            ("favourite trainer", "ഇഷ്ടപ്പെട്ട ട്രെയിനർ"),
-            ("Get news on campaign, events & surprise rewards", "ക്യാമ്പെയ്ൻ, ഇവന്റ്സ് & സർപ്രൈസ് സമ്മാനങ്ങളുടെ വാർത്തകൾ അറിയാം"),
-            ("completely free", "പൂർണ്ണമായും സൗജന്യം"),
-            ("numbers will not be visible", "നമ്പർ മറ്റാരും കാണില്ല"),
-            ("dont forget to tap on follow", "Follow അമർത്താൻ മറക്കരുത്"),
-            ("never miss anything fun", "ഒരിക്കലും ഫൺ മിസ്സ് ആവില്ല"),
-        ]
-    },
-    "kn-IN": {
-        # From Kannada training data - key issues identified
-        "whatsapp_corrections": [
-            # Issue: Missing words, mixed up order, incomplete sentences
-            ("Hi [Name]", "ನಮಸ್ಕಾರ [Name]"),
-            ("brand-new WhatsApp Channel", "ಹೊಚ್ಚ ಹೊಸ WhatsApp ಚಾನೆಲ್"),
-            ("guess what", "ಗೆಸ್ಸ್ ಮಾಡಿ"),
-            ("special invite list", "ಸ್ಪೆಷಲ್ ಲಿಸ್ಟ್"),
-            ("Be the first to know about discounts", "ಡಿಸ್ಕೌಂಟ್ಸ್ ಬಗ್ಗೆ ಫಸ್ಟ್ ಆಗಿ ತಿಳಿಯಿರಿ"),
-            ("Learn simple ways to connect", "ಟ್ರೈನರ್ಸ್ ಜೊತೆ ಕನೆಕ್ಟ್ ಆಗುವ ಸರಳ ಮಾರ್ಗಗಳನ್ನು ತಿಳಿಯಿರಿ"),
-            ("favourite trainer", "ಟ್ರೈನರ್ಸ್"),
-            ("Get news on campaign, events & surprise rewards", "ಕ್ಯಾಂಪೇನ್, ಈವೆಂಟ್ಸ್ ಮತ್ತು ಸುಪ್ರಿಸೆ ರಿವಾರ್ಡ್ಸ್ ಬಗ್ಗೆ ನ್ಯೂಸ್ ತಿಳಿಯಿರಿ"),
-            ("completely free", "ಫ್ರೀ ಆಗಿದೆ"),
-            ("numbers will not be visible", "ಫೋನ್ ನಂಬರ್ ಪ್ರೈವೇಟ್ ಆಗಿರುತ್ತೆ"),
-            ("Click on Join Channel", "ಜಾಯಿನ್ ಚಾನೆಲ್ ಮೇಲೆ ಕ್ಲಿಕ್ ಮಾಡಿ"),
-            ("dont forget to tap on follow", "ಫಾಲೋ ಮಾಡೋದನ್ನ ಮರೀಬೇಡಿ"),
-            ("that simple", "ಇಷ್ಟು ಸಿಂಪಲ್"),
-            ("never miss anything fun on FRND", "FRND‌ನಲ್ಲಿ ಮಜಾ ಯಾವತ್ತೂ ಮಿಸ್ ಆಗೋದು ಇಲ್ಲ"),
-        ]
-    }
-}
-
-# -------------------- COMBINED TRAINING FIXES -------------------- #
-
-LAYER1_TRAINING_FIXES = {
-    "hi-IN": {
-        "We're LIVE": "Hum LIVE hain", "Join now": "Abhi join karo", "Don't miss": "Miss mat karna",
-        "Click & Join": "Click karo aur join karo", "Let's talk": "Chalo baat karte hain",
-        "Tips, updates": "Tips, updates", "Really help": "Bohot kaam aayega",
-        "Amazing session": "Amazing session tha", "We're waiting": "Hum wait kar rahe hain",
-    },
-    "ta-IN": {
-        "We're LIVE": "நாங்க LIVE ஆ இருக்கோம்", "Join now": "இப்போவே join பண்ணுங்க",
-        "Don't miss": "miss பண்ணாதீங்க", "Let's talk": "பேசலாம்",
-        "Really help": "definitely உங்களுக்கு help ஆகும்", "Amazing session": "session awesome ஆக்கிச்சு",
-        "We're waiting": "உங்களுக்காக wait பண்ணிட்டு இருக்காங்க",
-    },
-    "te-IN": {
-        "We're LIVE": "Manam LIVE lo unnam", "Join now": "Ipude join avvandi", "Don't miss": "Miss avvakandi",
-        "Let's talk": "Maatladukundam", "Really help": "Chala useful ga untundi", "We're waiting": "Meeku wait chesthunnaru",
-    },
-    "ml-IN": {
-        "We're LIVE": "ഞങ്ങൾ LIVE ആണ്", "Join now": "ഇപ്പോൾ ജോയിൻ ചെയ്യൂ", "Don't miss": "നഷ്ടപ്പെടുത്തരുത്",
-        "Let's talk": "നമുക്ക് സംസാരിക്കാം", "Really help": "ശരിക്കും സഹായിക്കും",
-        # Team training additions
-        "The FRND Meeting is happening now": "FRND മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു",
-        "FRND Meeting is LIVE right now": "FRND മീറ്റിംഗ് ഇപ്പോൾ LIVE ആണ്",
-        "Tap to join": "ജോയിൻ ചെയ്യാൻ ടാപ്പ് ചെയ്യൂ",
-        "Jump in now": "ഇപ്പോൾ തന്നെ ചേരൂ",
-        "from call tips to earnings": "കോൾ ടിപ്സ് മുതൽ എർണിങ്സ് വരെ",
-    },
-    "kn-IN": {
-        "We're LIVE": "ನಾವು ಲೈವ್ ಆಗಿದ್ದೇವೆ", "Join now": "ಈಗಲೇ ಸೇರಿ", "Don't miss": "ತಪ್ಪಿಸಿಕೊಳ್ಳಬೇಡಿ",
-        "Let's talk": "ಮಾತನಾಡೋಣ", "Really help": "ನಿಜವಾಗಿಯೂ ಸಹಾಯ ಮಾಡುತ್ತದೆ",
-    }
-}
-
-LAYER2_TRAINING_FIXES = {
-    "hi-IN": {
-        "Want to earn ₹40K/month": "₹40K/month kamaana hai", "Join our new WhatsApp Channel": "Naya WhatsApp Channel join karo",
-        "All tips here": "Saare tips yahin milenge", "Click to join": "Click karke join karo",
-        "100% Number Privacy": "100% Number Privacy Guarantee", "Hey! Secret to": "Hey! Secret",
-        "Tired of small earnings": "Kam earnings se thak gaye hoge na", "Let's fix that": "Chinta mat karo",
-        "New here? You're not alone": "Naye ho? Don't worry, hum hai na", "Ready to level up": "Ready for level up",
-        "Few days in now": "Ab toh kuch din hogaye hai",
-    },
-    "ta-IN": {
-        "₹40K/month FRND": "₹40K/month FRND-ல", "join new WhatsApp Channel": "New WhatsApp Channel-la join பண்ணுங்க",
-        "All pro tips here": "Pro tips-லாம் இங்க இருக்கு", "Click to join": "Click பண்ணி join பண்ணுங்க",
-        "100% Number Privacy": "100% Number Privacy Guarantee!", "Hey! Secret to big": "Hey! பெரிய income-க்கு secret",
-        "Tired of small earnings": "கம்மி earnings-ல bore ஆகிட்டீங்களா", "Let's fix that": "இப்போ fix பண்ணலாம்",
-        "New here? You're not alone": "இது உங்க first time-a? நீங்கள் தனியா இல்ல",
-        "Ready to level up": "next level போக தயாரா", "Few days in now": "இப்போ உங்கள் journey start ஆகிவிட்டது",
-    },
-    "te-IN": {
-        "₹40K/month": "₹40K/month sampadinchala", "join new WhatsApp Channel": "kotha WhatsApp Channel join avvandi",
-        "New here?": "App ki new ah?", "Ready to level up": "ready to level up?", "Few days in now": "Few days aiyayi kadha",
-    },
-    "ml-IN": {
-        "Want to earn ₹40K/month": "മാസം 40K സമ്പാദിക്കാൻ ആഗ്രഹിക്കുന്നുണ്ടോ",
-        "join new WhatsApp Channel": "പുതിയ WhatsApp ചാനലിൽ ചേരാൻ",
-        "New here? You're not alone": "പുതിയ ആളാണോ? നിങ്ങൾ ഒറ്റയ്ക്കല്ല",
-        # Team training additions
-        "Hi [Name]": "നമസ്കാരം [പേര്]", "brand-new WhatsApp Channel": "പുതിയ WhatsApp ചാനൽ",
-        "guess what": "ഒന്ന് Guess ചെയാമോ", "special invite list": "സ്പെഷ്യൽ ഇൻവൈറ്റ് ലിസ്റ്റ്",
-        "Be the first to know about discounts": "ഓഫറുകളുടെ വിവരങ്ങൾ ആദ്യം അറിയാം",
-        "Learn simple ways to connect": "എളുപ്പ മാർഗങ്ങൾ പഠിക്കാം",
-        "favourite trainer": "ഇഷ്ടപ്പെട്ട ട്രെയിനർ",
-        "completely free": "പൂർണ്ണമായും സൗജന്യം",
-        "numbers will not be visible": "നമ്പർ മറ്റാരും കാണില്ല",
-        "dont forget to tap on follow": "Follow അമർത്താൻ മറക്കരുത്",
-        "never miss anything fun": "ഒരിക്കലും ഫൺ മിസ്സ് ആവില്ല",
-    },
-    "kn-IN": {
-        "Want to earn ₹40K/month": "ತಿಂಗಳಿಗೆ ₹40K ಗಳಿಸಲು ಬಯಸುವಿರಾ",
-        "join new WhatsApp Channel": "ಹೊಸ WhatsApp ಚಾನಲ್‌ಗೆ ಸೇರಲು",
-        "New here? You're not alone": "ಇಲ್ಲಿ ಹೊಸಬರೇ? ನೀವು ಒಬ್ಬಂಟಿಯಲ್ಲ",
-        # Team training additions  
-        "Hi [Name]": "ನಮಸ್ಕಾರ [Name]", "brand-new WhatsApp Channel": "ಹೊಚ್ಚ ಹೊಸ WhatsApp ಚಾನೆಲ್",
-        "guess what": "ಗೆಸ್ಸ್ ಮಾಡಿ", "special invite list": "ಸ್ಪೆಷಲ್ ಲಿಸ್ಟ್",
-        "Be the first to know about discounts": "ಡಿಸ್ಕೌಂಟ್ಸ್ ಬಗ್ಗೆ ಫಸ್ಟ್ ಆಗಿ ತಿಳಿಯಿರಿ",
-        "Learn simple ways to connect": "ಟ್ರೈನರ್ಸ್ ಜೊತೆ ಕನೆಕ್ಟ್ ಆಗುವ ಸರಳ ಮಾರ್ಗಗಳನ್ನು ತಿಳಿಯಿರಿ",
-        "completely free": "ಫ್ರೀ ಆಗಿದೆ", "numbers will not be visible": "ಫೋನ್ ನಂಬರ್ ಪ್ರೈವೇಟ್ ಆಗಿರುತ್ತೆ",
-        "that simple": "ಇಷ್ಟು ಸಿಂಪಲ್", "never miss anything fun on FRND": "FRND‌ನಲ್ಲಿ ಮಜಾ ಯಾವತ್ತೂ ಮಿಸ್ ಆಗೋದು ಇಲ್ಲ",
-    }
-}
-
-LAYER3_TRAINING_FIXES = {
-    "hi-IN": {
-        "Gift Your Bhai": "Apne Bhai ko do", "₹1000 Hamper": "₹1000 ka Hamper",
-        "Just by Being Online": "Sirf Online aakar", "Yes, really!": "Haan, sach mein!",
-        "earn real money in your wallet": "apne wallet mein kamao real money",
-        "More time = More Yellow Roses": "Jitna zyada time = Utne zyada Yellow Roses",
-        "Make this Rakhi extra special": "Iss Rakhi ko banao extra special",
-        "It's a holiday today": "Aaj chhutti hai", "Holiday = Time to Earn": "Holiday = kamaane ka time",
-        "Tonight's the Night": "Aaj ki raat hai khaas", "peak time": "peak time",
-        "Why wait?": "Toh phir rukna kyu?", "Challenge is ON": "Challenge shuru ho chuka hai",
-        "Top earners": "Top earners", "Let the spotlight find YOU": "spotlight aap tak khud aa jaayegi",
-    },
-    "ta-IN": {
-        "Gift Your Bhai": "உங்க அண்ணன்/தம்பிக்கு Gift கொடுக்கலாமா",
-        "Just by Being Online": "FRND-ல Onlineல இருந்தாலே போதும்", "earn real money": "நேரடி பணம் சேரும்",
-        "in your wallet": "Wallet-ல", "More time = More": "அதிக நேரம் = அதிக",
-        "Make this Rakhi extra special": "இந்த Rakhi-யை Special-aa ஆக்குங்க",
-        "It's a holiday today": "இன்று விடுமுறை", "Holiday = Extra Earnings": "Holiday = Extra Earnings Time",
-        "Tonight's the Night": "இன்று இரவு தான் உங்களுக்கு வாய்ப்பு", "Why wait?": "Why Wait?",
-        "Challenge is ON": "Challenge ஆரம்பம் ஆகி இருக்கு", "Let the spotlight find YOU": "உங்களை spotlight find பண்ண விடுங்க",
-    },
-    "te-IN": {
-        "Gift Your Bhai": "మీ బ్రదర్ కి Gift చేయొచ్చు", "₹1000 Hamper": "₹1000 హ్యాంపర్",
-        "Just by Being Online": "FRND యాప్ లో ఆన్లైన్ ఉండడం ద్వారా",
-        "earn real money": "నిజమైన డబ్బు సంపాదించుకోవచ్చు", "in your wallet": "మీ వాలెట్లో",
-        "It's a holiday": "ఇవాళ హాలిడే", "peak time": "Peak Time", "Why wait?": "ఎందుకు వెయిట్ చేస్తున్నారూ?",
-    },
-    "ml-IN": {
-        "Raksha Bandhan": "രക്ഷാ ബന്ധൻ", "your brother": "നിങ്ങളുടെ സഹോദരന്",
-        "earn real money": "റിയൽ പണം സമ്പാദിക്കൂ", "in your wallet": "നിങ്ങളുടെ വാലറ്റിൽ",
-        "Why wait?": "എന്തിന് കാത്തിരിക്കണം?",
-    },
-    "kn-IN": {
-        "Raksha Bandhan": "ರಕ್ಷಾ ಬಂಧನ", "your brother": "ನಿಮ್ಮ ಸಹೋದರನಿಗೆ",
-        "earn real money": "ನಿಜವಾದ ಹಣವನ್ನು ಗಳಿಸಿ", "in your wallet": "ನಿಮ್ಮ ವ್ಯಾಲೆಟ್ನಲ್ಲಿ",
-        "Why wait?": "ಏಕೆ ಕಾಯಬೇಕು?",
-    },
-    "or-IN": {
-        "Raksha Bandhan": "Raksha Bandhan", "your brother": "ତୁମ ଭାଇଙ୍କୁ",
-        "earn real money": "ଟଙ୍କା କମାନ୍ତୁ", "Go online now": "ଏବେ ଅନଲାଇନ୍ ଆସନ୍ତୁ", "peak time": "peak time",
-    }
-}
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import rule_engine
+from rule_engine import CompiledRuleSet, phrase_rules, word_rules
+from rule_packs import RulePackWatcher, load_rule_pack
+
+# -------------------- TRAINING TABLES -------------------- #
+
+# The training tables live in rules/*.json (one file per table, named after it)
+# and are loaded as a rule pack with preserve_words.txt - see rule_packs.py:
+#   quality_training_patterns    Layer 1: Meeting & Live Session patterns
+#   additional_quality_patterns  Layer 2: WhatsApp Channel & Privacy patterns
+#   festival_quality_patterns    Layer 3: Festival & Holiday patterns
+#   team_training_corrections    Team training corrections
+#   layer1/2/3_training_fixes    Combined training fixes for translated output
+#   chatgpt_training_examples    Per-language examples for the ChatGPT review prompt
 
 # -------------------- TEAM TRAINING QUALITY ISSUES -------------------- #
 
@@ -518,205 +56,314 @@ TEAM_IDENTIFIED_ISSUES = {
 
 # -------------------- CONTEXT DETECTION FUNCTIONS -------------------- #
 
-def detect_message_context_type(text):
-    """Detect the type of message for better context application"""
+# Context keyword lists, in detection priority order (festival/holiday first)
+CONTEXT_KEYWORDS = [
+    ("rakhi_festival", ["rakhi", "raksha bandhan", "brother", "bhai"]),
+    ("holiday_celebration", ["holiday", "weekend", "vacation"]),
+    ("gift_giving", ["gift", "hamper", "surprise"]),
+    ("festival_competition", ["challenge", "top earner", "rank", "spotlight"]),
+    ("time_sensitive_promo", ["tonight", "peak time", "4am", "bonus"]),
+    ("whatsapp_promotion", ["whatsapp channel", "channel"]),
+    ("meeting_live", ["meeting", "live", "happening now", "tap to join"]),
+    ("earnings_focused", ["earn", "₹", "money", "income", "salary"]),
+    ("welcome_onboarding", ["welcome", "new here", "first time"]),
+    ("app_features", ["tap here", "click", "go online", "badge", "level up"]),
+    ("privacy_safety", ["private", "privacy", "safe", "secure"]),
+]
+
+# Extra keywords the hint and quality-check functions look for
+HINT_KEYWORDS = ["meet", "join", "don't miss", "hey", "tired"]
+
+# UI "Message Type" (CONTEXT_TYPES in app.py) to the context it should apply
+UI_CONTEXT_TYPES = {
+    "Marketing/Promotional": "whatsapp_promotion",
+    "Technical Support": "app_features",
+    "Payment/Financial": "earnings_focused",
+    "Festival/Cultural": "holiday_celebration",
+    "Customer Service": "general",
+    "Urgent/Emergency": "time_sensitive_promo",
+}
+
+# Every keyword any layer checks, deduplicated so each is searched for once
+ALL_CONTEXT_KEYWORDS = list(dict.fromkeys(
+    [word for _, words in CONTEXT_KEYWORDS for word in words] + HINT_KEYWORDS
+))
+
+@dataclass(frozen=True)
+class MessageContext:
+    """Context of one message, computed once from the original input and shared by every layer"""
+    context_type: str
+    keywords: frozenset
+    user_selected: bool = False
+
+    def mentions(self, keyword):
+        """True if the original input contains the keyword (case-insensitive)"""
+        return keyword in self.keywords
+
+def _classify_keywords(keywords):
+    for context_type, words in CONTEXT_KEYWORDS:
+        if any(word in keywords for word in words):
+            return context_type
+    return "general"
+
+def build_message_context(text, ui_context_type=""):
+    """Build the MessageContext for a request; a Message Type picked in the UI skips detection"""
     text_lower = text.lower()
+    keywords = frozenset(word for word in ALL_CONTEXT_KEYWORDS if word in text_lower)
     
-    # Festival/Holiday context (highest priority)
-    if any(word in text_lower for word in ["rakhi", "raksha bandhan", "brother", "bhai"]):
-        return "rakhi_festival"
-    if any(word in text_lower for word in ["holiday", "weekend", "vacation"]):
-        return "holiday_celebration"
-    if any(word in text_lower for word in ["gift", "hamper", "surprise"]):
-        return "gift_giving"
-    if any(word in text_lower for word in ["challenge", "top earner", "rank", "spotlight"]):
-        return "festival_competition"
-    if any(word in text_lower for word in ["tonight", "peak time", "4am", "bonus"]):
-        return "time_sensitive_promo"
-    
-    # WhatsApp Channel promotion
-    if "whatsapp channel" in text_lower or "channel" in text_lower:
-        return "whatsapp_promotion"
-    
-    # Meeting/Live context  
-    if any(word in text_lower for word in ["meeting", "live", "happening now", "tap to join"]):
-        return "meeting_live"
-    
-    # Earnings/Money focused
-    if any(word in text_lower for word in ["earn", "₹", "money", "income", "salary"]):
-        return "earnings_focused"
-    
-    # Welcome/Onboarding
-    if any(word in text_lower for word in ["welcome", "new here", "first time"]):
-        return "welcome_onboarding"
-    
-    # App feature explanation
-    if any(word in text_lower for word in ["tap here", "click", "go online", "badge", "level up"]):
-        return "app_features"
-    
-    # Privacy/Safety messaging
-    if any(word in text_lower for word in ["private", "privacy", "safe", "secure"]):
-        return "privacy_safety"
+    if ui_context_type in UI_CONTEXT_TYPES:
+        return MessageContext(UI_CONTEXT_TYPES[ui_context_type], keywords, user_selected=True)
     
-    return "general"
+    return MessageContext(_classify_keywords(keywords), keywords)
+
+def detect_message_context_type(text):
+    """Detect the type of message for better context application"""
+    return build_message_context(text).context_type
 
-def detect_team_quality_issues(text, translated_text):
+OVER_EXPLANATION_MARKERS = ["this message is about", "regarding", "concerning", "കുറിച്ചാണ്", "ବିଷୟରେ"]
+
+def count_period_sentences(text):
+    """Number of non-blank '.'-separated sentences"""
+    return sum(1 for sentence in text.split('.') if sentence.strip())
+
+def count_non_ascii(text):
+    """Number of characters above ASCII (emojis, Indic scripts)"""
+    return len(text) - len(text.encode('ascii', 'ignore'))
+
+def detect_team_quality_issues(text, translated_text, translated_lower=None):
     """Detect quality issues based on team training data"""
     issues = []
+    translated_lower = translated_text.lower() if translated_lower is None else translated_lower
     
     # Check for over-explanation patterns
-    if any(phrase in translated_text.lower() for phrase in [
-        "this message is about", "regarding", "concerning", "കുറിച്ചാണ്", "ବିଷୟରେ"
-    ]):
+    if any(phrase in translated_lower for phrase in OVER_EXPLANATION_MARKERS):
         issues.append("over_explanation")
     
     # Check for incomplete translation
-    original_sentences = len([s for s in text.split('.') if s.strip()])
-    translated_sentences = len([s for s in translated_text.split('.') if s.strip()])
-    if original_sentences > translated_sentences + 1:
+    if count_period_sentences(text) > count_period_sentences(translated_text) + 1:
         issues.append("incomplete_translation")
     
     # Check for missing emoji preservation
-    original_emojis = len([c for c in text if ord(c) > 127])
-    translated_emojis = len([c for c in translated_text if ord(c) > 127])
-    if original_emojis > translated_emojis:
+    if count_non_ascii(text) > count_non_ascii(translated_text):
         issues.append("missing_formatting")
     
     return issues
 
 # -------------------- PATTERN APPLICATION FUNCTIONS -------------------- #
 
-def apply_quality_training_patterns(text, target_lang):
-    """Apply Layer 1 training patterns with team corrections"""
+LAYER_LANGUAGE_KEYS = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada", "or": "odia"}
+
+def _get_layer_patterns(pattern_table, target_lang, supported_codes):
+    """Look up a language's pattern categories for a training layer"""
     lang_code = target_lang.split('-')[0].lower()
-    if lang_code not in ["hi", "ta", "te", "ml", "kn"]:
-        return text
-    
-    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada"}
-    pattern_key = pattern_map.get(lang_code)
-    if not pattern_key or pattern_key not in QUALITY_TRAINING_PATTERNS:
-        return text
-    
-    patterns = QUALITY_TRAINING_PATTERNS[pattern_key]
-    message_context = detect_message_context_type(text)
+    if lang_code not in supported_codes:
+        return None
+    return pattern_table.get(LAYER_LANGUAGE_KEYS.get(lang_code))
+
+def _build_layer1_rules(tables, target_lang, message_context):
+    patterns = _get_layer_patterns(tables["quality_training_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn"])
+    if not patterns:
+        return []
     
-    # Apply basic patterns
-    if "preferred_mixing" in patterns:
-        for english_word, preferred_translation in patterns["preferred_mixing"]:
-            text = re.sub(f"\\b{re.escape(english_word)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    rules = word_rules(patterns.get("preferred_mixing", []))
     
-    # Apply meeting-specific patterns for Malayalam (from team training)
+    # Meeting-specific patterns for Malayalam (from team training)
     if target_lang == "ml-IN" and message_context == "meeting_live":
-        if "meeting_specific" in patterns:
-            for english_phrase, preferred_translation in patterns["meeting_specific"]:
-                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+        rules += phrase_rules(patterns.get("meeting_specific", []))
     
-    return text
+    return rules
 
-def apply_additional_quality_patterns(text, target_lang):
-    """Apply Layer 2 training patterns with team corrections"""
-    lang_code = target_lang.split('-')[0].lower()
-    if lang_code not in ["hi", "ta", "te", "ml", "kn"]:
-        return text
-    
-    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada"}
-    pattern_key = pattern_map.get(lang_code)
-    if not pattern_key or pattern_key not in ADDITIONAL_QUALITY_PATTERNS:
-        return text
-    
-    patterns = ADDITIONAL_QUALITY_PATTERNS[pattern_key]
-    message_context = detect_message_context_type(text)
-    
-    # Apply context-specific patterns
-    if message_context == "whatsapp_promotion" and "whatsapp_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["whatsapp_patterns"]:
-            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+def _build_layer2_rules(tables, target_lang, message_context):
+    patterns = _get_layer_patterns(tables["additional_quality_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn"])
+    if not patterns:
+        return []
     
-    # Apply channel-specific patterns for Malayalam and Kannada (from team training)
+    rules = []
     if message_context == "whatsapp_promotion":
-        if target_lang == "ml-IN" and "channel_specific" in patterns:
-            for english_phrase, preferred_translation in patterns["channel_specific"]:
-                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
-        elif target_lang == "kn-IN" and "channel_specific" in patterns:
-            for english_phrase, preferred_translation in patterns["channel_specific"]:
-                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+        rules += phrase_rules(patterns.get("whatsapp_patterns", []))
+        # Channel-specific patterns for Malayalam and Kannada (from team training)
+        if target_lang in ["ml-IN", "kn-IN"]:
+            rules += phrase_rules(patterns.get("channel_specific", []))
     
-    if message_context == "earnings_focused" and "earnings_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["earnings_patterns"]:
-            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    if message_context == "earnings_focused":
+        rules += word_rules(patterns.get("earnings_patterns", []))
     
-    if message_context in ["welcome_onboarding", "general"] and "casual_connectors" in patterns:
-        for english_phrase, preferred_translation in patterns["casual_connectors"]:
-            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    if message_context in ["welcome_onboarding", "general"]:
+        rules += phrase_rules(patterns.get("casual_connectors", []))
     
-    if message_context == "app_features" and "app_tech_terms" in patterns:
-        for english_phrase, preferred_translation in patterns["app_tech_terms"]:
-            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    if message_context == "app_features":
+        rules += word_rules(patterns.get("app_tech_terms", []))
     
-    return text
+    return rules
 
-def apply_festival_quality_patterns(text, target_lang):
-    """Apply Layer 3 festival patterns"""
-    lang_code = target_lang.split('-')[0].lower()
-    if lang_code not in ["hi", "ta", "te", "ml", "kn", "or"]:
-        return text
+def _build_layer3_rules(tables, target_lang, message_context):
+    patterns = _get_layer_patterns(tables["festival_quality_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn", "or"])
+    if not patterns:
+        return []
     
-    pattern_map = {"hi": "hindi", "ta": "tamil", "te": "telugu", "ml": "malayalam", "kn": "kannada", "or": "odia"}
-    pattern_key = pattern_map.get(lang_code)
-    if not pattern_key or pattern_key not in FESTIVAL_QUALITY_PATTERNS:
-        return text
+    rules = []
+    if message_context == "rakhi_festival":
+        rules += word_rules(patterns.get("rakhi_patterns", []))
     
-    patterns = FESTIVAL_QUALITY_PATTERNS[pattern_key]
-    festival_context = detect_message_context_type(text)
+    if message_context in ["holiday_celebration", "time_sensitive_promo"]:
+        rules += word_rules(patterns.get("holiday_patterns", []))
     
-    # Apply context-specific patterns
-    if festival_context == "rakhi_festival" and "rakhi_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["rakhi_patterns"]:
-            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    if message_context == "gift_giving":
+        rules += phrase_rules(patterns.get("gift_earning_patterns", []))
     
-    if festival_context in ["holiday_celebration", "time_sensitive_promo"] and "holiday_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["holiday_patterns"]:
-            text = re.sub(f"\\b{re.escape(english_phrase)}\\b", preferred_translation, text, flags=re.IGNORECASE)
+    if message_context in ["festival_competition", "time_sensitive_promo"]:
+        rules += phrase_rules(patterns.get("encouragement_patterns", []))
     
-    if festival_context == "gift_giving" and "gift_earning_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["gift_earning_patterns"]:
-            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    return rules
+
+def _build_team_rules(tables, target_lang, message_context):
+    corrections = tables["team_training_corrections"].get(target_lang)
+    if not corrections:
+        return []
     
-    if festival_context in ["festival_competition", "time_sensitive_promo"] and "encouragement_patterns" in patterns:
-        for english_phrase, preferred_translation in patterns["encouragement_patterns"]:
-            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    rules = []
+    # Meeting corrections for Malayalam
+    if target_lang == "ml-IN" and message_context == "meeting_live":
+        rules += phrase_rules(corrections.get("meeting_corrections", []))
     
-    return text
+    if message_context == "whatsapp_promotion":
+        rules += phrase_rules(corrections.get("whatsapp_corrections", []))
+    
+    return rules
+
+def _build_layer1_fix_rules(tables, target_lang, message_context):
+    return phrase_rules(tables["layer1_training_fixes"].get(target_lang, {}).items())
+
+def _build_layer2_fix_rules(tables, target_lang, message_context):
+    return phrase_rules(tables["layer2_training_fixes"].get(target_lang, {}).items())
+
+def _build_layer3_fix_rules(tables, target_lang, message_context):
+    return phrase_rules(tables["layer3_training_fixes"].get(target_lang, {}).items())
+
+def _build_all_fix_rules(tables, target_lang, message_context):
+    # Layer order is kept: the rule compiler only fuses rules whose order cannot matter
+    return (_build_layer1_fix_rules(tables, target_lang, message_context)
+            + _build_layer2_fix_rules(tables, target_lang, message_context)
+            + _build_layer3_fix_rules(tables, target_lang, message_context))
+
+RULE_SET_BUILDERS = {
+    "layer1": _build_layer1_rules,
+    "layer2": _build_layer2_rules,
+    "layer3": _build_layer3_rules,
+    "team": _build_team_rules,
+    "layer1_fixes": _build_layer1_fix_rules,
+    "layer2_fixes": _build_layer2_fix_rules,
+    "layer3_fixes": _build_layer3_fix_rules,
+    "training_fixes": _build_all_fix_rules,
+}
 
-def apply_team_training_corrections(text, target_lang):
-    """Apply team-specific corrections based on training data"""
-    if target_lang not in TEAM_TRAINING_CORRECTIONS:
+def get_compiled_rule_set(layer, target_lang, message_context, rule_pack=None):
+    """Get the compiled rule set for a (layer, language, context) from the active rule pack"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    return rule_pack.get_rule_set(
+        (layer, target_lang, message_context),
+        lambda: RULE_SET_BUILDERS[layer](rule_pack.tables, target_lang, message_context)
+    )
+
+# -------------------- RULE PACK LOADING -------------------- #
+
+_ACTIVE_RULE_PACK = None
+_RULE_PACK_LOCK = threading.Lock()
+_RULE_PACK_WATCHER = None
+
+def _rule_set_contexts():
+    """Every message context value the rule builders can be called with"""
+    contexts = [context_type for context_type, _ in CONTEXT_KEYWORDS]
+    contexts += list(UI_CONTEXT_TYPES.values()) + ["general", None]
+    return list(dict.fromkeys(contexts))
+
+def _warm_rule_pack(rule_pack):
+    """Compile every rule set up front so the disk cache covers all of them"""
+    # Many contexts produce the same rules; they share one compiled set
+    compiled_by_rules = {}
+    for layer, build_rules in RULE_SET_BUILDERS.items():
+        for target_lang in SUPPORTED_LANGUAGES:
+            for message_context in _rule_set_contexts():
+                rules = tuple(build_rules(rule_pack.tables, target_lang, message_context))
+                if rules not in compiled_by_rules:
+                    compiled_by_rules[rules] = CompiledRuleSet(rules)
+                rule_pack.rule_sets[(layer, target_lang, message_context)] = compiled_by_rules[rules]
+
+def reload_rule_pack():
+    """Load the rule pack from disk and make it the active one"""
+    global _ACTIVE_RULE_PACK
+    with _RULE_PACK_LOCK:
+        rule_pack = load_rule_pack(warm=_warm_rule_pack, code_files=[__file__, rule_engine.__file__])
+        # A single reference swap: requests see either the old pack or the new one
+        _ACTIVE_RULE_PACK = rule_pack
+        # Cleanup results and prompt examples of the replaced pack can never be looked up again,
+        # and would keep the whole pack alive
+        _CLEAN_TEXT_MEMO.clear()
+        compile_training_examples.cache_clear()
+        rank_training_examples.cache_clear()
+    return rule_pack
+
+def get_active_rule_pack():
+    """The rule pack currently used for all pattern matching"""
+    return _ACTIVE_RULE_PACK or reload_rule_pack()
+
+def start_rule_pack_watcher(interval=None):
+    """Start the background watcher that reloads the rule pack when its files change (idempotent)"""
+    global _RULE_PACK_WATCHER
+    with _RULE_PACK_LOCK:
+        if _RULE_PACK_WATCHER is None or not _RULE_PACK_WATCHER.is_alive():
+            kwargs = {"interval": interval} if interval else {}
+            _RULE_PACK_WATCHER = RulePackWatcher(reload_rule_pack, **kwargs)
+            _RULE_PACK_WATCHER.start()
+    return _RULE_PACK_WATCHER
+
+# -------------------- LAYER APPLICATION -------------------- #
+
+def apply_quality_training_patterns(text, target_lang, message_context=None, rule_pack=None):
+    """Apply Layer 1 training patterns with team corrections"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    if not _get_layer_patterns(rule_pack.tables["quality_training_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn"]):
         return text
     
-    corrections = TEAM_TRAINING_CORRECTIONS[target_lang]
-    message_context = detect_message_context_type(text)
+    message_context = message_context or build_message_context(text)
+    return get_compiled_rule_set("layer1", target_lang, message_context.context_type, rule_pack).apply(text)
+
+def apply_additional_quality_patterns(text, target_lang, message_context=None, rule_pack=None):
+    """Apply Layer 2 training patterns with team corrections"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    if not _get_layer_patterns(rule_pack.tables["additional_quality_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn"]):
+        return text
     
-    # Apply meeting corrections for Malayalam
-    if target_lang == "ml-IN" and message_context == "meeting_live":
-        if "meeting_corrections" in corrections:
-            for english_phrase, preferred_translation in corrections["meeting_corrections"]:
-                text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    message_context = message_context or build_message_context(text)
+    return get_compiled_rule_set("layer2", target_lang, message_context.context_type, rule_pack).apply(text)
+
+def apply_festival_quality_patterns(text, target_lang, message_context=None, rule_pack=None):
+    """Apply Layer 3 festival patterns"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    if not _get_layer_patterns(rule_pack.tables["festival_quality_patterns"], target_lang, ["hi", "ta", "te", "ml", "kn", "or"]):
+        return text
     
-    # Apply WhatsApp corrections
-    if message_context == "whatsapp_promotion" and "whatsapp_corrections" in corrections:
-        for english_phrase, preferred_translation in corrections["whatsapp_corrections"]:
-            text = re.sub(re.escape(english_phrase), preferred_translation, text, flags=re.IGNORECASE)
+    message_context = message_context or build_message_context(text)
+    return get_compiled_rule_set("layer3", target_lang, message_context.context_type, rule_pack).apply(text)
+
+def apply_team_training_corrections(text, target_lang, message_context=None, rule_pack=None):
+    """Apply team-specific corrections based on training data"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    if target_lang not in rule_pack.tables["team_training_corrections"]:
+        return text
     
-    return text
+    message_context = message_context or build_message_context(text)
+    return get_compiled_rule_set("team", target_lang, message_context.context_type, rule_pack).apply(text)
 
 # -------------------- CONTEXT HINTS FUNCTIONS -------------------- #
 
-def add_quality_context_hints(text, target_lang):
-    """Add Layer 1 context hints with team training insights"""
+def collect_quality_context_hints(text, target_lang, message_context=None):
+    """Collect Layer 1 context hints with team training insights"""
     lang_code = target_lang.split('-')[0].lower()
+    message_context = message_context or build_message_context(text)
     context_hints = []
     
-    if "meeting" in text.lower() or "meet" in text.lower():
+    if message_context.mentions("meet"):
         if lang_code == "hi":
             context_hints.append("meeting/meet pattern")
         elif lang_code == "ta":
@@ -724,10 +371,10 @@ def add_quality_context_hints(text, target_lang):
         elif lang_code == "ml":
             context_hints.append("direct translation, avoid over-explanation")
     
-    if "live" in text.lower():
+    if message_context.mentions("live"):
         context_hints.append("LIVE should stay in caps")
     
-    if "join" in text.lower():
+    if message_context.mentions("join"):
         if lang_code == "hi":
             context_hints.append("join karo/join pattern")
         elif lang_code == "ta":
@@ -737,7 +384,7 @@ def add_quality_context_hints(text, target_lang):
         elif lang_code == "ml":
             context_hints.append("ജോയിൻ ചെയ്യൂ pattern")
     
-    if "don't miss" in text.lower():
+    if message_context.mentions("don't miss"):
         if lang_code == "hi":
             context_hints.append("miss mat karna pattern")
         elif lang_code == "ta":
@@ -747,20 +394,17 @@ def add_quality_context_hints(text, target_lang):
     if len(text.split('.')) > 1:
         context_hints.append("translate ALL sentences completely")
     
-    if context_hints:
-        hint_text = f"[Apply quality patterns: {', '.join(context_hints)}] "
-        return hint_text + text
-    
-    return text
+    return context_hints
 
-def add_advanced_context_hints(text, target_lang):
-    """Add Layer 2 context hints with team corrections"""
+def collect_advanced_context_hints(text, target_lang, message_context=None):
+    """Collect Layer 2 context hints with team corrections"""
     lang_code = target_lang.split('-')[0].lower()
-    message_context = detect_message_context_type(text)
+    message_context = message_context or build_message_context(text)
+    context_type = message_context.context_type
     context_hints = []
     
     # WhatsApp Channel specific hints
-    if message_context == "whatsapp_promotion":
+    if context_type == "whatsapp_promotion":
         if lang_code == "hi":
             context_hints.append("WhatsApp Channel promotion - keep 'Channel' in English, use 'abhi join karo'")
         elif lang_code == "ta":
@@ -771,36 +415,31 @@ def add_advanced_context_hints(text, target_lang):
             context_hints.append("WhatsApp Channel - maintain proper word order, translate all components")
     
     # Earnings context
-    if message_context == "earnings_focused":
+    if context_type == "earnings_focused":
         if lang_code == "hi":
             context_hints.append("earnings context - use 'kamai/kamao' patterns")
         elif lang_code == "ta":
             context_hints.append("earnings context - use Tamil-English mixing for money terms")
     
     # Casual conversation
-    if "hey" in text.lower() or "tired" in text.lower():
+    if message_context.mentions("hey") or message_context.mentions("tired"):
         if lang_code == "hi":
             context_hints.append("casual tone - use 'Hey!' and conversational Hindi")
         elif lang_code == "ta":
             context_hints.append("casual tone - Tamil conversational mixing")
     
     # Privacy/Safety messaging
-    if message_context == "privacy_safety":
+    if context_type == "privacy_safety":
         context_hints.append("privacy messaging - keep 'Privacy' and '100%' in English")
     
     # Team training: Avoid common issues
     context_hints.append("avoid over-explanation, direct translation only")
     
-    if context_hints:
-        hint_text = f"[Context: {message_context}, Apply: {', '.join(context_hints)}] "
-        return hint_text + text
-    
-    return text
+    return context_hints
 
-def add_festival_context_hints(text, target_lang):
-    """Add Layer 3 festival context hints - OPTIMIZED"""
-    lang_code = target_lang.split('-')[0].lower()
-    festival_context = detect_message_context_type(text)
+def collect_festival_context_hints(text, target_lang, message_context=None):
+    """Collect Layer 3 festival context hints - OPTIMIZED"""
+    festival_context = (message_context or build_message_context(text)).context_type
     hints = []
     
     if festival_context == "rakhi_festival":
@@ -812,94 +451,105 @@ def add_festival_context_hints(text, target_lang):
     elif festival_context == "time_sensitive_promo":
         hints.append("urgent promo")
     
-    if hints:
-        return f"[{festival_context}: {', '.join(hints)}] {text}"
-    return text
+    return hints
+
+@dataclass
+class ContextHints:
+    """Hints gathered during preprocessing, handed to the ChatGPT prompt builder as metadata"""
+    context_type: str
+    quality_hints: list = field(default_factory=list)
+    advanced_hints: list = field(default_factory=list)
+    festival_hints: list = field(default_factory=list)
+    memory_hints: list = field(default_factory=list)
+
+    def all_hints(self):
+        return self.quality_hints + self.advanced_hints + self.festival_hints + self.memory_hints
+
+    def to_prompt_section(self):
+        """Render the hints as a prompt section"""
+        lines = [f"- Message context: {self.context_type}"]
+        lines += [f"- {hint}" for hint in self.all_hints()]
+        return "CONTEXT NOTES:\n" + "\n".join(lines)
+
+def build_context_hints(text, target_lang, message_context=None):
+    """Collect all three layers of context hints for a message"""
+    message_context = message_context or build_message_context(text)
+    return ContextHints(
+        context_type=message_context.context_type,
+        quality_hints=collect_quality_context_hints(text, target_lang, message_context),
+        advanced_hints=collect_advanced_context_hints(text, target_lang, message_context),
+        festival_hints=collect_festival_context_hints(text, target_lang, message_context),
+    )
 
 # -------------------- TRAINING FIXES APPLICATION FUNCTIONS -------------------- #
 
-def apply_training_based_quality_fixes(text, target_lang):
+def apply_training_based_quality_fixes(text, target_lang, rule_pack=None):
     """Apply Layer 1 training fixes with team corrections"""
-    if target_lang not in LAYER1_TRAINING_FIXES:
+    rule_pack = rule_pack or get_active_rule_pack()
+    if target_lang not in rule_pack.tables["layer1_training_fixes"]:
         return text
     
-    fixes = LAYER1_TRAINING_FIXES[target_lang]
-    for english_phrase, quality_translation in fixes.items():
-        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
-    
-    return text
+    return get_compiled_rule_set("layer1_fixes", target_lang, None, rule_pack).apply(text)
 
-def apply_additional_training_fixes(text, target_lang):
+def apply_additional_training_fixes(text, target_lang, rule_pack=None):
     """Apply Layer 2 training fixes with team corrections"""
-    if target_lang not in LAYER2_TRAINING_FIXES:
+    rule_pack = rule_pack or get_active_rule_pack()
+    if target_lang not in rule_pack.tables["layer2_training_fixes"]:
         return text
     
-    fixes = LAYER2_TRAINING_FIXES[target_lang]
-    for english_phrase, quality_translation in fixes.items():
-        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
-    
-    return text
+    return get_compiled_rule_set("layer2_fixes", target_lang, None, rule_pack).apply(text)
 
-def apply_festival_training_fixes(text, target_lang):
+def apply_festival_training_fixes(text, target_lang, rule_pack=None):
     """Apply Layer 3 festival training fixes"""
-    if target_lang not in LAYER3_TRAINING_FIXES:
+    rule_pack = rule_pack or get_active_rule_pack()
+    if target_lang not in rule_pack.tables["layer3_training_fixes"]:
         return text
     
-    fixes = LAYER3_TRAINING_FIXES[target_lang]
-    for english_phrase, quality_translation in fixes.items():
-        text = re.sub(re.escape(english_phrase), quality_translation, text, flags=re.IGNORECASE)
-    
-    return text
+    return get_compiled_rule_set("layer3_fixes", target_lang, None, rule_pack).apply(text)
 
 # -------------------- MAIN ENHANCEMENT FUNCTIONS -------------------- #
 
-def enhanced_preprocess_input_for_completeness(text, target_lang):
-    """Main preprocessing function that applies all training layers + team corrections - OPTIMIZED"""
+def enhanced_preprocess_input_for_completeness(text, target_lang, message_context=None, rule_pack=None):
+    """Main preprocessing function that applies all training layers + team corrections - OPTIMIZED
     
-    # Layer 1: Original training (Meeting/Live sessions) + team corrections
-    enhanced_text = apply_quality_training_patterns(text, target_lang)
-    enhanced_text = add_quality_context_hints(enhanced_text, target_lang)
+    Returns the rewritten text and the ContextHints for the ChatGPT prompt.
+    """
     
-    # Layer 2: WhatsApp Channel/Privacy training + team corrections
-    enhanced_text = apply_additional_quality_patterns(enhanced_text, target_lang)
-    enhanced_text = add_advanced_context_hints(enhanced_text, target_lang)
-    
-    # Layer 3: Festival/Holiday training
-    enhanced_text = apply_festival_quality_patterns(enhanced_text, target_lang)
-    enhanced_text = add_festival_context_hints(enhanced_text, target_lang)
-    
-    # NEW: Team training corrections
-    enhanced_text = apply_team_training_corrections(enhanced_text, target_lang)
-    
-    # CRITICAL: Clean hints before API call
-    enhanced_text = clean_enhancement_hints_for_api(enhanced_text)
-    
-    return enhanced_text
+    # Context is detected once from the original input and shared by every layer
+    message_context = message_context or build_message_context(text)
+    rule_sets = _preprocess_rule_sets(rule_pack or get_active_rule_pack(), target_lang, message_context.context_type)
+    return _preprocess_text(text, target_lang, message_context, rule_sets)
 
-def clean_enhancement_hints_for_api(text):
-    """Remove all enhancement hints before sending to Sarvam API"""
-    
-    hint_patterns = [
-        r'\[.*?\]\s*',  # Remove all bracketed hints
-        r'^\s*:\s*',    # Remove leading colons
-    ]
-    
-    for pattern in hint_patterns:
-        text = re.sub(pattern, '', text, flags=re.MULTILINE)
-    
-    return text.strip()
-
-def enhanced_postprocess_translation_output(text, target_lang):
+def enhanced_postprocess_translation_output(text, target_lang, rule_pack=None):
     """Main post-processing function that applies all training fixes + team corrections"""
+    training_fixes = get_compiled_rule_set("training_fixes", target_lang, None, rule_pack)
+    return _postprocess_text(text, target_lang, training_fixes)
+
+# Layers 1-3 (Meeting/Live, WhatsApp/Privacy, Festival/Holiday) then team corrections
+PREPROCESS_LAYERS = ["layer1", "layer2", "layer3", "team"]
+
+def _preprocess_rule_sets(rule_pack, target_lang, context_type):
+    """The preprocessing rule sets for a language and context, in layer order"""
+    # Unsupported languages get empty rule sets, which leave the text unchanged
+    return [get_compiled_rule_set(layer, target_lang, context_type, rule_pack) for layer in PREPROCESS_LAYERS]
+
+def _preprocess_text(text, target_lang, message_context, rule_sets):
+    """Preprocess one text with rule sets already resolved for its language and context"""
+    enhanced_text = text
+    for rule_set in rule_sets:
+        enhanced_text = rule_set.apply(enhanced_text)
     
-    # Layer 1: Original training fixes + team corrections
-    result = apply_training_based_quality_fixes(text, target_lang)
+    # Hints travel as metadata for the ChatGPT prompt, never through the API text
+    context_hints = build_context_hints(text, target_lang, message_context)
     
-    # Layer 2: Additional training fixes + team corrections
-    result = apply_additional_training_fixes(result, target_lang)
+    return enhanced_text.strip(), context_hints
+
+def _postprocess_text(text, target_lang, training_fixes):
+    """Post-process one text with the language's training fixes already resolved"""
     
-    # Layer 3: Festival training fixes
-    result = apply_festival_training_fixes(result, target_lang)
+    # Layers 1-3: training fixes + team corrections as one scan per language,
+    # split only where a later layer's phrase could see an earlier rewrite
+    result = training_fixes.apply(text)
     
     # Enhanced emoji and formatting
     result = enhance_emoji_and_formatting_based_on_training(result, target_lang)
@@ -909,26 +559,282 @@ def enhanced_postprocess_translation_output(text, target_lang):
     
     return result
 
+def preprocess_many(texts, target_lang, rule_pack=None):
+    """Preprocess many texts for one language, yielding (text, ContextHints) like the single-text function"""
+    # One rule pack for the whole batch, and rule sets resolved once per context type
+    rule_pack = rule_pack or get_active_rule_pack()
+    rule_sets_by_context = {}
+    
+    for text in texts:
+        message_context = build_message_context(text)
+        rule_sets = rule_sets_by_context.get(message_context.context_type)
+        if rule_sets is None:
+            rule_sets = _preprocess_rule_sets(rule_pack, target_lang, message_context.context_type)
+            rule_sets_by_context[message_context.context_type] = rule_sets
+        yield _preprocess_text(text, target_lang, message_context, rule_sets)
+
+def postprocess_many(texts, target_lang, rule_pack=None):
+    """Post-process many translated texts for one language, yielding results in order"""
+    # Resolved once for the batch; the per-text work left is the regex passes themselves
+    training_fixes = get_compiled_rule_set("training_fixes", target_lang, None, rule_pack)
+    for text in texts:
+        yield _postprocess_text(text, target_lang, training_fixes)
+
+# -------------------- OUTPUT CLEANUP PASSES -------------------- #
+
+class CleanupPass:
+    """One compiled cleanup regex, skipped when a literal every match must contain is absent"""
+    
+    def __init__(self, pattern, replacement, flags=0, needle=None):
+        self.regex = re.compile(pattern, flags)
+        self.replacement = replacement
+        self.needle = needle
+        # Needles with letters are checked against the lowercased text
+        self.folded = needle is not None and needle.lower() != needle.upper()
+    
+    def apply(self, text):
+        return self.regex.sub(self.replacement, text)
+
+def _lowered_for_needles(text):
+    """Lowercased text for needle checks, or None if re's case folding could match more than str.lower() shows"""
+    if "ı" in text or "ſ" in text or "İ" in text:
+        return None
+    return text.lower()
+
+def run_cleanup_passes(text, cleanup_passes):
+    """Apply cleanup passes in order, skipping the ones whose needle is not in the text"""
+    lowered_source = None
+    lowered = None
+    for cleanup_pass in cleanup_passes:
+        if cleanup_pass.folded:
+            # re.sub returns the same object when nothing changed, so this only re-lowers after a rewrite
+            if lowered_source is not text:
+                lowered_source, lowered = text, _lowered_for_needles(text)
+            if lowered is not None and cleanup_pass.needle not in lowered:
+                continue
+        elif cleanup_pass.needle is not None and cleanup_pass.needle not in text:
+            continue
+        text = cleanup_pass.apply(text)
+    return text
+
+class LiteralChainPass:
+    """Linear-time removal for lazy patterns such as r'.*?regarding.*?\.' or r'\[.*?translate.*?from.*?\]\s*'
+    
+    A match is the start literal (or wherever the scan is, for a leading .*?), then each literal in
+    order, then the terminator, then optional trailing whitespace - the same text the regex removes.
+    The regex engine retries a failed chain from every later position, which is quadratic on long
+    text; a chain that fails once fails for the rest of its line (or text, with DOTALL), so this skips it.
+    """
+    
+    def __init__(self, start, literals, terminator, flags=0, trailing_space=False, needle=None):
+        ignore_case = bool(flags & re.IGNORECASE)
+        self.dotall = bool(flags & re.DOTALL)
+        self.find_start = _literal_finder(start, ignore_case) if start else None
+        self.start_length = len(start) if start else 0
+        self.chain = [(_literal_finder(literal, ignore_case), len(literal)) for literal in literals + [terminator]]
+        self.trailing_space = trailing_space
+        self.needle = needle
+        self.folded = needle is not None and needle.lower() != needle.upper()
+    
+    def _chain_end(self, text, cursor, limit):
+        """End of the literal chain starting at cursor and finishing before limit, or -1"""
+        for find, length in self.chain:
+            index = find(text, cursor, limit)
+            if index == -1:
+                return -1
+            cursor = index + length
+        return cursor
+    
+    def _next_match(self, text, pos):
+        text_length = len(text)
+        while pos < text_length:
+            if self.find_start:
+                start = self.find_start(text, pos, text_length)
+                if start == -1:
+                    return None
+                cursor = start + self.start_length
+            else:
+                start = cursor = pos
+            
+            # Without DOTALL the whole match has to fit on the start's line
+            limit = text_length if self.dotall else _line_end(text, start)
+            end = self._chain_end(text, cursor, limit)
+            if end != -1:
+                if self.trailing_space:
+                    end = TRAILING_SPACE_PATTERN.match(text, end).end()
+                return start, end
+            
+            if self.dotall:
+                return None
+            pos = limit + 1
+        return None
+    
+    def apply(self, text):
+        pieces = []
+        keep_from = 0
+        match = self._next_match(text, 0)
+        while match:
+            start, end = match
+            pieces.append(text[keep_from:start])
+            keep_from = end
+            match = self._next_match(text, end)
+        
+        if not pieces:
+            return text
+        pieces.append(text[keep_from:])
+        return "".join(pieces)
+
+class LineStartCommaPass:
+    """Linear-time r'^\s*,\s*' with MULTILINE
+    
+    The regex rescans a whole run of blank lines from each line start in it; every line start in
+    the run sees the same first non-space character, so only the first one is tried here.
+    """
+    
+    needle = ","
+    folded = False
+    
+    def apply(self, text):
+        pieces = []
+        keep_from = 0
+        line_start = 0
+        while True:
+            first = NON_SPACE_PATTERN.search(text, line_start)
+            if first is None:
+                break
+            
+            if first.group(0) == ",":
+                end = TRAILING_SPACE_PATTERN.match(text, first.end()).end()
+                pieces.append(text[keep_from:line_start])
+                keep_from = end
+                # The scan resumes where the match ended, which may itself be a line start
+                if text[end - 1] == "\n":
+                    line_start = end
+                    continue
+                next_break = text.find("\n", end)
+            else:
+                next_break = text.find("\n", first.start())
+            
+            if next_break == -1:
+                break
+            line_start = next_break + 1
+        
+        if not pieces:
+            return text
+        pieces.append(text[keep_from:])
+        return "".join(pieces)
+
+TRAILING_SPACE_PATTERN = re.compile(r'\s*')
+NON_SPACE_PATTERN = re.compile(r'\S')
+
+def _line_end(text, index):
+    end = text.find("\n", index)
+    return len(text) if end == -1 else end
+
+def _literal_finder(literal, ignore_case):
+    """find(text, start, end) for a literal, using re's case folding when ignore_case is set"""
+    if ignore_case and literal.lower() != literal.upper():
+        regex = re.compile(re.escape(literal), flags=re.IGNORECASE)
+        
+        def find(text, start, end):
+            match = regex.search(text, start, end)
+            return match.start() if match else -1
+        return find
+    return lambda text, start, end: text.find(literal, start, end)
+
+_LEAK_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Leaked prompt instructions and hint brackets
+INSTRUCTION_LEAK_PASSES = [
+    LiteralChainPass("[INSTRUCTION:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[instruction:"),      # \[INSTRUCTION:.*?\]\s*
+    LiteralChainPass("[INST:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[inst:"),                    # \[INST:.*?\]\s*
+    LiteralChainPass("[Translate completely including:", [], "]", _LEAK_FLAGS, trailing_space=True,
+                     needle="[translate completely including:"),                                              # \[Translate completely including:.*?\]\s*
+    LiteralChainPass("[translate from:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[translate from:"), # \[translate from:.*?\]\s*
+    LiteralChainPass("[", ["translate", "from"], "]", _LEAK_FLAGS, trailing_space=True, needle="translate"),   # \[.*?translate.*?from.*?\]\s*
+    CleanupPass(r'^\[.*?\]\s*', '', _LEAK_FLAGS, needle="["),
+    LiteralChainPass("[Context:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[context:"),              # \[Context:.*?\]\s*
+    LiteralChainPass("[Apply quality patterns:", [], "]", _LEAK_FLAGS, trailing_space=True,
+                     needle="[apply quality patterns:"),                                                      # \[Apply quality patterns:.*?\]\s*
+    LiteralChainPass("[Festival context:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[festival context:"),  # \[Festival context:.*?\]\s*
+    LiteralChainPass("[Apply:", [], "]", _LEAK_FLAGS, trailing_space=True, needle="[apply:"),                  # \[Apply:.*?\]\s*
+    # Team training: Remove over-explanation patterns
+    LiteralChainPass("This message is about", [], ".", _LEAK_FLAGS, needle="this message is about"),           # This message is about.*?\.
+    LiteralChainPass(None, ["കുറിച്ചാണ്"], ".", _LEAK_FLAGS, needle="കുറിച്ചാണ്"),                               # .*?കുറിച്ചാണ്.*?\.
+    LiteralChainPass(None, ["regarding"], ".", _LEAK_FLAGS, needle="regarding"),                               # .*?regarding.*?\.
+]
+
+# Brand name bracket artifacts ([[FRND]], {FRND}, FRND}], stray "]")
+# (?<!...) starts each match at the beginning of a bracket run: a run that fails from its
+# first bracket fails from every later one, and retrying them all is quadratic
+BRAND_FIX_PASSES = [
+    CleanupPass(r"(?<!\[)\[\[\[+([^\[\]]*)\]\]\]+", r"\1", _LEAK_FLAGS, needle="[[["),
+    CleanupPass(r"(?<!\[)\[\[+([^\[\]]*)\]\]+", r"\1", _LEAK_FLAGS, needle="[["),
+    CleanupPass(r"(?<!\[)\[+([^\[\]]*)\]+", r"\1", _LEAK_FLAGS, needle="["),
+    CleanupPass(r"(?<!\{)\{\{\{+([^\{\}]*)\}\}\}+", r"\1", _LEAK_FLAGS, needle="{{{"),
+    CleanupPass(r"(?<!\{)\{\{+([^\{\}]*)\}\}+", r"\1", _LEAK_FLAGS, needle="{{"),
+    CleanupPass(r"(?<!\{)\{+([^\{\}]*)\}+", r"\1", _LEAK_FLAGS, needle="{"),
+    CleanupPass(r"FRND\}+\]+", "FRND", _LEAK_FLAGS, needle="}]"),
+    CleanupPass(r"Team\s*FRND\}+\]+", "Team FRND", _LEAK_FLAGS, needle="}]"),
+    CleanupPass(r"(?<!\})\}+\]+", "", _LEAK_FLAGS, needle="}]"),
+    # One pass for what used to be ^\]+,?\s* then \]+,\s* then \]+\s*: every "]" run goes
+    CleanupPass(r"\]+,?\s*", "", _LEAK_FLAGS, needle="]"),
+    LineStartCommaPass(),
+]
+
+# Formatting cleanup. The old instruction and "]" artifact passes here are gone:
+# they all need a "]", and BRAND_FIX_PASSES has already removed every one
+FORMATTING_PASSES = [
+    LineStartCommaPass(),
+    CleanupPass(r',\s*,\s*', '', needle=","),
+]
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+OUTPUT_CLEANUP_PASSES = INSTRUCTION_LEAK_PASSES + BRAND_FIX_PASSES + FORMATTING_PASSES
+
+_DOTALL_FLAGS = re.IGNORECASE | re.DOTALL
+
+OVER_EXPLANATION_PASSES = [
+    LiteralChainPass("This message is about", [], ".", _DOTALL_FLAGS, needle="this message is about"),  # This message is about.*?\.
+    LiteralChainPass(None, ["കുറിച്ചാണ്"], ".", _DOTALL_FLAGS, needle="കുറിച്ചാണ്"),                       # .*?കുറിച്ചാണ്.*?\.
+    LiteralChainPass(None, ["regarding"], ".", _DOTALL_FLAGS, needle="regarding"),                       # .*?regarding.*?\.
+    LiteralChainPass(None, ["concerning"], ".", _DOTALL_FLAGS, needle="concerning"),                     # .*?concerning.*?\.
+]
+
+# ChatGPT meta-responses around the translation
+CHATGPT_META_PASSES = [
+    CleanupPass(r'^(CORRECTED TRANSLATION|IMPROVED TRANSLATION|FIXED TRANSLATION|Translation|Final Translation|Here is the corrected translation|The corrected translation is):\s*', '', _DOTALL_FLAGS),
+    LiteralChainPass("The", ["translation", "is", "already", "good"], ".", _DOTALL_FLAGS, needle="already"),   # The.*?translation.*?is.*?already.*?good.*?\.
+    LiteralChainPass("No improvements", ["needed"], ".", _DOTALL_FLAGS, needle="no improvements"),             # No improvements.*?needed.*?\.
+    LiteralChainPass("The Sarvam translation", ["is", "already"], ".", _DOTALL_FLAGS, needle="the sarvam translation"),  # The Sarvam translation.*?is.*?already.*?\.
+    LiteralChainPass("This translation", ["meets", "requirements"], ".", _DOTALL_FLAGS, needle="this translation"),    # This translation.*?meets.*?requirements.*?\.
+]
+
+def strip_chatgpt_meta_commentary(text):
+    """Remove ChatGPT's framing ("Here is the corrected translation:", "No improvements needed.") from a reply"""
+    return run_cleanup_passes(text, CHATGPT_META_PASSES).strip()
+
+# Output cleanup patterns, compiled once; the (?<!...) guards keep whitespace/digit runs from being rescanned
+EMOJI_SPACING_PATTERN = re.compile(r'(?<!\s)\s+([👋🎉💥💬🎯👉])')
+EXCESS_LINE_BREAKS_PATTERN = re.compile(r'\n\s*\n\s*\n')
+SENTENCE_BREAK_PATTERN = re.compile(r'([.!?])\s*([A-Za-z])')
+LIVE_WORD_PATTERN = re.compile(r'\blive\b', flags=re.IGNORECASE)
+PM_SPACING_PATTERN = re.compile(r'(?<!\d)(\d+)\s*PM')
+RUPEE_SPACING_PATTERN = re.compile(r'₹\s*(\d+)')
+BULLET_EMOJI_PATTERN = re.compile(r'(\n)(💥|💬|🎯)')
+
 def fix_team_identified_issues(text, target_lang):
     """Fix issues identified by team training data"""
     
     # Remove over-explanation patterns
-    over_explanation_patterns = [
-        r'This message is about.*?\.',
-        r'.*?കുറിച്ചാണ്.*?\.',
-        r'.*?regarding.*?\.',
-        r'.*?concerning.*?\.',
-    ]
-    
-    for pattern in over_explanation_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    text = run_cleanup_passes(text, OVER_EXPLANATION_PASSES)
     
     # Ensure proper emoji preservation 
-    text = re.sub(r'\s+([👋🎉💥💬🎯👉])', r' \1', text)
+    text = EMOJI_SPACING_PATTERN.sub(r' \1', text)
     
     # Fix segmentation issues - ensure proper line breaks
-    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Remove excessive line breaks
-    text = re.sub(r'([.!?])\s*([A-Za-z])', r'\1\n\n\2', text)  # Add breaks after sentences where needed
+    text = EXCESS_LINE_BREAKS_PATTERN.sub('\n\n', text)  # Remove excessive line breaks
+    text = SENTENCE_BREAK_PATTERN.sub(r'\1\n\n\2', text)  # Add breaks after sentences where needed
     
     return text.strip()
 
@@ -936,189 +842,154 @@ def enhance_emoji_and_formatting_based_on_training(text, target_lang):
     """Enhance emoji and formatting based on training examples + team corrections"""
     
     # Ensure LIVE stays in caps and gets proper treatment
-    text = re.sub(r'\blive\b', 'LIVE', text, flags=re.IGNORECASE)
+    text = LIVE_WORD_PATTERN.sub('LIVE', text)
     
     # Ensure proper emoji spacing (observed in examples)
-    text = re.sub(r'(\d+)\s*PM', r'\1 PM', text)  # Proper PM spacing
-    text = re.sub(r'₹\s*(\d+)', r'₹\1', text)    # Proper rupee spacing
+    text = PM_SPACING_PATTERN.sub(r'\1 PM', text)  # Proper PM spacing
+    text = RUPEE_SPACING_PATTERN.sub(r'₹\1', text)    # Proper rupee spacing
     
     # Add missing exclamation marks where appropriate (pattern from examples + team data)
     if "join" in text.lower() and not text.strip().endswith(('!', '?')):
         text = text.strip() + '!'
     
     # Preserve bullet points and structure from team corrections
-    text = re.sub(r'(\n)(💥|💬|🎯)', r'\1\n\2', text)  # Ensure proper spacing for bullet emojis
+    text = BULLET_EMOJI_PATTERN.sub(r'\1\n\2', text)  # Ensure proper spacing for bullet emojis
     
     return text
 
 # -------------------- QUALITY ASSESSMENT FUNCTIONS -------------------- #
 
-def calculate_enhanced_translation_confidence(original, translated, source_lang, target_lang):
-    """Calculate confidence score with enhanced quality checks + team training insights"""
-    if not translated or translated.startswith("❌") or not original:
-        return 0.0
-    
-    confidence = 1.0
-    
-    # Universal issue checks
-    if re.search(r'\[+[^\[\]]*\]+', translated):
-        confidence -= 0.3
-    
-    # Check for incomplete translations (team training insight)
-    original_sentences = len(re.findall(r'[.!?]+', original))
-    translated_sentences = len(re.findall(r'[.!?।]+', translated))
-    if original_sentences > translated_sentences + 1:
-        confidence -= 0.4
-    
-    # Check length ratio
-    length_ratio = len(translated) / len(original) if original else 1
-    if length_ratio > 3.0 or length_ratio < 0.3:
-        confidence -= 0.2
-    
-    # Check for repeated phrases
-    words = translated.split()
-    if len(words) > 4:
-        for i in range(len(words) - 2):
-            phrase = " ".join(words[i:i+3])
-            if translated.count(phrase) > 1:
-                confidence -= 0.3
-                break
-    
-    # Enhanced checks for training pattern compliance
-    message_context = detect_message_context_type(original)
-    lang_code = target_lang.split('-')[0].lower()
-    
-    # Check if key training patterns were applied correctly
-    if message_context == "rakhi_festival":
-        if "rakhi" in original.lower() and "Rakhi" not in translated:
-            confidence -= 0.2
-        if "brother" in original.lower() and lang_code == "hi" and "bhai" not in translated.lower():
-            confidence -= 0.1
-    
-    if message_context == "whatsapp_promotion":
-        if "whatsapp channel" in original.lower() and "WhatsApp Channel" not in translated:
-            confidence -= 0.2
-    
-    if "live" in original.lower() and "LIVE" not in translated:
-        confidence -= 0.1
-    
-    # NEW: Team training specific checks
-    team_issues = detect_team_quality_issues(original, translated)
-    if "over_explanation" in team_issues:
-        confidence -= 0.3
-    if "incomplete_translation" in team_issues:
-        confidence -= 0.4
-    if "missing_formatting" in team_issues:
-        confidence -= 0.2
-    
-    return max(0.0, min(1.0, confidence))
+# Leftover [..] brackets; (?<!\[) keeps long "[[[[" runs linear
+BRACKET_ARTIFACT_PATTERN = re.compile(r'(?<!\[)\[+[^\[\]]*\]+')
 
-def analyze_enhanced_translation_quality(original, translated, source_lang, target_lang):
-    """Enhanced quality analysis with training pattern compliance + team insights"""
+SOURCE_SENTENCE_PATTERN = re.compile(r'[.!?]+')
+TRANSLATED_SENTENCE_PATTERN = re.compile(r'[.!?।]+')
+
+def has_repeated_trigram(words):
+    """True if any three-word phrase occurs twice; one pass with a hash set of word trigrams"""
+    seen = set()
+    for trigram in zip(words, words[1:], words[2:]):
+        if trigram in seen:
+            return True
+        seen.add(trigram)
+    return False
+
+def _score_translation(original, translated, target_lang, message_context):
+    """Run every quality check once, returning (quality_flags, confidence)"""
     quality_flags = []
-    
-    if not translated or translated.startswith("❌"):
-        return quality_flags, 0.0
-    
-    confidence = calculate_enhanced_translation_confidence(original, translated, source_lang, target_lang)
+    confidence = 1.0
+    translated_lower = translated.lower()
     
     # Universal quality checks
-    if re.search(r'\[+[^\[\]]*\]+', translated):
+    if BRACKET_ARTIFACT_PATTERN.search(translated):
+        confidence -= 0.3
         quality_flags.append("🔧 Brand name formatting issue detected - brackets around text")
     
     # Check for incomplete sentence translation (enhanced with team training)
-    original_sentences = len(re.findall(r'[.!?]+', original))
-    translated_sentences = len(re.findall(r'[.!?।]+', translated))
+    original_sentences = len(SOURCE_SENTENCE_PATTERN.findall(original))
+    translated_sentences = len(TRANSLATED_SENTENCE_PATTERN.findall(translated))
     if original_sentences > translated_sentences + 1:
+        confidence -= 0.4
         quality_flags.append("📝 Incomplete translation detected - missing sentences (team training insight)")
     
     # Check dramatic length changes
-    if original and translated:
+    if original:
         length_ratio = len(translated) / len(original)
         if length_ratio > 3.0:
+            confidence -= 0.2
             quality_flags.append("📏 Translation much longer than original - possible over-explanation (team insight)")
         elif length_ratio < 0.3:
+            confidence -= 0.2
             quality_flags.append("📏 Translation much shorter than original - may be missing content")
     
     # Check for repeated phrases
     words = translated.split()
-    if len(words) > 4:
-        for i in range(len(words) - 2):
-            phrase = " ".join(words[i:i+3])
-            if translated.count(phrase) > 1:
-                quality_flags.append("🔄 Repeated phrases detected - may indicate translation error")
-                break
+    if len(words) > 4 and has_repeated_trigram(words):
+        confidence -= 0.3
+        quality_flags.append("🔄 Repeated phrases detected - may indicate translation error")
     
     # Enhanced training pattern compliance checks
-    message_context = detect_message_context_type(original)
     lang_code = target_lang.split('-')[0].lower()
     
     # Festival pattern compliance
-    if message_context == "rakhi_festival":
-        if "rakhi" in original.lower() and "Rakhi" not in translated:
+    if message_context.context_type == "rakhi_festival":
+        if message_context.mentions("rakhi") and "Rakhi" not in translated:
+            confidence -= 0.2
             quality_flags.append("🎊 Festival context: 'Rakhi' should be preserved in English")
-        if "brother" in original.lower() and lang_code == "hi" and "bhai" not in translated.lower():
+        if message_context.mentions("brother") and lang_code == "hi" and "bhai" not in translated_lower:
+            confidence -= 0.1
             quality_flags.append("👨‍👧‍👦 Missing cultural term: should use 'bhai' for brother in Hindi")
     
     # WhatsApp pattern compliance
-    if message_context == "whatsapp_promotion":
-        if "whatsapp channel" in original.lower() and "WhatsApp Channel" not in translated:
+    if message_context.context_type == "whatsapp_promotion":
+        if message_context.mentions("whatsapp channel") and "WhatsApp Channel" not in translated:
+            confidence -= 0.2
             quality_flags.append("📱 WhatsApp Channel should be preserved in mixed case")
     
     # Live session compliance
-    if "live" in original.lower() and "LIVE" not in translated:
+    if message_context.mentions("live") and "LIVE" not in translated:
+        confidence -= 0.1
         quality_flags.append("📺 'LIVE' should be preserved in all caps")
     
     # NEW: Team training specific quality checks
-    team_issues = detect_team_quality_issues(original, translated)
+    team_issues = detect_team_quality_issues(original, translated, translated_lower)
     if "over_explanation" in team_issues:
+        confidence -= 0.3
         quality_flags.append("🎯 Over-explanation detected - should be direct translation (team insight)")
     if "incomplete_translation" in team_issues:
+        confidence -= 0.4
         quality_flags.append("⚠️ Incomplete translation - missing content (team training pattern)")
+    if "missing_formatting" in team_issues:
+        confidence -= 0.2
     
-    return quality_flags, confidence
+    return quality_flags, max(0.0, min(1.0, confidence))
 
-# -------------------- CHATGPT ENHANCEMENT FUNCTIONS -------------------- #
+def calculate_enhanced_translation_confidence(original, translated, source_lang, target_lang, message_context=None):
+    """Calculate confidence score with enhanced quality checks + team training insights"""
+    return analyze_enhanced_translation_quality(original, translated, source_lang, target_lang, message_context)[1]
 
-def get_enhanced_chatgpt_prompt_with_training(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level):
-    """Build enhanced ChatGPT prompt with all training examples + team corrections"""
-    
-    # Build training examples including team corrections
-    training_examples = build_comprehensive_chatgpt_training_examples(target_lang)
-    
-    # Language-specific instructions
-    lang_instructions = {
-        "hi-IN": "Hindi with Roman script (Hinglish) and English code-mixing. Example: 'weekend ON ho gaya hai'",
-        "ta-IN": "Tamil script with selective English words preserved. Example: 'Saturday – weekend OFFICIALLY ON!'", 
-        "te-IN": "Telugu with Roman script and English code-mixing. Example: 'weekend officially ON lo undhi'",
-        "ml-IN": "Malayalam script with simple English terms preserved where natural. CRITICAL: Direct translation only, avoid over-explanation",
-        "kn-IN": "Kannada script with simple English terms preserved where natural. CRITICAL: Maintain proper word order, translate ALL components",
-        "or-IN": "Odia script with simple English terms preserved where natural"
-    }
-    
-    # Mode instructions
-    mode_instructions = {
-        "modern-colloquial": "modern, casual, conversational style",
-        "formal": "formal, professional, respectful tone",
-        "classic-colloquial": "literal, word-for-word accuracy prioritized",
-        "code-mixed": "heavy English-local language mixing, trendy expressions"
-    }
-    
-    # Formality mapping
-    formality_descriptions = {
-        1: "very casual, informal", 2: "casual, friendly", 3: "neutral, balanced",
-        4: "respectful, semi-formal", 5: "very formal, professional"
-    }
+def analyze_enhanced_translation_quality(original, translated, source_lang, target_lang, message_context=None):
+    """Enhanced quality analysis with training pattern compliance + team insights"""
+    if not translated or translated.startswith("❌"):
+        return [], 0.0
     
-    # Build language context
-    language_context = f"""
-Language Target: {lang_instructions.get(target_lang, "the target language")}
-Style Mode: {mode_instructions.get(mode, mode)}
-Formality Level: {formality_descriptions.get(formality_level, "balanced")}
-"""
+    message_context = message_context or build_message_context(original)
+    quality_flags, confidence = _score_translation(original, translated, target_lang, message_context)
     
-    # Add team training warnings
-    team_warnings = """
+    # Without a source text there is nothing to be confident about
+    return quality_flags, confidence if original else 0.0
+
+# -------------------- CHATGPT ENHANCEMENT FUNCTIONS -------------------- #
+
+# The review prompt is held to roughly this many tokens; training examples are added
+# in order of relevance to the message until the budget is used up
+CHATGPT_PROMPT_TOKEN_BUDGET = int(os.getenv("CHATGPT_PROMPT_TOKEN_BUDGET", "900"))
+
+# Language-specific instructions
+LANG_INSTRUCTIONS = {
+    "hi-IN": "Hindi with Roman script (Hinglish) and English code-mixing. Example: 'weekend ON ho gaya hai'",
+    "ta-IN": "Tamil script with selective English words preserved. Example: 'Saturday – weekend OFFICIALLY ON!'", 
+    "te-IN": "Telugu with Roman script and English code-mixing. Example: 'weekend officially ON lo undhi'",
+    "ml-IN": "Malayalam script with simple English terms preserved where natural. CRITICAL: Direct translation only, avoid over-explanation",
+    "kn-IN": "Kannada script with simple English terms preserved where natural. CRITICAL: Maintain proper word order, translate ALL components",
+    "or-IN": "Odia script with simple English terms preserved where natural"
+}
+
+# Mode instructions
+MODE_INSTRUCTIONS = {
+    "modern-colloquial": "modern, casual, conversational style",
+    "formal": "formal, professional, respectful tone",
+    "classic-colloquial": "literal, word-for-word accuracy prioritized",
+    "code-mixed": "heavy English-local language mixing, trendy expressions"
+}
+
+# Formality mapping
+FORMALITY_DESCRIPTIONS = {
+    1: "very casual, informal", 2: "casual, friendly", 3: "neutral, balanced",
+    4: "respectful, semi-formal", 5: "very formal, professional"
+}
+
+TEAM_WARNINGS = """
 TEAM TRAINING CRITICAL RULES:
 - NO over-explanation or meta-commentary about the message
 - Translate ALL sentences completely - do not skip any content
@@ -1126,25 +997,12 @@ TEAM TRAINING CRITICAL RULES:
 - Preserve ALL emojis and formatting exactly
 - Direct translation only - avoid describing what the message is about
 """
-    
-    prompt = f"""TASK: Fix and improve this translation following the quality patterns shown in ALL training examples + team corrections.
-
-ORIGINAL ENGLISH:
-{original_text}
 
-TRANSLATION TO FIX:
-{sarvam_translation}
-
-REQUIREMENTS:
-{language_context}
-
-{team_warnings}
-
-{training_examples}
+PROMPT_CRITICAL_RULES = """
 
 CRITICAL RULES (UPDATED WITH TEAM TRAINING):
-1. Follow the EXACT patterns shown in ALL training examples above (all 3 layers + team corrections)
-2. Fix any bracket issues around brand names (FRND}}]], Team FRND}}]] should be FRND, Team FRND)
+1. Follow the EXACT patterns shown in the training examples above (team corrections included)
+2. Fix any bracket issues around brand names (FRND}]], Team FRND}]] should be FRND, Team FRND)
 3. Complete any incomplete sentences - translate EVERYTHING
 4. Use the same mixing patterns as training examples
 5. Keep exact same script (Roman/Native) and formality level
@@ -1159,145 +1017,206 @@ CRITICAL RULES (UPDATED WITH TEAM TRAINING):
 
 CORRECTED TRANSLATION:"""
 
-    return prompt
-
-def build_comprehensive_chatgpt_training_examples(target_lang):
-    """Build training examples for ChatGPT that include all 3 layers + team corrections"""
-    
-    lang_code = target_lang.split('-')[0].lower()
-    
-    if lang_code == "hi":
-        return """
-TRAINING EXAMPLES (follow these patterns exactly):
-
-LAYER 1 - Meeting/Live patterns:
-English: "We're LIVE! Join now!"
-Quality Hindi: "Hum LIVE hain! Abhi join karo!"
-
-English: "Don't miss it!"
-Quality Hindi: "Miss mat karna!"
-
-LAYER 2 - WhatsApp Channel patterns:
-English: "Join our new WhatsApp Channel"
-Quality Hindi: "Naya WhatsApp Channel join karo"
-
-English: "Tired of small earnings? Let's fix that"
-Quality Hindi: "Kam earnings se thak gaye hoge na? Chinta mat karo"
-
-LAYER 3 - Festival patterns:
-English: "Gift Your Bhai ₹1000 Hamper"
-Quality Hindi: "Apne Bhai ko do ₹1000 ka Hamper"
-
-English: "Just by Being Online earn real money"
-Quality Hindi: "Sirf Online aakar kamao real money"
-
-English: "Tonight's the Night! Why wait?"
-Quality Hindi: "Aaj ki raat hai khaas! Toh phir rukna kyu?"
-"""
-    elif lang_code == "ta":
-        return """
-TRAINING EXAMPLES (follow these patterns exactly):
-
-LAYER 1 - Meeting/Live patterns:
-English: "We're LIVE! Join now!"
-Quality Tamil: "நாங்க LIVE ஆ இருக்கோம்! இப்போவே join பண்ணுங்க!"
-
-English: "Really helpful session"
-Quality Tamil: "session definitely உங்களுக்கு help ஆகும்!"
-
-LAYER 2 - WhatsApp Channel patterns:
-English: "New here? You're not alone"
-Quality Tamil: "இது உங்க first time-a? நீங்கள் தனியா இல்ல"
-
-LAYER 3 - Festival patterns:
-English: "Just by Being Online earn real money"
-Quality Tamil: "FRND-ல Onlineல இருந்தாலே போதும் நேரடி பணம் சேரும்"
-
-English: "Make this Rakhi extra special"
-Quality Tamil: "இந்த Rakhi-யை Special-aa ஆக்குங்க"
-"""
-    elif lang_code == "te":
-        return """
-TRAINING EXAMPLES (follow these patterns exactly):
-
-LAYER 1 - Meeting/Live patterns:
-English: "We're LIVE! Join now!"
-Quality Telugu: "Manam LIVE lo unnam! Ipude join avvandi!"
-
-LAYER 2 - WhatsApp Channel patterns:
-English: "New here?"
-Quality Telugu: "App ki new ah?"
-
-LAYER 3 - Festival patterns:
-English: "Gift Your Bhai ₹1000 Hamper"
-Quality Telugu: "మీ బ్రదర్ కి Gift చేయొచ్చు ₹1000 హ్యాంపర్"
-"""
-    elif lang_code == "ml":
-        return """
-TRAINING EXAMPLES + TEAM CORRECTIONS (follow these patterns exactly):
-
-LAYER 1 - Meeting/Live patterns + TEAM TRAINING:
-English: "💛 The FRND Meeting is happening now! From call tips to earnings to what's new on the app — it's all being discussed live! 🎯 Jump in now if you haven't already!"
-WRONG (Sarvam): "ഫ്രണ്ട്" മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു. "കോൾ" ഫീച്ചർ എങ്ങനെ യൂസ് ചെയ്യാമെന്നുള്ള ടിപ്സ് ഷെയർ ചെയ്യുന്നു...
-TEAM CORRECTED: "💛 FRND മീറ്റിംഗ് ഇപ്പോൾ നടക്കുന്നു! കോൾ ടിപ്സ് മുതൽ എർണിങ്സ് വരെ ഡിസ്കസ് ചെയ്യുന്നു, ആപ്പിലെ ലേറ്റസ്റ്റ് അപ്ഡേറ്റ്സിനെ കുറിച്ചും സംസാരിക്കുന്നു. 🎯 ഇപ്പോൾ തന്നെ ചേരൂ!"
-
-English: "FRND Meeting is LIVE right now! Tap to join – useful tips being shared!"
-WRONG (Sarvam): ഇപ്പോൾ ലൈവ് ആയിട്ടുള്ള ഒരു മീറ്റിങ്ങിനെ കുറിച്ചാണീ മെസ്സേജ്...
-TEAM CORRECTED: "FRND മീറ്റിംഗ് ഇപ്പോൾ LIVE ആണ്! ജോയിൻ ചെയ്യാൻ ടാപ്പ് ചെയ്യൂ"
-
-LAYER 2 - WhatsApp Channel patterns + TEAM TRAINING:
-English: "Hi [Name]! 👋 FRND's brand-new WhatsApp Channel is here… and guess what? You're on the special invite list! 🎉"
-TEAM CORRECTED: "നമസ്കാരം [പേര്]! 👋 FRND-ന്റെ പുതിയ WhatsApp ചാനൽ എത്തിയിരിക്കുന്നു ഒന്ന് Guess ചെയാമോ? നിങ്ങൾ സ്പെഷ്യൽ ഇൻവൈറ്റ് ലിസ്റ്റിലുണ്ട്! 🎉"
-
-CRITICAL TEAM TRAINING RULES:
-- NO over-explanation (avoid "കുറിച്ചാണ്" patterns)
-- Direct translation only
-- Complete ALL sentences
-- Preserve ALL emojis exactly
+def estimate_prompt_tokens(text):
+    """Rough GPT token count: about 4 ASCII characters per token, one token per emoji or Indic character"""
+    non_ascii = count_non_ascii(text)
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """The fixed parts of a review prompt for one (language, mode, formality), rendered once"""
+    task: str
+    fix_heading: str
+    requirements: str
+    closing: str
+    fixed_tokens: int
+
+@lru_cache(maxsize=256)
+def get_prompt_template(target_lang, mode, formality_level):
+    """Precompiled prompt template for one (language, mode, formality)"""
+    language_context = f"""
+Language Target: {LANG_INSTRUCTIONS.get(target_lang, "the target language")}
+Style Mode: {MODE_INSTRUCTIONS.get(mode, mode)}
+Formality Level: {FORMALITY_DESCRIPTIONS.get(formality_level, "balanced")}
 """
-    elif lang_code == "kn":
-        return """
-TRAINING EXAMPLES + TEAM CORRECTIONS (follow these patterns exactly):
+    task = "TASK: Fix and improve this translation following the quality patterns shown in the training examples + team corrections.\n\nORIGINAL ENGLISH:\n"
+    fix_heading = "\n\nTRANSLATION TO FIX:\n"
+    requirements = f"\n\nREQUIREMENTS:\n{language_context}\n\n{TEAM_WARNINGS}\n"
+    fixed_tokens = sum(estimate_prompt_tokens(part) for part in [task, fix_heading, requirements, PROMPT_CRITICAL_RULES]) + 1
+    return PromptTemplate(task, fix_heading, requirements, PROMPT_CRITICAL_RULES, fixed_tokens)
+
+@dataclass(frozen=True)
+class PromptExample:
+    """One training example from rules/chatgpt_training_examples.json, pre-rendered for the prompt"""
+    layer: str
+    text: str
+    contexts: frozenset
+    keywords: frozenset
+    tokens: int
+
+@dataclass(frozen=True)
+class TrainingExamples:
+    """A language's compiled training examples plus the header and team rules around them"""
+    header: str
+    examples: tuple
+    rules: str
+    fixed_tokens: int
+
+def _render_example(example):
+    lines = [f'English: "{example["english"]}"']
+    if example.get("wrong"):
+        lines.append(f'WRONG (Sarvam): {example["wrong"]}')
+    lines.append(f'{example["label"]}: "{example["translation"]}"')
+    return "\n".join(lines)
+
+@lru_cache(maxsize=64)
+def compile_training_examples(rule_pack, target_lang):
+    """Render and index a language's training examples once per rule pack; None if it has none"""
+    entry = rule_pack.tables.get("chatgpt_training_examples", {}).get(target_lang)
+    if not entry:
+        return None
+    examples = []
+    for example in entry["examples"]:
+        text = _render_example(example)
+        english_lower = example["english"].lower()
+        keywords = frozenset(word for word in ALL_CONTEXT_KEYWORDS if word in english_lower)
+        # Costed with its layer heading and separator, so a selection never overshoots the budget
+        tokens = estimate_prompt_tokens(f"{example['layer']}:\n{text}\n\n")
+        examples.append(PromptExample(example["layer"], text, frozenset(example["contexts"]), keywords, tokens))
+    rules = ""
+    if entry.get("rules"):
+        rules = entry["rules_header"] + "\n" + "\n".join(f"- {rule}" for rule in entry["rules"])
+    return TrainingExamples(entry["header"], tuple(examples), rules, estimate_prompt_tokens(f"\n{entry['header']}\n\n\n\n{rules}\n"))
+
+def render_training_examples(compiled, examples):
+    """The training examples block: header, examples grouped under their layer headings, team rules"""
+    blocks = []
+    layer = None
+    for example in examples:
+        blocks.append(example.text if example.layer == layer else f"{example.layer}:\n{example.text}")
+        layer = example.layer
+    rules = f"\n\n{compiled.rules}" if compiled.rules else ""
+    return f"\n{compiled.header}\n\n" + "\n\n".join(blocks) + rules + "\n"
+
+# Keyword to the context it signals, for scoring examples against every context a message touches
+KEYWORD_CONTEXTS = {word: context for context, words in CONTEXT_KEYWORDS for word in words}
+
+@lru_cache(maxsize=1024)
+def rank_training_examples(rule_pack, target_lang, context_type, keywords):
+    """Indexes of a language's examples, most relevant first, for one message context"""
+    compiled = compile_training_examples(rule_pack, target_lang)
+    message_contexts = {KEYWORD_CONTEXTS[word] for word in keywords if word in KEYWORD_CONTEXTS}
+    
+    def relevance(example):
+        return (2 * (context_type in example.contexts)
+                + bool(example.contexts & message_contexts)
+                + len(example.keywords & keywords))
+    
+    scores = [relevance(example) for example in compiled.examples]
+    ranked = sorted((i for i, score in enumerate(scores) if score > 0), key=lambda i: -scores[i])
+    # Nothing relevant (e.g. a plain welcome message): one example still shows the language's style
+    return tuple(ranked) or (0,)
+
+def select_training_examples(target_lang, message_context, token_budget, rule_pack=None):
+    """The training examples most relevant to the message's context that fit in token_budget"""
+    rule_pack = rule_pack or get_active_rule_pack()
+    compiled = compile_training_examples(rule_pack, target_lang)
+    if compiled is None:
+        return ""
+    ranked = rank_training_examples(rule_pack, target_lang, message_context.context_type, message_context.keywords)
+    
+    chosen = []
+    used_tokens = compiled.fixed_tokens
+    for i in ranked:
+        if used_tokens + compiled.examples[i].tokens <= token_budget:
+            chosen.append(i)
+            used_tokens += compiled.examples[i].tokens
+    if not chosen:
+        return ""
+    return render_training_examples(compiled, [compiled.examples[i] for i in sorted(chosen)])
+
+def get_enhanced_chatgpt_prompt_with_training(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, message_context=None, token_budget=None, rule_pack=None):
+    """Build the ChatGPT review prompt: precompiled template plus the training examples relevant to this message"""
+    template = get_prompt_template(target_lang, mode, formality_level)
+    
+    # Hints from preprocessing, passed as metadata
+    context_notes = f"\n{context_hints.to_prompt_section()}\n" if context_hints else ""
+    
+    # Whatever the message and hints leave of the budget goes to training examples
+    token_budget = token_budget or CHATGPT_PROMPT_TOKEN_BUDGET
+    used_tokens = template.fixed_tokens + sum(estimate_prompt_tokens(part) for part in [original_text, sarvam_translation, context_notes])
+    message_context = message_context or build_message_context(original_text, context_type)
+    training_examples = select_training_examples(target_lang, message_context, token_budget - used_tokens, rule_pack)
+    
+    return "".join([
+        template.task, original_text, template.fix_heading, sarvam_translation, template.requirements,
+        context_notes, "\n", training_examples, template.closing
+    ])
 
-LAYER 2 - WhatsApp Channel patterns + TEAM TRAINING:
-English: "Hi [Name]! 👋 FRND's brand-new WhatsApp Channel is here… and guess what? You're on the special invite list! 🎉"
-TEAM CORRECTED: "ನಮಸ್ಕಾರ [Name]! 👋 FRND ನ ಹೊಚ್ಚ ಹೊಸ WhatsApp ಚಾನೆಲ್ ಇಲ್ಲಿದೆ...ಮತ್ತು ಗೆಸ್ಸ್ ಮಾಡಿ ? ನೀವು ಸ್ಪೆಷಲ್ ಲಿಸ್ಟಲ್ಲಿ ಇದ್ದೀರಿ! 🎉"
-
-English: "Be the first to know about discounts"
-TEAM CORRECTED: "ಡಿಸ್ಕೌಂಟ್ಸ್ ಬಗ್ಗೆ ಫಸ್ಟ್ ಆಗಿ ತಿಳಿಯಿರಿ"
-
-English: "It's that simple & never miss anything fun on FRND!"
-TEAM CORRECTED: "ಇಷ್ಟು ಸಿಂಪಲ್, FRND‌ನಲ್ಲಿ ಮಜಾ ಯಾವತ್ತೂ ಮಿಸ್ ಆಗೋದು ಇಲ್ಲ!"
-
-CRITICAL TEAM TRAINING RULES:
-- Maintain proper word order
-- Translate ALL components
-- No missing words or lines
-- Preserve structure and formatting
-"""
-    
-    return ""
+def build_comprehensive_chatgpt_training_examples(target_lang):
+    """Every training example for a language (all 3 layers + team corrections), as one prompt block"""
+    compiled = compile_training_examples(get_active_rule_pack(), target_lang)
+    if compiled is None:
+        return ""
+    return render_training_examples(compiled, compiled.examples)
 
 # -------------------- HELPER FUNCTIONS -------------------- #
 
 def clean_instruction_leaks_from_result(text):
     """Clean all possible instruction leaks from translation result + team training patterns"""
-    
-    instruction_patterns = [
-        r'\[INSTRUCTION:.*?\]\s*', r'\[INST:.*?\]\s*', r'\[Translate completely including:.*?\]\s*',
-        r'\[translate from:.*?\]\s*', r'\[.*?translate.*?from.*?\]\s*', r'^\[.*?\]\s*',
-        r'\[Context:.*?\]\s*', r'\[Apply quality patterns:.*?\]\s*', r'\[Festival context:.*?\]\s*',
-        r'\[Apply:.*?\]\s*',
-        # Team training: Remove over-explanation patterns
-        r'This message is about.*?\.',
-        r'.*?കുറിച്ചാണ്.*?\.',
-        r'.*?regarding.*?\.',
-    ]
-    
-    for pattern in instruction_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
-    
-    return text
+    return run_cleanup_passes(text, INSTRUCTION_LEAK_PASSES)
+
+class _CleanTextMemo:
+    """Bounded LRU of (rule pack hash, target_lang, text) -> cleaned text"""
+    
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+CLEAN_TEXT_MEMO_SIZE = 2048
+_CLEAN_TEXT_MEMO = _CleanTextMemo(CLEAN_TEXT_MEMO_SIZE)
+
+def _clean_translation_output_uncached(text, target_lang, rule_pack=None):
+    text = run_cleanup_passes(text, OUTPUT_CLEANUP_PASSES)
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
+    return enhanced_postprocess_translation_output(text, target_lang, rule_pack)
+
+def clean_translation_output(text, target_lang, rule_pack=None):
+    """Unified cleanup for a Sarvam or ChatGPT result: instruction leaks, brand brackets, formatting, training fixes
+    
+    Same output as the old chain of instruction-leak, brand-name and formatting fixes followed by
+    enhanced_postprocess_translation_output. Results are memoized on the input text only: the old
+    chain is not idempotent, so an output is never assumed to be clean already.
+    """
+    # Keyed on the rule pack too, so a hot reload never serves the old pack's cleanup
+    rule_pack = rule_pack or get_active_rule_pack()
+    pack_hash = rule_pack.pack_hash
+    cleaned = _CLEAN_TEXT_MEMO.get((pack_hash, target_lang, text))
+    if cleaned is not None:
+        return cleaned
+    
+    cleaned = _clean_translation_output_uncached(text, target_lang, rule_pack)
+    _CLEAN_TEXT_MEMO.put((pack_hash, target_lang, text), cleaned)
+    return cleaned
 
 # -------------------- VERSION INFO -------------------- #
 
@@ -1308,14 +1227,18 @@ TRAINING_LAYERS = ["Meeting/Live Sessions", "WhatsApp Channel/Privacy", "Festiva
 
 def get_enhancement_info():
     """Get information about the current enhancement version"""
+    rule_pack = get_active_rule_pack()
+    tables = rule_pack.tables
     return {
         "version": TRANSLATION_ENHANCEMENTS_VERSION,
         "last_updated": LAST_UPDATED,
         "supported_languages": SUPPORTED_LANGUAGES,
         "training_layers": TRAINING_LAYERS,
-        "total_patterns": len(QUALITY_TRAINING_PATTERNS) + len(ADDITIONAL_QUALITY_PATTERNS) + len(FESTIVAL_QUALITY_PATTERNS) + len(TEAM_TRAINING_CORRECTIONS),
-        "total_fixes": len(LAYER1_TRAINING_FIXES) + len(LAYER2_TRAINING_FIXES) + len(LAYER3_TRAINING_FIXES),
-        "team_training_languages": list(TEAM_TRAINING_CORRECTIONS.keys()),
+        "total_patterns": len(tables["quality_training_patterns"]) + len(tables["additional_quality_patterns"]) + len(tables["festival_quality_patterns"]) + len(tables["team_training_corrections"]),
+        "total_fixes": len(tables["layer1_training_fixes"]) + len(tables["layer2_training_fixes"]) + len(tables["layer3_training_fixes"]),
+        "team_training_languages": list(tables["team_training_corrections"].keys()),
+        # Changes whenever rules/ or preserve_words.txt change; usable as a cache invalidation key
+        "rule_pack_hash": rule_pack.pack_hash,
         "key_improvements": [
             "Direct translation patterns (no over-explanation)",
             "Complete sentence translation enforcement", 
@@ -0,0 +1,260 @@
+# TRANSLATION MEMORY - Approved translations of single message lines, reused across messages
+# FRND messages repeat many lines ("Tap to join", "Don't miss it!"), so every approved
+# one-line message is kept as a (source line, translation) segment keyed by target language
+# and mode. Longer messages are kept whole: their approved text has been through cleanup,
+# which re-breaks lines, so its lines need not pair up with the source's. Only exact matches are reused as-is; the other lines still go to Sarvam and
+# ChatGPT. A close (character-trigram fuzzy) match is only ever a suggestion for the
+# ChatGPT review, since "9 PM" and "8 PM" or "Rs 500" and "Rs 5000" are near-identical lines.
+
+import csv
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Dice similarity of character trigrams a fuzzy suggestion needs (1.0 turns suggestions off)
+FUZZY_THRESHOLD = float(os.getenv("TRANSLATION_MEMORY_FUZZY_THRESHOLD", "0.9"))
+# Lines shorter than this (a lone emoji, "—") are always left to the vendors
+MIN_SEGMENT_CHARS = int(os.getenv("TRANSLATION_MEMORY_MIN_CHARS", "4"))
+
+# Segments stored without a mode match any mode
+ANY_MODE = ""
+# How translation_logs.csv stores line breaks
+LOG_LINE_SEPARATOR = " | "
+# ChatGPT status of a reviewed translation; only logged rows with it are imported
+APPROVED_STATUS = "Enhanced"
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Numbers, currency markers and placeholders: a suggestion must carry exactly the same ones
+PROTECTED_TOKEN_PATTERN = re.compile(r"\d+(?:[.,:]\d+)*|[₹$€£%]|\brs\b\.?|\binr\b|\[[^\]]*\]|\{[^}]*\}|<\s*pw\s*\d+\s*>", re.IGNORECASE)
+
+# -------------------- SEGMENTS -------------------- #
+
+def normalize_segment(text):
+    """A line as the memory sees it: NFC, single spaces, no outer whitespace"""
+    return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+def split_segments(text):
+    """The non-blank lines of a message, normalized (the same lines the pipeline sends to Sarvam)"""
+    return [normalize_segment(line) for line in text.replace("\r\n", "\n").split("\n") if line.strip()]
+
+def message_key(segments):
+    """The memory key of a whole multi-line message (no single segment contains a line break)"""
+    return "\n".join(segments)
+
+def protected_tokens(segment):
+    """The numbers, currency markers and placeholders of a line, in order"""
+    return [token.casefold().replace(" ", "") for token in PROTECTED_TOKEN_PATTERN.findall(segment)]
+
+def segment_trigrams(segment):
+    """Case-insensitive character trigrams used by the fuzzy index"""
+    padded = f"  {segment.casefold()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# -------------------- MEMORY -------------------- #
+
+class TranslationMemory:
+    """Exact segment lookup and guarded fuzzy suggestions per (target language, mode), with hit and saved-call counters"""
+
+    def __init__(self, fuzzy_threshold=FUZZY_THRESHOLD, min_segment_chars=MIN_SEGMENT_CHARS):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.min_segment_chars = min_segment_chars
+        self._segments = {}
+        self._trigram_index = {}
+        self._trigram_sizes = {}
+        self._loaded_logs = set()
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "misses": 0, "suggestions": 0, "unknown_status_rows": 0, "calls_saved": Counter()}
+
+    def add(self, source_segment, translation, target_lang, mode=ANY_MODE):
+        """Store one approved segment translation"""
+        source_segment = normalize_segment(source_segment)
+        if len(source_segment) < self.min_segment_chars:
+            return False
+        return self._store(source_segment, translation, target_lang, mode, fuzzy=True)
+
+    def add_translation(self, source_text, translated_text, target_lang, mode=ANY_MODE):
+        """Store an approved message translation; returns how many entries were stored
+
+        A one-line message is stored as a segment, reusable wherever that line appears.
+        A longer message is stored whole and only ever serves the same message.
+        """
+        if not translated_text or translated_text.startswith("❌"):
+            return 0
+        source_lines = split_segments(source_text)
+        translated_lines = split_segments(translated_text)
+        if not source_lines or not translated_lines:
+            return 0
+        if len(source_lines) == 1:
+            return int(self.add(source_lines[0], "\n".join(translated_lines), target_lang, mode))
+        # Kept out of the fuzzy index: suggestions are for single lines
+        return int(self._store(message_key(source_lines), translated_text, target_lang, mode, fuzzy=False))
+
+    def _store(self, source, translation, target_lang, mode, fuzzy):
+        translation = translation.strip()
+        if not translation:
+            return False
+        key = (target_lang, mode)
+        with self._lock:
+            segments = self._segments.setdefault(key, {})
+            if fuzzy and source not in segments:
+                trigrams = segment_trigrams(source)
+                index = self._trigram_index.setdefault(key, {})
+                for trigram in trigrams:
+                    index.setdefault(trigram, set()).add(source)
+                self._trigram_sizes.setdefault(key, {})[source] = len(trigrams)
+            segments[source] = translation
+        return True
+
+    def _fuzzy_match(self, segment, keys):
+        """Best indexed (source, translation) whose trigram Dice similarity reaches the threshold, or None
+
+        Candidates whose numbers, currency markers or placeholders differ from the line are skipped.
+        """
+        if self.fuzzy_threshold >= 1.0:
+            return None
+        trigrams = segment_trigrams(segment)
+        tokens = protected_tokens(segment)
+        best, best_score = None, self.fuzzy_threshold
+        for key in keys:
+            index = self._trigram_index.get(key, {})
+            sizes = self._trigram_sizes.get(key, {})
+            overlaps = Counter()
+            for trigram in trigrams:
+                overlaps.update(index.get(trigram, ()))
+            for candidate, overlap in overlaps.items():
+                score = 2 * overlap / (len(trigrams) + sizes[candidate])
+                if score >= best_score and protected_tokens(candidate) == tokens:
+                    best, best_score = (candidate, self._segments[key][candidate]), score
+        return best
+
+    def _keys(self, target_lang, mode):
+        return [(target_lang, mode)] if mode == ANY_MODE else [(target_lang, mode), (target_lang, ANY_MODE)]
+
+    def _find(self, source, target_lang, mode):
+        for key in self._keys(target_lang, mode):
+            translation = self._segments.get(key, {}).get(source)
+            if translation is not None:
+                return translation
+        return None
+
+    def lookup(self, segment, target_lang, mode=ANY_MODE, count=True):
+        """Approved translation of exactly this segment, or None"""
+        segment = normalize_segment(segment)
+        if len(segment) < self.min_segment_chars:
+            return None
+        with self._lock:
+            translation = self._find(segment, target_lang, mode)
+            if count:
+                self._stats["exact_hits" if translation is not None else "misses"] += 1
+        return translation
+
+    def lookup_lines(self, text, target_lang, mode=ANY_MODE, count=True):
+        """(segment, translation or None) for every line of a message
+
+        An approved translation of the whole message comes back as a single (message, translation) pair.
+        """
+        segments = split_segments(text)
+        if len(segments) > 1:
+            message = message_key(segments)
+            with self._lock:
+                translation = self._find(message, target_lang, mode)
+                if translation is not None and count:
+                    self._stats["exact_hits"] += 1
+            if translation is not None:
+                return [(message, translation)]
+        return [(segment, self.lookup(segment, target_lang, mode, count)) for segment in segments]
+
+    def suggest(self, segment, target_lang, mode=ANY_MODE):
+        """(approved source, its translation) for a close but not identical segment, or None
+
+        A suggestion is reference material for the ChatGPT review, never a translation to serve.
+        """
+        segment = normalize_segment(segment)
+        if len(segment) < self.min_segment_chars:
+            return None
+        with self._lock:
+            keys = self._keys(target_lang, mode)
+            if any(segment in self._segments.get(key, {}) for key in keys):
+                return None
+            suggestion = self._fuzzy_match(segment, keys)
+            if suggestion is not None:
+                self._stats["suggestions"] += 1
+        return suggestion
+
+    def suggest_lines(self, text, target_lang, mode=ANY_MODE):
+        """(segment, approved source, its translation) for every line of a message with a suggestion"""
+        suggestions = []
+        for segment in split_segments(text):
+            suggestion = self.suggest(segment, target_lang, mode)
+            if suggestion is not None:
+                suggestions.append((segment, *suggestion))
+        return suggestions
+
+    def record_saved_call(self, stage):
+        """Count a vendor call that was answered from the memory instead"""
+        with self._lock:
+            self._stats["calls_saved"][stage] += 1
+
+    def load_logs(self, filename, language_codes):
+        """Import the reviewed translation_logs.csv rows once per file; language_codes maps the logged language names to codes
+
+        Rows logged before the ChatGPT Status column existed are counted, not imported: their
+        output is either ChatGPT's or the cleaned Sarvam fallback, and the log cannot tell which.
+        """
+        with self._lock:
+            if filename in self._loaded_logs:
+                return 0
+            self._loaded_logs.add(filename)
+        if not os.path.exists(filename):
+            return 0
+
+        stored = 0
+        unknown_status = 0
+        try:
+            with open(filename, "r", newline="", encoding="utf-8") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for row in reader:
+                    status = row[6] if len(row) >= 7 else ""
+                    if not status and len(row) >= 4 and not row[3].startswith("❌"):
+                        unknown_status += 1
+                    if status != APPROVED_STATUS or row[1] not in language_codes:
+                        continue
+                    mode = row[5]
+                    source_text = row[2].replace(LOG_LINE_SEPARATOR, "\n")
+                    translated_text = row[3].replace(LOG_LINE_SEPARATOR, "\n")
+                    stored += self.add_translation(source_text, translated_text, language_codes[row[1]], mode)
+        except (OSError, csv.Error) as e:
+            logger.warning("Could not load translation memory from %s: %s", filename, e)
+        with self._lock:
+            self._stats["unknown_status_rows"] += unknown_status
+        return stored
+
+    def clear(self):
+        with self._lock:
+            self._segments.clear()
+            self._trigram_index.clear()
+            self._trigram_sizes.clear()
+            self._loaded_logs.clear()
+
+    def stats(self):
+        """Segment count, exact hit/miss and suggestion counters, and vendor calls saved since the process started"""
+        with self._lock:
+            lookups = self._stats["exact_hits"] + self._stats["misses"]
+            return {
+                "segments": sum(len(segments) for segments in self._segments.values()),
+                "exact_hits": self._stats["exact_hits"],
+                "misses": self._stats["misses"],
+                "suggestions": self._stats["suggestions"],
+                # Logged rows left out because their ChatGPT status was never recorded
+                "unknown_status_rows": self._stats["unknown_status_rows"],
+                "hit_rate": (lookups - self._stats["misses"]) / lookups if lookups else 0.0,
+                "calls_saved": dict(self._stats["calls_saved"])
+            }
+
+translation_memory = TranslationMemory()
@@ -0,0 +1,923 @@
+# TRANSLATION PIPELINE - Sarvam translation and ChatGPT review, sync and async
+# Each vendor step is split into prepare (pre-processing, cache lookup, request
+# payload) and finish (post-processing, cache store) halves shared by both the
+# requests-based functions and their asyncio counterparts. The async versions run
+# on one background event loop, so Streamlit can call them through run_sync() and
+# concurrent calls overlap their network waits instead of adding up.
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from dataclasses import dataclass, field, replace
+
+import httpx
+import requests
+
+from rule_packs import RulePack
+from translation_cache import CHATGPT_STAGE, SARVAM_STAGE, make_cache_key, translation_cache
+from translation_enhancements import (
+    analyze_enhanced_translation_quality,
+    build_context_hints,
+    build_message_context,
+    clean_translation_output,
+    ContextHints,
+    enhanced_preprocess_input_for_completeness,
+    get_active_rule_pack,
+    get_enhanced_chatgpt_prompt_with_training,
+    strip_chatgpt_meta_commentary,
+    UI_CONTEXT_TYPES
+)
+from translation_memory import translation_memory
+from vendor_clients import CircuitOpenError, async_openai_client, async_sarvam_client, openai_client, sarvam_client
+
+logger = logging.getLogger(__name__)
+
+# -------------------- CONFIG -------------------- #
+
+# Set by the app from its env/secrets lookup via configure_api_keys()
+SARVAM_API_KEY = os.getenv("SARVAM_API_KEY", "")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+
+# Language-specific script and code-mixing preferences
+LANGUAGE_PATTERNS = {
+    "hi-IN": {"script": "roman", "mode": "code-mixed"},
+    "te-IN": {"script": "roman", "mode": "code-mixed"},
+    "ta-IN": {"script": "mixed", "mode": "modern-colloquial"},
+    "ml-IN": {"script": "fully-native", "mode": "formal"},
+    "kn-IN": {"script": "fully-native", "mode": "formal"},
+    "or-IN": {"script": "mixed", "mode": "modern-colloquial"}
+}
+
+CHATGPT_MODEL = "gpt-3.5-turbo"
+CHATGPT_SYSTEM_PROMPT = "You are a translation editor with access to comprehensive training examples. Follow ALL training patterns exactly. Return ONLY the corrected translation text with no explanations or comments."
+
+# If ChatGPT returned explanatory text instead of a translation, the cleaned Sarvam output is kept
+EXPLANATORY_PHRASES = [
+    "already in line with", "no improvements needed", "meets the requirements",
+    "is already good", "no changes required", "translation provided is"
+]
+
+# Sarvam's translate endpoint takes at most 1000 input characters; longer messages are
+# split into chunks of whole lines (or sentences) below this size and sent concurrently
+SARVAM_CHUNK_CHARS = int(os.getenv("SARVAM_CHUNK_CHARS", "900"))
+LINE_SEPARATOR = " <LINEBREAK> "
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?।])\s+")
+
+# Hedge slow Sarvam requests with one duplicate (see VENDOR_HEDGE_PERCENTILE / VENDOR_HEDGE_MAX_RATE)
+SARVAM_HEDGING = os.getenv("SARVAM_HEDGING", "0") == "1"
+
+# Short opaque tokens the API passes through untouched, e.g. <PW0>
+PLACEHOLDER_PATTERN = re.compile(r"<\s*PW\s*(\d+)\s*>", flags=re.IGNORECASE)
+
+SARVAM_TIMEOUT_ERROR = "❌ Error: Sarvam request timed out"
+SARVAM_CONNECTION_ERROR = "❌ Error: Could not connect to Sarvam"
+CHATGPT_TIMEOUT_ERROR = "ChatGPT timeout - using cleaned Sarvam translation"
+CHATGPT_CONNECTION_ERROR = "Connection error - using cleaned Sarvam translation"
+# Returned at once while the endpoint's circuit breaker is open after repeated failures
+SARVAM_UNAVAILABLE_ERROR = "❌ Error: Sarvam is unavailable right now, please try again shortly"
+CHATGPT_UNAVAILABLE_ERROR = "ChatGPT unavailable - using cleaned Sarvam translation"
+
+# ChatGPT review is skipped when the Sarvam output scores at least this with no quality flags.
+# With no flags the analyzer scores 1.0, or 0.8 for an unflagged formatting penalty.
+QA_SKIP_CONFIDENCE = float(os.getenv("QA_SKIP_CONFIDENCE", "1.0"))
+# Per Message Type thresholds; None always runs the review
+QA_CONTEXT_THRESHOLDS = {
+    "Payment/Financial": None
+}
+# Detected message context to the Message Type it stands for, so the thresholds also apply when none was picked
+MESSAGE_TYPES_BY_CONTEXT = {context_type: message_type for message_type, context_type in UI_CONTEXT_TYPES.items()}
+QA_SKIPPED_STATUS = "Skipped"
+# Shown while a background review is still running
+QA_PENDING_STATUS = "Reviewing"
+
+# The single-language view streams the ChatGPT review into the page as it is generated
+CHATGPT_STREAMING = os.getenv("CHATGPT_STREAMING", "1") == "1"
+# Recent streamed reviews kept for the time-to-first-output average
+STREAM_TIMINGS_KEPT = 200
+
+# Threads for the blocking half of async pipeline calls (cache reads/writes, pre-processing,
+# cleanup), so the shared event loop only ever waits on the network
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "4"))
+
+def configure_api_keys(sarvam_api_key, openai_api_key):
+    """Set the vendor API keys (the app resolves them from env or Streamlit secrets)"""
+    global SARVAM_API_KEY, OPENAI_API_KEY
+    SARVAM_API_KEY = sarvam_api_key
+    OPENAI_API_KEY = openai_api_key
+
+# -------------------- HELPER FUNCTIONS -------------------- #
+
+def get_language_specific_settings(target_lang):
+    """Get optimized settings for each language"""
+    if target_lang in LANGUAGE_PATTERNS:
+        return LANGUAGE_PATTERNS[target_lang]
+    else:
+        return {"script": "roman", "mode": "modern-colloquial"}
+
+def tag_preserved_words(text, rule_pack=None):
+    """Replace preserved words with placeholders for API, returning the text and restore map"""
+    restore_map = {}
+    # Preserved words come from the active rule pack: one matcher, longest match first
+    preserve_word_matcher = (rule_pack or get_active_rule_pack()).preserve_word_matcher
+    if preserve_word_matcher is None:
+        return text, restore_map
+    
+    placeholders = {}
+    
+    def to_placeholder(match):
+        word = match.group(0)
+        if word not in placeholders:
+            placeholders[word] = str(len(placeholders))
+            restore_map[placeholders[word]] = word
+        return f"<PW{placeholders[word]}>"
+    
+    return preserve_word_matcher.sub(to_placeholder, text), restore_map
+
+def untag_preserved_words(text, restore_map):
+    """Restore preserved words from their placeholders"""
+    if not restore_map:
+        return text
+    return PLACEHOLDER_PATTERN.sub(lambda match: restore_map.get(match.group(1), match.group(0)), text)
+
+def prepare_multiline_input(text):
+    """Prepare multiline text for API"""
+    lines = text.strip().split("\n")
+    line_separator = LINE_SEPARATOR
+    processed_lines = []
+    for line in lines:
+        if line.strip():
+            processed_lines.append(line.strip())
+    return line_separator.join(processed_lines)
+
+def restore_multiline_output(translated_text, original_text):
+    """Restore line breaks in output"""
+    original_lines = [line.strip() for line in original_text.strip().split("\n") if line.strip()]
+    line_separator = LINE_SEPARATOR
+    
+    # First try our separator
+    if line_separator in translated_text:
+        translated_lines = translated_text.split(line_separator)
+        return "\n".join(translated_lines)
+    
+    # If that fails, try to detect natural breaking points
+    elif len(original_lines) > 1:
+        sentence_patterns = [
+            r'(?<=[.।!?❌])\s+(?=[🚫🚨🔗📱📲✅💙—•])',
+            r'(?<=[🚫])\s+(?=[A-Z])', r'(?<=[💙])\s+(?=[—])',
+            r'(?<=hai\.)\s+(?=[🚨])', r'(?<=hain\.)\s+(?=[A-Z🚨])',
+            r'(?<=[📱📲])\s+(?=[✅])', r'(?<=hai\.)\s+(?=[A-Z])',
+        ]
+        
+        for pattern in sentence_patterns:
+            potential_lines = re.split(pattern, translated_text.strip())
+            if len(potential_lines) >= 2:
+                return "\n".join(potential_lines)
+        
+        # Fallback: Split by emojis
+        emoji_break_pattern = r'(?<=[.।!?])\s+(?=[🚫🚨✅💙—])'
+        lines = re.split(emoji_break_pattern, translated_text.strip())
+        if len(lines) > 1:
+            return "\n".join(lines)
+    
+    return translated_text
+
+@dataclass
+class TextChunk:
+    """A piece of a message sent to Sarvam on its own; continues_line means the next chunk is the rest of this line"""
+    text: str
+    continues_line: bool = False
+
+def split_long_line(line, max_chars):
+    """Split one over-long line into pieces of at most max_chars, at sentence ends where possible, else at spaces"""
+    pieces = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(line):
+        # A single sentence longer than a chunk is cut at its last space that fits
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut].rstrip())
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+def segment_for_translation(text, max_chars=None):
+    """Split text into chunks of whole lines that stay under max_chars (SARVAM_CHUNK_CHARS) once joined for the API"""
+    max_chars = max_chars or SARVAM_CHUNK_CHARS
+    lines = [line.strip() for line in text.strip().split("\n") if line.strip()]
+    chunks = []
+    current_lines = []
+    current_size = 0
+    
+    for line in lines:
+        if len(line) > max_chars:
+            if current_lines:
+                chunks.append(TextChunk("\n".join(current_lines)))
+                current_lines, current_size = [], 0
+            pieces = split_long_line(line, max_chars)
+            chunks.extend(TextChunk(piece, continues_line=True) for piece in pieces[:-1])
+            chunks.append(TextChunk(pieces[-1]))
+            continue
+        
+        if current_lines and current_size + len(LINE_SEPARATOR) + len(line) > max_chars:
+            chunks.append(TextChunk("\n".join(current_lines)))
+            current_lines, current_size = [], 0
+        current_size += len(line) + (len(LINE_SEPARATOR) if current_lines else 0)
+        current_lines.append(line)
+    
+    if current_lines:
+        chunks.append(TextChunk("\n".join(current_lines)))
+    return chunks or [TextChunk(text.strip())]
+
+def join_translated_chunks(chunks, translations):
+    """Reassemble chunk translations in order: a newline between lines, a space inside a split line"""
+    parts = []
+    for chunk, translation in zip(chunks, translations):
+        parts.append(translation)
+        parts.append(" " if chunk.continues_line else "\n")
+    return "".join(parts[:-1])
+
+def enhance_catchy_phrases(text, target_lang):
+    """Improve translation of catchy/marketing phrases"""
+    catchy_phrases = {
+        "What is the scene": {
+            "hi-IN": "Scene kya hai", "ta-IN": "Scene என்னங்க", "te-IN": "Scene entante",
+            "ml-IN": "എന്താണ് scene", "kn-IN": "Scene ಏನು"
+        },
+        "Take the first step": {
+            "hi-IN": "Pehla step lo", "ta-IN": "First step எடுங்க", "te-IN": "Modati step teeskondi",
+            "ml-IN": "ആദ്യ step എടുക്കൂ", "kn-IN": "ಮೊದಲ step ತೆಗೆದುಕೊಳ್ಳಿ"
+        },
+        "lighthearted call": {
+            "hi-IN": "casual call", "ta-IN": "lighthearted-ஆ call", "te-IN": "casual ga call",
+            "ml-IN": "സുഖമായി call", "kn-IN": "ಸುಲಭವಾಗಿ call"
+        }
+    }
+    
+    for phrase, translations in catchy_phrases.items():
+        if phrase.lower() in text.lower() and target_lang in translations:
+            text = re.sub(re.escape(phrase), translations[target_lang], text, flags=re.IGNORECASE)
+    
+    return text
+# -------------------- SARVAM STAGE -------------------- #
+
+@dataclass
+class SarvamChunk:
+    """One Sarvam request for one chunk of a message"""
+    chunk: TextChunk
+    payload: dict
+    restore_map: dict = field(default_factory=dict)
+
+@dataclass
+class SarvamCall:
+    """One prepared Sarvam translation: a request per chunk plus what is needed to finish their responses"""
+    text: str
+    target_lang: str
+    cache_key: str
+    chunks: list = field(default_factory=list)
+    headers: dict = None
+    cached_result: str = None
+    # (line, approved translation or None) when only some lines had to go to Sarvam
+    memory_lines: list = None
+    # For the ChatGPT prompt, so the review stage does not rebuild them
+    context_hints: ContextHints = None
+    # The pack the request started with, used by every later step even if a reload swaps it
+    rule_pack: RulePack = None
+
+def prepare_sarvam_call(text, source_lang, target_lang, gender, mode, context_type="", message_context=None, bypass_cache=False):
+    """Pre-process the text and build its Sarvam requests, or pick up a cached result"""
+    
+    # Context is computed once per request and shared by every layer
+    message_context = message_context or build_message_context(text, context_type)
+    
+    # So is the rule pack: one lookup, and every step sees the same pack
+    rule_pack = get_active_rule_pack()
+    
+    # Get language-specific settings
+    lang_pattern = get_language_specific_settings(target_lang)
+    
+    # The memory is keyed on the mode the user picked, as the ChatGPT stage sees it
+    requested_mode = mode
+    
+    # Override mode based on language pattern
+    if mode == "modern-colloquial":
+        mode = lang_pattern["mode"]
+    
+    # Audience and formality never reach Sarvam, so they are not part of this stage's key
+    cache_key = make_cache_key(SARVAM_STAGE, text, {
+        "source_lang": source_lang, "target_lang": target_lang, "gender": gender,
+        "mode": mode, "context_type": message_context.context_type
+    }, rule_pack.pack_hash)
+    call = SarvamCall(text, target_lang, cache_key, rule_pack=rule_pack)
+    call.cached_result = translation_cache.get(SARVAM_STAGE, cache_key, bypass=bypass_cache)
+    if call.cached_result is not None:
+        call.context_hints = build_context_hints(text, target_lang, message_context)
+        return call
+    
+    # Lines with an approved translation are filled in locally; only the rest go to Sarvam
+    source_text = text
+    if not bypass_cache:
+        memory_lines = translation_memory.lookup_lines(text, target_lang, requested_mode)
+        misses = [segment for segment, translation in memory_lines if translation is None]
+        if memory_lines and not misses:
+            translation_memory.record_saved_call(SARVAM_STAGE)
+            call.cached_result = "\n".join(translation for _, translation in memory_lines)
+            call.context_hints = build_context_hints(text, target_lang, message_context)
+            return call
+        if len(misses) < len(memory_lines):
+            call.memory_lines = memory_lines
+            source_text = "\n".join(misses)
+    
+    # ENHANCED INPUT PREPROCESSING WITH ALL 3 TRAINING LAYERS
+    # (context hints go to the ChatGPT prompt, not to Sarvam)
+    enhanced_text, context_hints = enhanced_preprocess_input_for_completeness(source_text, target_lang, message_context, rule_pack)
+    # The review covers the whole message, approved lines included
+    call.context_hints = context_hints if source_text == text else build_context_hints(text, target_lang, message_context)
+    
+    # Apply basic catchy phrase enhancements
+    enhanced_text = enhance_catchy_phrases(enhanced_text, target_lang)
+    
+    # Prepare for API: short messages are one chunk, long ones one request per chunk
+    for chunk in segment_for_translation(enhanced_text):
+        tagged_input, restore_map = tag_preserved_words(prepare_multiline_input(chunk.text), rule_pack)
+        payload = {
+            "input": tagged_input,
+            "source_language_code": source_lang,
+            "target_language_code": target_lang,
+            "mode": mode,
+            "speaker_gender": gender,
+            "enable_preprocessing": True,
+            "numerals_format": "international"
+        }
+
+        # Set script based on language pattern
+        if lang_pattern["script"] == "roman":
+            payload["output_script"] = "roman"
+        elif lang_pattern["script"] == "fully-native":
+            payload["output_script"] = "fully-native"
+        call.chunks.append(SarvamChunk(chunk, payload, restore_map))
+
+    call.headers = {
+        "Content-Type": "application/json",
+        "API-Subscription-key": SARVAM_API_KEY
+    }
+    return call
+
+def finish_sarvam_call(call, responses):
+    """Post-process the Sarvam responses (requests or httpx, one per chunk) into the final Sarvam translation"""
+    for response in responses:
+        if response.status_code != 200:
+            return f"❌ Error: {response.status_code} - {response.text}"
+    
+    translations = []
+    for sarvam_chunk, response in zip(call.chunks, responses):
+        result_raw = response.json().get("translated_text", "")
+        result = untag_preserved_words(result_raw, sarvam_chunk.restore_map)
+        translations.append(restore_multiline_output(result, sarvam_chunk.chunk.text))
+    result = join_translated_chunks([sarvam_chunk.chunk for sarvam_chunk in call.chunks], translations)
+    if call.memory_lines:
+        result = fill_memory_lines(call.memory_lines, result)
+    
+    # Instruction leaks, brand/format fixes and training post-processing in one cleanup pass
+    result = clean_translation_output(result, call.target_lang, call.rule_pack)
+    
+    translation_cache.put(SARVAM_STAGE, call.cache_key, result)
+    return result
+
+def fill_memory_lines(memory_lines, sarvam_translation):
+    """Put Sarvam's lines back between the approved ones, in the original line order"""
+    sarvam_lines = [line for line in sarvam_translation.split("\n") if line.strip()]
+    missing = sum(1 for _, translation in memory_lines if translation is None)
+    # If Sarvam merged or split lines, its whole output takes the place of the first missing line
+    if len(sarvam_lines) != missing:
+        sarvam_lines = [sarvam_translation] + [""] * (missing - 1)
+    sarvam_lines = iter(sarvam_lines)
+    lines = [translation if translation is not None else next(sarvam_lines) for _, translation in memory_lines]
+    return "\n".join(line for line in lines if line)
+
+async def post_sarvam_chunks_async(call):
+    """Send every chunk of a call concurrently on the async Sarvam client, responses in chunk order"""
+    post = async_sarvam_client.post_hedged if SARVAM_HEDGING else async_sarvam_client.post
+    return await asyncio.gather(*[
+        post("/translate", json=sarvam_chunk.payload, headers=call.headers)
+        for sarvam_chunk in call.chunks
+    ])
+
+def translate_text(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3, message_context=None, bypass_cache=False):
+    """Enhanced translate function using the combined training patterns"""
+    return translate_text_with_hints(text, source_lang, target_lang, gender, mode, context_type, audience, formality_level, message_context, bypass_cache)[0]
+
+def translate_text_with_hints(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3, message_context=None, bypass_cache=False):
+    """translate_text, plus the message's ContextHints for its ChatGPT review: (translation, context_hints)"""
+    call = prepare_sarvam_call(text, source_lang, target_lang, gender, mode, context_type, message_context, bypass_cache)
+    return _translate_prepared(call), call.context_hints
+
+def _translate_prepared(call):
+    """Send a prepared SarvamCall and finish its responses into the Sarvam translation"""
+    if call.cached_result is not None:
+        return call.cached_result
+
+    try:
+        if len(call.chunks) == 1 and not SARVAM_HEDGING:
+            responses = [sarvam_client.post("/translate", json=call.chunks[0].payload, headers=call.headers)]
+        else:
+            # Long or hedged message: the requests overlap on the background loop instead of queueing here
+            responses = run_sync(post_sarvam_chunks_async(call))
+    except (requests.exceptions.Timeout, httpx.TimeoutException):
+        return SARVAM_TIMEOUT_ERROR
+    except (requests.exceptions.ConnectionError, httpx.TransportError):
+        return SARVAM_CONNECTION_ERROR
+    except CircuitOpenError:
+        return SARVAM_UNAVAILABLE_ERROR
+    return finish_sarvam_call(call, responses)
+
+async def translate_text_async(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3, message_context=None, bypass_cache=False):
+    """Async translate_text on the shared async Sarvam client"""
+    return (await translate_text_with_hints_async(text, source_lang, target_lang, gender, mode, context_type, audience, formality_level, message_context, bypass_cache))[0]
+
+async def translate_text_with_hints_async(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3, message_context=None, bypass_cache=False):
+    """Async translate_text_with_hints on the shared async Sarvam client"""
+    call = await run_blocking(prepare_sarvam_call, text, source_lang, target_lang, gender, mode, context_type, message_context, bypass_cache)
+    return await _translate_prepared_async(call), call.context_hints
+
+async def _translate_prepared_async(call):
+    """Async _translate_prepared on the shared async Sarvam client"""
+    if call.cached_result is not None:
+        return call.cached_result
+
+    try:
+        responses = await post_sarvam_chunks_async(call)
+    except httpx.TimeoutException:
+        return SARVAM_TIMEOUT_ERROR
+    except httpx.TransportError:
+        return SARVAM_CONNECTION_ERROR
+    except CircuitOpenError:
+        return SARVAM_UNAVAILABLE_ERROR
+    return await run_blocking(finish_sarvam_call, call, responses)
+
+# -------------------- CHATGPT STAGE -------------------- #
+
+@dataclass
+class ChatGPTCall:
+    """One prepared ChatGPT review request, or the result when no request is needed"""
+    target_lang: str
+    cleaned_sarvam: str = None
+    cache_key: str = None
+    payload: dict = None
+    headers: dict = None
+    early_result: tuple = None
+    rule_pack: RulePack = None
+
+def prepare_chatgpt_call(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None):
+    """Render the review prompt and build the ChatGPT request, or pick up a cached result"""
+    call = ChatGPTCall(target_lang, rule_pack=get_active_rule_pack())
+    
+    if not OPENAI_API_KEY or not sarvam_translation or sarvam_translation.startswith("❌"):
+        call.early_result = (sarvam_translation, "No ChatGPT API key or invalid Sarvam translation")
+        return call
+    
+    # A translation assembled entirely from approved lines has already been reviewed
+    if not bypass_cache:
+        memory_lines = translation_memory.lookup_lines(original_text, target_lang, mode, count=False)
+        from_memory = memory_lines and all(translation is not None for _, translation in memory_lines)
+        if from_memory and "\n".join(translation for _, translation in memory_lines) == sarvam_translation:
+            translation_memory.record_saved_call(CHATGPT_STAGE)
+            call.early_result = (sarvam_translation, None)
+            return call
+        
+        # Close approved lines guide the review; they are never served as the translation
+        suggestions = translation_memory.suggest_lines(original_text, target_lang, mode)
+        if suggestions:
+            context_hints = replace(
+                context_hints or build_context_hints(original_text, target_lang, message_context),
+                memory_hints=[
+                    f'Approved translation of the similar line "{source}": "{translation}" '
+                    f'(match its wording, keep this line\'s own content: "{segment}")'
+                    for segment, source, translation in suggestions
+                ]
+            )
+    
+    # Pre-clean obvious issues (memoized, so a repeated Sarvam output is cleaned once)
+    call.cleaned_sarvam = clean_translation_output(sarvam_translation, target_lang, call.rule_pack)
+    
+    # Get enhanced prompt with the training examples relevant to this message
+    prompt = get_enhanced_chatgpt_prompt_with_training(
+        original_text, call.cleaned_sarvam, target_lang, mode, context_type, audience, formality_level,
+        context_hints, message_context, rule_pack=call.rule_pack
+    )
+    
+    call.payload = {
+        "model": CHATGPT_MODEL,
+        "messages": [
+            {"role": "system", "content": CHATGPT_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "max_tokens": 1000,
+        "temperature": 0.1
+    }
+    
+    # The rendered prompt already carries the text, Sarvam output and every setting;
+    # the rule pack hash covers the cleanup applied to the stored result
+    call.cache_key = make_cache_key(CHATGPT_STAGE, prompt, {
+        "model": CHATGPT_MODEL, "system": CHATGPT_SYSTEM_PROMPT,
+        "max_tokens": call.payload["max_tokens"], "temperature": call.payload["temperature"]
+    }, call.rule_pack.pack_hash)
+    cached_response = translation_cache.get(CHATGPT_STAGE, call.cache_key, bypass=bypass_cache)
+    if cached_response is not None:
+        # A hit skips both the API call and the cleanup chain
+        call.early_result = (cached_response["result"], None)
+        return call
+    
+    call.headers = {
+        "Authorization": f"Bearer {OPENAI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    return call
+
+def finish_chatgpt_content(call, raw_response):
+    """Clean ChatGPT's reply text (whole or streamed) into the final translation and cache it"""
+    improved_translation = raw_response.strip()
+    
+    # Aggressive cleaning of ChatGPT meta-responses
+    improved_translation = strip_chatgpt_meta_commentary(improved_translation)
+    
+    if any(phrase.lower() in improved_translation.lower() for phrase in EXPLANATORY_PHRASES):
+        improved_translation = call.cleaned_sarvam
+    
+    # Final cleanup using enhanced functions
+    improved_translation = clean_translation_output(improved_translation, call.target_lang, call.rule_pack)
+    
+    translation_cache.put(CHATGPT_STAGE, call.cache_key, {"raw": raw_response, "result": improved_translation})
+    return improved_translation
+
+def finish_chatgpt_call(call, response):
+    """Clean a ChatGPT response (requests or httpx) into (translation, error)"""
+    if response.status_code == 200:
+        result = response.json()
+        if "choices" in result and len(result["choices"]) > 0:
+            return finish_chatgpt_content(call, result["choices"][0]["message"]["content"]), None
+        else:
+            return call.cleaned_sarvam, "No response from ChatGPT"
+    else:
+        return call.cleaned_sarvam, f"ChatGPT API Error: {response.status_code}"
+
+def chatgpt_quality_check_and_improve(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None):
+    """Enhanced ChatGPT quality checker using combined training patterns"""
+    call = prepare_chatgpt_call(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints, bypass_cache, message_context)
+    if call.early_result is not None:
+        return call.early_result
+
+    try:
+        response = openai_client.post("/v1/chat/completions", headers=call.headers, json=call.payload)
+        return finish_chatgpt_call(call, response)
+    except requests.exceptions.Timeout:
+        return call.cleaned_sarvam, CHATGPT_TIMEOUT_ERROR
+    except requests.exceptions.ConnectionError:
+        return call.cleaned_sarvam, CHATGPT_CONNECTION_ERROR
+    except CircuitOpenError:
+        return call.cleaned_sarvam, CHATGPT_UNAVAILABLE_ERROR
+    except Exception as e:
+        return call.cleaned_sarvam, f"ChatGPT error: {str(e)}"
+
+async def chatgpt_quality_check_and_improve_async(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None):
+    """Async chatgpt_quality_check_and_improve on the shared async OpenAI client"""
+    call = await run_blocking(prepare_chatgpt_call, original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints, bypass_cache, message_context)
+    if call.early_result is not None:
+        return call.early_result
+
+    try:
+        response = await async_openai_client.post("/v1/chat/completions", headers=call.headers, json=call.payload)
+        return await run_blocking(finish_chatgpt_call, call, response)
+    except httpx.TimeoutException:
+        return call.cleaned_sarvam, CHATGPT_TIMEOUT_ERROR
+    except httpx.TransportError:
+        return call.cleaned_sarvam, CHATGPT_CONNECTION_ERROR
+    except CircuitOpenError:
+        return call.cleaned_sarvam, CHATGPT_UNAVAILABLE_ERROR
+    except Exception as e:
+        return call.cleaned_sarvam, f"ChatGPT error: {str(e)}"
+
+# -------------------- STREAMING -------------------- #
+
+_STREAM_TIMINGS = deque(maxlen=STREAM_TIMINGS_KEPT)
+_STREAM_TIMINGS_LOCK = threading.Lock()
+
+def parse_chat_completion_event(line):
+    """(done, content delta or None) for one line of a streamed chat completion's server-sent events"""
+    if not line or not line.startswith("data:"):
+        return False, None
+    data = line[len("data:"):].strip()
+    if data == "[DONE]":
+        return True, None
+    choices = json.loads(data).get("choices") or [{}]
+    return False, choices[0].get("delta", {}).get("content")
+
+def iter_chat_completion_deltas(response):
+    """Content deltas of a streamed chat completion (server-sent "data:" events up to [DONE])
+    
+    A stream that ends without [DONE] was cut off, and raises ConnectionError.
+    """
+    # SSE is always UTF-8; without a charset in the content type requests would decode ISO-8859-1
+    response.encoding = "utf-8"
+    for line in response.iter_lines(decode_unicode=True):
+        done, delta = parse_chat_completion_event(line)
+        if done:
+            return
+        if delta:
+            yield delta
+    raise requests.exceptions.ConnectionError("Stream ended before [DONE]")
+
+async def aiter_chat_completion_deltas(response):
+    """iter_chat_completion_deltas for an httpx response; a cut-off stream raises RemoteProtocolError"""
+    response.encoding = "utf-8"
+    async for line in response.aiter_lines():
+        done, delta = parse_chat_completion_event(line)
+        if done:
+            return
+        if delta:
+            yield delta
+    raise httpx.RemoteProtocolError("Stream ended before [DONE]")
+
+def record_stream_timing(first_output_seconds, total_seconds):
+    """Log and keep one streamed review's time to first visible output and to completion"""
+    logger.info("ChatGPT stream: first output after %.3fs, complete after %.3fs", first_output_seconds, total_seconds)
+    with _STREAM_TIMINGS_LOCK:
+        _STREAM_TIMINGS.append((first_output_seconds, total_seconds))
+
+def get_streaming_stats():
+    """Average time to first visible output and to completion over the recent streamed reviews"""
+    with _STREAM_TIMINGS_LOCK:
+        timings = list(_STREAM_TIMINGS)
+    if not timings:
+        return {"streams": 0, "avg_first_output_seconds": 0.0, "avg_total_seconds": 0.0}
+    return {
+        "streams": len(timings),
+        "avg_first_output_seconds": sum(first for first, _ in timings) / len(timings),
+        "avg_total_seconds": sum(total for _, total in timings) / len(timings)
+    }
+
+def chatgpt_quality_check_and_improve_stream(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None, on_delta=None):
+    """chatgpt_quality_check_and_improve over the SSE stream, calling on_delta(text so far) as tokens arrive
+
+    The meta-commentary stripping and cleanup run once on the complete reply, so the
+    result (and what gets cached) is the same as the non-streaming call's.
+    """
+    call = prepare_chatgpt_call(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints, bypass_cache, message_context)
+    if call.early_result is not None:
+        return call.early_result
+
+    started = time.perf_counter()
+    first_output_seconds = None
+    parts = []
+    try:
+        with openai_client.post_stream("/v1/chat/completions", headers=call.headers, json=dict(call.payload, stream=True)) as response:
+            if response.status_code != 200:
+                return call.cleaned_sarvam, f"ChatGPT API Error: {response.status_code}"
+            for delta in iter_chat_completion_deltas(response):
+                parts.append(delta)
+                if first_output_seconds is None:
+                    first_output_seconds = time.perf_counter() - started
+                if on_delta is not None:
+                    on_delta("".join(parts))
+    except requests.exceptions.Timeout:
+        return call.cleaned_sarvam, CHATGPT_TIMEOUT_ERROR
+    except requests.exceptions.ConnectionError:
+        return call.cleaned_sarvam, CHATGPT_CONNECTION_ERROR
+    except CircuitOpenError:
+        return call.cleaned_sarvam, CHATGPT_UNAVAILABLE_ERROR
+    except Exception as e:
+        return call.cleaned_sarvam, f"ChatGPT error: {str(e)}"
+
+    if not parts:
+        return call.cleaned_sarvam, "No response from ChatGPT"
+    record_stream_timing(first_output_seconds, time.perf_counter() - started)
+    return finish_chatgpt_content(call, "".join(parts)), None
+
+async def chatgpt_quality_check_and_improve_stream_async(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None, on_delta=None):
+    """Async chatgpt_quality_check_and_improve_stream on the shared async OpenAI client"""
+    call = await run_blocking(prepare_chatgpt_call, original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints, bypass_cache, message_context)
+    if call.early_result is not None:
+        return call.early_result
+
+    started = time.perf_counter()
+    first_output_seconds = None
+    parts = []
+    try:
+        async with async_openai_client.post_stream("/v1/chat/completions", headers=call.headers, json=dict(call.payload, stream=True)) as response:
+            if response.status_code != 200:
+                return call.cleaned_sarvam, f"ChatGPT API Error: {response.status_code}"
+            async for delta in aiter_chat_completion_deltas(response):
+                parts.append(delta)
+                if first_output_seconds is None:
+                    first_output_seconds = time.perf_counter() - started
+                if on_delta is not None:
+                    on_delta("".join(parts))
+    except httpx.TimeoutException:
+        return call.cleaned_sarvam, CHATGPT_TIMEOUT_ERROR
+    except httpx.TransportError:
+        return call.cleaned_sarvam, CHATGPT_CONNECTION_ERROR
+    except CircuitOpenError:
+        return call.cleaned_sarvam, CHATGPT_UNAVAILABLE_ERROR
+    except Exception as e:
+        return call.cleaned_sarvam, f"ChatGPT error: {str(e)}"
+
+    if not parts:
+        return call.cleaned_sarvam, "No response from ChatGPT"
+    record_stream_timing(first_output_seconds, time.perf_counter() - started)
+    return await run_blocking(finish_chatgpt_content, call, "".join(parts)), None
+
+# -------------------- QA GATE -------------------- #
+
+_QA_GATE_COUNTS = {}
+_QA_GATE_LOCK = threading.Lock()
+
+def should_run_chatgpt_qa(confidence, quality_flags, context_type="", message_context=None):
+    """Gate the ChatGPT review on the Sarvam output's analysis, counting every decision per Message Type"""
+    message_type = context_type
+    if not message_type and message_context is not None:
+        message_type = MESSAGE_TYPES_BY_CONTEXT.get(message_context.context_type, "")
+    threshold = QA_CONTEXT_THRESHOLDS.get(message_type, QA_SKIP_CONFIDENCE)
+    if threshold is None:
+        outcome = "executed_always"
+    elif quality_flags:
+        outcome = "executed_flags"
+    elif confidence < threshold:
+        outcome = "executed_low_confidence"
+    else:
+        outcome = "skipped"
+    with _QA_GATE_LOCK:
+        _QA_GATE_COUNTS.setdefault(context_type or "auto-detected", Counter())[outcome] += 1
+    return outcome != "skipped"
+
+def get_qa_gate_stats():
+    """Skipped and executed ChatGPT reviews since the process started, overall and per Message Type"""
+    with _QA_GATE_LOCK:
+        by_context = {context_type: dict(counts) for context_type, counts in _QA_GATE_COUNTS.items()}
+    by_reason = Counter()
+    for counts in by_context.values():
+        by_reason.update(counts)
+    return {
+        "skipped": by_reason["skipped"],
+        "executed": sum(count for outcome, count in by_reason.items() if outcome != "skipped"),
+        "by_reason": dict(by_reason),
+        "by_context": by_context
+    }
+
+# -------------------- SYNC BRIDGE -------------------- #
+
+_EVENT_LOOP = None
+_EVENT_LOOP_LOCK = threading.Lock()
+_PIPELINE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix="translation-pipeline-worker")
+
+def get_event_loop():
+    """The background event loop every async pipeline call runs on (started once per process)"""
+    global _EVENT_LOOP
+    with _EVENT_LOOP_LOCK:
+        if _EVENT_LOOP is None:
+            _EVENT_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_EVENT_LOOP.run_forever, name="translation-pipeline-loop", daemon=True).start()
+    return _EVENT_LOOP
+
+async def run_blocking(func, *args):
+    """Run a blocking pipeline step on the worker threads instead of the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_PIPELINE_EXECUTOR, func, *args)
+
+def run_sync(coroutine):
+    """Run a pipeline coroutine from sync code (e.g. a Streamlit script thread) and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
+
+def run_all_sync(coroutines):
+    """Run several pipeline coroutines concurrently and return their results in order"""
+    async def gather():
+        return await asyncio.gather(*coroutines)
+    return run_sync(gather())
+
+# -------------------- BACKGROUND REVIEW -------------------- #
+
+class BackgroundReview:
+    """A ChatGPT review running on the pipeline's event loop while the page already shows the Sarvam result
+
+    No thread is held per review: streamed or not, the review is a task on the shared loop
+    that only borrows a pipeline worker for prompt building and cleanup. cancel() (also
+    called when the review is garbage-collected with its session) stops it early.
+    """
+
+    def __init__(self):
+        self.future = None
+        self._text_so_far = [""]
+
+    @property
+    def text_so_far(self):
+        """The streamed reply so far (empty for a non-streamed review)"""
+        return self._text_so_far[0]
+
+    def wait(self, timeout=None):
+        """Wait up to timeout seconds; True once the review has finished"""
+        done, _ = concurrent.futures.wait([self.future], timeout=timeout)
+        return bool(done)
+
+    def result(self):
+        """(translation, error), as returned by chatgpt_quality_check_and_improve"""
+        return self.future.result()
+
+    def cancel(self):
+        """Stop the review (a no-op once it has finished)"""
+        self.future.cancel()
+
+def stream_progress_callback(text_so_far):
+    """on_delta for a background stream: keeps the latest text where the page can read it"""
+    def on_delta(text):
+        text_so_far[0] = text
+    return on_delta
+
+def submit_chatgpt_review(original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints=None, bypass_cache=False, message_context=None, stream=False):
+    """Start a ChatGPT review in the background and return its BackgroundReview right away"""
+    review = BackgroundReview()
+    review_args = (original_text, sarvam_translation, target_lang, mode, context_type, audience, formality_level, context_hints, bypass_cache, message_context)
+    if stream:
+        # The callback holds the review's state, not the review, so an abandoned review can still be collected
+        coroutine = chatgpt_quality_check_and_improve_stream_async(*review_args, on_delta=stream_progress_callback(review._text_so_far))
+    else:
+        coroutine = chatgpt_quality_check_and_improve_async(*review_args)
+    review.future = asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+    weakref.finalize(review, review.future.cancel)
+    return review
+
+# -------------------- FULL PIPELINE -------------------- #
+
+@dataclass
+class PipelineResult:
+    """Sarvam translation and ChatGPT review of one message into one language"""
+    target_lang: str
+    sarvam_translation: str
+    final_translation: str
+    gpt_error: str = None
+    gpt_status: str = "Disabled"
+
+async def translate_and_review_async(text, source_lang, target_lang, gender, mode, context_type="", audience="", formality_level=3, enable_chatgpt=True, message_context=None, bypass_cache=False):
+    """Sarvam translation followed straight away by its ChatGPT review"""
+    message_context = message_context or build_message_context(text, context_type)
+    sarvam_result, context_hints = await translate_text_with_hints_async(
+        text, source_lang, target_lang, gender, mode,
+        context_type, audience, formality_level, message_context, bypass_cache
+    )
+    result = PipelineResult(target_lang, sarvam_result, sarvam_result)
+    
+    if enable_chatgpt and not sarvam_result.startswith("❌"):
+        quality_flags, confidence = await run_blocking(
+            analyze_enhanced_translation_quality, text, sarvam_result, source_lang, target_lang, message_context
+        )
+        if not should_run_chatgpt_qa(confidence, quality_flags, context_type, message_context):
+            result.gpt_status = QA_SKIPPED_STATUS
+            return result
+        result.final_translation, result.gpt_error = await chatgpt_quality_check_and_improve_async(
+            text, sarvam_result, target_lang, mode,
+            context_type, audience, formality_level, context_hints, bypass_cache, message_context
+        )
+        result.gpt_status = "Enhanced" if not result.gpt_error else f"Error: {result.gpt_error}"
+    return result
+
+def iter_translate_targets(text, source_lang, target_langs, gender, mode, context_type="", audience="", formality_level=3, enable_chatgpt=True, bypass_cache=False):
+    """Translate one message into every target language at once, yielding each PipelineResult as it completes
+    
+    Each language's ChatGPT review starts as soon as its own Sarvam result arrives,
+    so the wall time is close to the slowest language rather than the sum.
+    """
+    # Context detection does not depend on the target language
+    message_context = build_message_context(text, context_type)
+    futures = [
+        asyncio.run_coroutine_threadsafe(translate_and_review_async(
+            text, source_lang, target_lang, gender, mode, context_type, audience, formality_level,
+            enable_chatgpt, message_context, bypass_cache
+        ), get_event_loop())
+        for target_lang in target_langs
+    ]
+    for future in concurrent.futures.as_completed(futures):
+        yield future.result()
+
+def translate_all_targets(text, source_lang, target_langs, gender, mode, context_type="", audience="", formality_level=3, enable_chatgpt=True, bypass_cache=False):
+    """iter_translate_targets collected into {target_lang: PipelineResult}, in target_langs order"""
+    results = {
+        result.target_lang: result
+        for result in iter_translate_targets(
+            text, source_lang, target_langs, gender, mode, context_type, audience, formality_level,
+            enable_chatgpt, bypass_cache
+        )
+    }
+    return {target_lang: results[target_lang] for target_lang in target_langs}
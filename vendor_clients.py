@@ -0,0 +1,621 @@
+# VENDOR CLIENTS - Shared keep-alive HTTP sessions for the Sarvam and OpenAI APIs
+# Each vendor gets one pooled requests.Session for the whole process, so every
+# Streamlit session and rerun reuses warm connections instead of paying a fresh
+# TCP + TLS handshake per call. Every request carries a (connect, read) timeout.
+# The async pipeline gets the same per-vendor setup on a pooled httpx.AsyncClient.
+# Both share one VendorPolicy per vendor: a token-bucket rate limit, bounded
+# retries with jittered exponential backoff, and retry/wait metrics. Each
+# endpoint has a circuit breaker that fails fast during a vendor outage. Async
+# requests can also be hedged: duplicated once when slower than recent ones.
+
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Base URLs and timeouts are read at import, so pick up .env before the app does
+load_dotenv()
+
+SARVAM_BASE_URL = os.getenv("SARVAM_BASE_URL", "https://api.sarvam.ai")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com")
+
+# Connections kept open per vendor; requests beyond this open a temporary extra connection
+POOL_SIZE = int(os.getenv("VENDOR_POOL_SIZE", "10"))
+CONNECT_TIMEOUT_SECONDS = float(os.getenv("VENDOR_CONNECT_TIMEOUT", "5"))
+SARVAM_READ_TIMEOUT_SECONDS = float(os.getenv("SARVAM_READ_TIMEOUT", "30"))
+OPENAI_READ_TIMEOUT_SECONDS = float(os.getenv("OPENAI_READ_TIMEOUT", "30"))
+
+# Open a connection to each vendor at startup so the first translation skips the handshake
+PREWARM_ON_START = os.getenv("VENDOR_PREWARM", "1") == "1"
+
+# Requests per second and burst size per vendor; a rate of 0 disables the limiter
+SARVAM_RATE_PER_SECOND = float(os.getenv("SARVAM_RATE_PER_SECOND", "10"))
+SARVAM_BURST = int(os.getenv("SARVAM_BURST", "20"))
+OPENAI_RATE_PER_SECOND = float(os.getenv("OPENAI_RATE_PER_SECOND", "10"))
+OPENAI_BURST = int(os.getenv("OPENAI_BURST", "20"))
+
+# Attempts include the first request; delays are capped so a request never waits unboundedly
+MAX_ATTEMPTS = int(os.getenv("VENDOR_MAX_ATTEMPTS", "3"))
+BACKOFF_BASE_SECONDS = float(os.getenv("VENDOR_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX_SECONDS = float(os.getenv("VENDOR_BACKOFF_MAX", "8"))
+# A Retry-After longer than this is not worth waiting for; the response is returned instead
+MAX_RETRY_AFTER_SECONDS = float(os.getenv("VENDOR_MAX_RETRY_AFTER", "20"))
+
+# Throttling and transient server failures are retried; other statuses are final
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+# Consecutive timeouts/connection failures/5xx responses that open an endpoint's circuit breaker,
+# and how long it then fails fast before letting one probe request through
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("VENDOR_BREAKER_FAILURES", "5"))
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("VENDOR_BREAKER_COOLDOWN", "30"))
+
+# Hedged requests send one duplicate once the first is slower than this percentile of recent latencies
+HEDGE_PERCENTILE = float(os.getenv("VENDOR_HEDGE_PERCENTILE", "95"))
+# At most this share of requests may be duplicated, so hedging can add at most that much vendor load
+HEDGE_MAX_RATE = float(os.getenv("VENDOR_HEDGE_MAX_RATE", "0.1"))
+# Latencies kept per vendor, and how many must be seen before the first hedge
+HEDGE_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+
+# -------------------- RATE LIMITING AND RETRIES -------------------- #
+
+class TokenBucket:
+    """Token bucket that hands out reservations, so sync and async callers can share it"""
+
+    def __init__(self, rate_per_second, burst):
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token, returning how long the caller must wait before using it"""
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            # Tokens may go negative: each waiting caller holds its own place in the queue
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_second
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class VendorPolicy:
+    """Rate limit, retry rules and metrics for one vendor, shared by its sync and async clients"""
+
+    def __init__(self, name, rate_per_second, burst, max_attempts=MAX_ATTEMPTS, backoff_base=BACKOFF_BASE_SECONDS,
+                 backoff_max=BACKOFF_MAX_SECONDS, max_retry_after=MAX_RETRY_AFTER_SECONDS, retry_statuses=RETRY_STATUSES):
+        self.name = name
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = retry_statuses
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = Counter()
+        self._gave_up = 0
+        self._retry_wait_seconds = 0.0
+        self._rate_limit_wait_seconds = 0.0
+
+    def before_request(self):
+        """Seconds to wait for the rate limiter before sending the next attempt"""
+        wait = self.rate_limiter.reserve()
+        with self._lock:
+            self._requests += 1
+            self._rate_limit_wait_seconds += wait
+        return wait
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff for the given (0-based) attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_delay_for_status(self, attempt, status_code, retry_after=None):
+        """Seconds to wait before retrying a response, or None if it is final"""
+        if status_code not in self.retry_statuses:
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay is not None and delay > self.max_retry_after:
+            return self._give_up()
+        return self._retry(attempt, str(status_code), delay)
+
+    def retry_delay_for_error(self, attempt, reason):
+        """Seconds to wait before retrying after a connection failure, or None to raise it"""
+        return self._retry(attempt, reason, None)
+
+    def _retry(self, attempt, reason, delay):
+        if attempt + 1 >= self.max_attempts:
+            return self._give_up()
+        delay = self.backoff(attempt) if delay is None else delay
+        with self._lock:
+            self._retries[reason] += 1
+            self._retry_wait_seconds += delay
+        return delay
+
+    def _give_up(self):
+        with self._lock:
+            self._gave_up += 1
+        return None
+
+    def metrics(self):
+        """Request, retry and wait-time counters since the process started"""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "retries": sum(self._retries.values()),
+                "retries_by_reason": dict(self._retries),
+                "gave_up": self._gave_up,
+                "retry_wait_seconds": self._retry_wait_seconds,
+                "rate_limit_wait_seconds": self._rate_limit_wait_seconds,
+            }
+
+class HedgePolicy:
+    """When to hedge a slow request: recent latencies give the delay, a rate cap bounds the extra load"""
+
+    def __init__(self, percentile=HEDGE_PERCENTILE, max_rate=HEDGE_MAX_RATE, window=HEDGE_WINDOW, min_samples=HEDGE_MIN_SAMPLES):
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._capped = 0
+
+    def record_latency(self, seconds):
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def hedge_delay(self):
+        """Seconds to wait for a new request before hedging it, or None while too few latencies are known"""
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(len(latencies) * self.percentile / 100) - 1)]
+
+    def try_hedge(self):
+        """Take one hedge if that keeps hedges within max_rate of all requests"""
+        with self._lock:
+            if self._hedged + 1 > self.max_rate * self._requests:
+                self._capped += 1
+                return False
+            self._hedged += 1
+            return True
+
+    def record_hedge_win(self):
+        with self._lock:
+            self._hedge_wins += 1
+
+    def metrics(self):
+        """Hedged requests, how often the duplicate won, and hedges refused by the rate cap"""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "capped": self._capped,
+                "hedge_rate": self._hedged / self._requests if self._requests else 0.0,
+            }
+
+sarvam_policy = VendorPolicy("sarvam", SARVAM_RATE_PER_SECOND, SARVAM_BURST)
+openai_policy = VendorPolicy("openai", OPENAI_RATE_PER_SECOND, OPENAI_BURST)
+sarvam_hedging = HedgePolicy()
+
+def get_vendor_metrics():
+    """Retry and rate-limit metrics for every vendor, plus hedging for Sarvam"""
+    metrics = {policy.name: policy.metrics() for policy in [sarvam_policy, openai_policy]}
+    metrics["sarvam"]["hedging"] = sarvam_hedging.metrics()
+    return metrics
+
+# -------------------- CIRCUIT BREAKERS -------------------- #
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open"""
+
+class CircuitBreaker:
+    """Closed until N consecutive failures, then open (fail fast) until a half-open probe succeeds"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, cooldown_seconds=BREAKER_COOLDOWN_SECONDS):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+
+    def before_call(self):
+        """Let a call through, or raise CircuitOpenError; after the cooldown only one probe goes at a time"""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit open")
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit half-open, probe in flight")
+                self._probe_in_flight = True
+
+    def record_response(self, status_code):
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("%s circuit closed", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or (self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                logger.warning("%s circuit opened after %d consecutive failures", self.name, self._failures)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._times_opened += 1
+
+    def record_abandoned(self):
+        """A call that ended without a verdict (cancelled, or an unrelated error): free the probe slot"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def status(self):
+        """State, consecutive failures, seconds until the next probe, and counters since the process started"""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == self.OPEN:
+                retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": retry_in,
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+_CIRCUIT_BREAKERS = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+def get_circuit_breaker(vendor, path):
+    """The breaker for one vendor endpoint, shared by that vendor's sync and async clients"""
+    name = f"{vendor} /{path.lstrip('/')}"
+    with _CIRCUIT_BREAKERS_LOCK:
+        if name not in _CIRCUIT_BREAKERS:
+            _CIRCUIT_BREAKERS[name] = CircuitBreaker(name)
+        return _CIRCUIT_BREAKERS[name]
+
+def get_circuit_breaker_states():
+    """Status of every endpoint breaker used so far, keyed by vendor and path (e.g. "openai /v1/chat/completions")"""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breakers = list(_CIRCUIT_BREAKERS.values())
+    return {breaker.name: breaker.status() for breaker in breakers}
+
+# -------------------- CLIENT -------------------- #
+
+class VendorClient:
+    """A pooled keep-alive session for one vendor API, with default timeouts, rate limiting and retries"""
+
+    def __init__(self, name, base_url, read_timeout, connect_timeout=CONNECT_TIMEOUT_SECONDS, pool_size=POOL_SIZE, verify=True, policy=None):
+        self.name = name
+        self.policy = policy or VendorPolicy(name, 0, 1)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.verify = verify
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def post(self, path, **kwargs):
+        """POST to path on this vendor; timeout defaults to the client's (connect, read) pair
+        
+        Waits for the vendor's rate limiter, and retries throttled/transient statuses and
+        connection failures with backoff. Read timeouts are not retried: the wait is already spent.
+        Raises CircuitOpenError without sending anything while the endpoint's breaker is open.
+        """
+        breaker = get_circuit_breaker(self.name, path)
+        breaker.before_call()
+        try:
+            response = self._post_with_retries(path, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+        breaker.record_response(response.status_code)
+        return response
+
+    @contextmanager
+    def post_stream(self, path, **kwargs):
+        """post() for a streamed reply, as a context manager around the open response
+        
+        The breaker's verdict waits for the body: a timeout or connection error while reading
+        it counts as a failure, and only a 200 block that exits normally counts as a success,
+        so read the stream up to its end marker inside the block.
+        """
+        breaker = get_circuit_breaker(self.name, path)
+        breaker.before_call()
+        try:
+            response = self._post_with_retries(path, stream=True, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+        with response:
+            if response.status_code != 200:
+                breaker.record_response(response.status_code)
+                yield response
+                return
+            try:
+                yield response
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.record_abandoned()
+                raise
+            breaker.record_success()
+
+    def _post_with_retries(self, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("verify", self.verify)
+        attempt = 0
+        while True:
+            time.sleep(self.policy.before_request())
+            try:
+                response = self.session.post(self.url(path), **kwargs)
+            except requests.exceptions.ConnectionError:
+                # Includes connect timeouts (ConnectTimeout is both a ConnectionError and a Timeout)
+                delay = self.policy.retry_delay_for_error(attempt, "connection_error")
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.retry_delay_for_status(attempt, response.status_code, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def prewarm(self, connections=1):
+        """Open keep-alive connections ahead of the first real request; failures are only logged
+        
+        The HEAD requests run at the same time from their own threads: one after another,
+        they would all reuse the first connection. Capped at the pool size, which is all the pool keeps.
+        """
+        connections = max(1, min(connections, self.pool_size))
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix=f"{self.name}-prewarm") as executor:
+            futures = [
+                executor.submit(lambda: self.session.head(self.base_url, timeout=self.timeout, verify=self.verify).close())
+                for _ in range(connections)
+            ]
+        for future in futures:
+            try:
+                future.result()
+            except requests.exceptions.RequestException as e:
+                logger.info("Could not pre-warm %s connection: %s", self.name, e)
+                return
+
+    def close(self):
+        self.session.close()
+
+class AsyncVendorClient:
+    """The async counterpart of VendorClient: a pooled httpx.AsyncClient per event loop"""
+
+    def __init__(self, name, base_url, read_timeout, connect_timeout=CONNECT_TIMEOUT_SECONDS, pool_size=POOL_SIZE, verify=True, policy=None, hedging=None):
+        self.name = name
+        self.policy = policy or VendorPolicy(name, 0, 1)
+        self.hedging = hedging or HedgePolicy()
+        self.base_url = base_url.rstrip("/")
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.verify = verify
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def _get_client(self):
+        # An httpx.AsyncClient belongs to the loop that created it, so each loop keeps its own
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            # A closed loop's client can no longer be used or closed; drop it with its dead connections
+            for closed_loop in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed_loop]
+            client = self._clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, verify=self.verify)
+                self._clients[loop] = client
+        return client
+
+    def url(self, path):
+        # Resolved per request, like VendorClient's, so a changed base_url applies to every loop's client
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def post(self, path, **kwargs):
+        """POST to path on this vendor with the same rate limiting, retries and circuit breaker as VendorClient.post"""
+        breaker = get_circuit_breaker(self.name, path)
+        breaker.before_call()
+        try:
+            response = await self._post_with_retries(path, **kwargs)
+        except (httpx.TimeoutException, httpx.TransportError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+        breaker.record_response(response.status_code)
+        return response
+
+    @asynccontextmanager
+    async def post_stream(self, path, **kwargs):
+        """The async VendorClient.post_stream: the breaker's verdict waits for the end of the streamed body"""
+        breaker = get_circuit_breaker(self.name, path)
+        breaker.before_call()
+        try:
+            response = await self._post_with_retries(path, stream=True, **kwargs)
+        except (httpx.TimeoutException, httpx.TransportError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+        try:
+            if response.status_code != 200:
+                breaker.record_response(response.status_code)
+                yield response
+                return
+            try:
+                yield response
+            except (httpx.TimeoutException, httpx.TransportError):
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.record_abandoned()
+                raise
+            breaker.record_success()
+        finally:
+            await response.aclose()
+
+    async def _post_with_retries(self, path, stream=False, **kwargs):
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.policy.before_request())
+            try:
+                client = self._get_client()
+                # A streamed response is returned with its body unread
+                response = await client.send(client.build_request("POST", self.url(path), **kwargs), stream=stream)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                delay = self.policy.retry_delay_for_error(attempt, "connection_error")
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.retry_delay_for_status(attempt, response.status_code, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def post_hedged(self, path, **kwargs):
+        """post(), plus one duplicate request if the first outlasts the hedge delay; the first success wins
+
+        Needs the client's HedgePolicy; the slower request is cancelled.
+        """
+        delay = self.hedging.hedge_delay()
+        primary = asyncio.ensure_future(self._timed_post(path, **kwargs))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.hedging.try_hedge():
+                return await primary
+            tasks.add(asyncio.ensure_future(self._timed_post(path, **kwargs)))
+            
+            # A failed request only loses if the other one can still answer
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not tasks:
+                    break
+            if not succeeded:
+                # Both failed: raise the last error, and neither counts as a win
+                return done.pop().result()
+            if succeeded[0] is not primary:
+                self.hedging.record_hedge_win()
+            return succeeded[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_post(self, path, **kwargs):
+        started = time.monotonic()
+        try:
+            return await self.post(path, **kwargs)
+        finally:
+            # A cancelled loser took at least this long: leaving it out would hide the slow tail the delay is taken from
+            self.hedging.record_latency(time.monotonic() - started)
+
+    async def aclose(self):
+        """Close the running loop's client"""
+        with self._clients_lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+sarvam_client = VendorClient("sarvam", SARVAM_BASE_URL, SARVAM_READ_TIMEOUT_SECONDS, policy=sarvam_policy)
+openai_client = VendorClient("openai", OPENAI_BASE_URL, OPENAI_READ_TIMEOUT_SECONDS, policy=openai_policy)
+async_sarvam_client = AsyncVendorClient("sarvam", SARVAM_BASE_URL, SARVAM_READ_TIMEOUT_SECONDS, policy=sarvam_policy, hedging=sarvam_hedging)
+async_openai_client = AsyncVendorClient("openai", OPENAI_BASE_URL, OPENAI_READ_TIMEOUT_SECONDS, policy=openai_policy)
+
+# -------------------- PRE-WARMING -------------------- #
+
+_PREWARM_THREAD = None
+_PREWARM_LOCK = threading.Lock()
+
+def prewarm_vendor_clients(clients=None):
+    """Pre-warm the vendor connections in the background, once per process (idempotent)"""
+    global _PREWARM_THREAD
+    clients = clients or [sarvam_client, openai_client]
+    with _PREWARM_LOCK:
+        if _PREWARM_THREAD is None:
+            _PREWARM_THREAD = threading.Thread(
+                target=lambda: [client.prewarm() for client in clients],
+                name="vendor-prewarm", daemon=True
+            )
+            _PREWARM_THREAD.start()
+    return _PREWARM_THREAD